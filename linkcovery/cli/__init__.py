@@ -14,7 +14,9 @@ import webbrowser
 
 from linkcovery.cli import config, data, links
 from linkcovery.core.config import get_config
+from linkcovery.core.http_client import run_async
 from linkcovery.core.utils import console, handle_errors
+from linkcovery.services.enrichment_service import EnrichmentWorker
 from linkcovery.services.link_service import get_link_service
 
 # Main app
@@ -67,10 +69,41 @@ def webui(
 
 @cli_app.command(rich_help_panel="Other")
 @handle_errors
-def stats() -> None:
+def worker(
+    concurrency: int = typer.Option(None, "--concurrency", "-c", help="Jobs processed in parallel"),
+    per_host: int = typer.Option(None, "--per-host", help="Jobs in flight per host"),
+    once: bool = typer.Option(False, "--once", help="Exit once no job is due instead of waiting for more"),
+) -> None:
+    """Run the background worker that fetches descriptions and previews.
+
+    Examples:
+        linkcovery worker
+        linkcovery worker --once
+        linkcovery worker --concurrency 32 --per-host 2
+
+    """
+    link_service = get_link_service()
+    counts = link_service.get_job_counts()
+    console.print(f"🛠️ Enrichment worker started ({counts.get('pending', 0)} jobs pending)", style="blue")
+
+    enrichment_worker = EnrichmentWorker(db=link_service.db, concurrency=concurrency, per_host_limit=per_host)
+    try:
+        run_async(enrichment_worker.run(until_idle=once))
+    finally:
+        console.print(
+            f"✅ Processed {enrichment_worker.processed} jobs ({enrichment_worker.failed} failed)",
+            style="green",
+        )
+
+
+@cli_app.command(rich_help_panel="Other")
+@handle_errors
+def stats(
+    top: int = typer.Option(5, "--top", "-n", help="Number of top domains and tags to show"),
+) -> None:
     """Show bookmark statistics."""
     link_service = get_link_service()
-    stats_data = link_service.get_statistics()
+    stats_data = link_service.get_statistics(top=top)
 
     console.print("📊 [bold blue]LinkCovery Statistics[/bold blue]")
     console.print(f"   Total links: [bold]{stats_data['total_links']}[/bold]")
@@ -79,9 +112,27 @@ def stats() -> None:
 
     if stats_data["top_domains"]:
         console.print("\n   Top domains:")
-        for domain, count in stats_data["top_domains"][:5]:
+        for domain, count in stats_data["top_domains"]:
             console.print(f"     [cyan]{domain}[/cyan]: {count}")
 
+    if stats_data["top_tags"]:
+        console.print("\n   Top tags:")
+        for tag, count in stats_data["top_tags"]:
+            console.print(f"     [magenta]{tag}[/magenta]: {count}")
+
+
+@cli_app.command(rich_help_panel="Other")
+@handle_errors
+def rebuild() -> None:
+    """Recompute the statistics counters and the search index from the stored links.
+
+    Both are kept up to date on every change, so this is only needed if the database
+    was edited by another tool.
+    """
+    console.print("🔧 Rebuilding statistics and search index...", style="blue")
+    get_link_service().rebuild()
+    console.print("✅ Rebuild complete", style="green")
+
 
 @cli_app.command(rich_help_panel="Other")
 @handle_errors
@@ -15,12 +15,20 @@ app = typer.Typer(help="Import and export your bookmark data", rich_help_panel="
 def export(
     output: str = typer.Argument("links.json", help="Output file path"),
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing file"),
+    gzip: bool = typer.Option(False, "--gzip", "-z", help="Compress the output (default for .gz paths)"),
 ) -> None:
-    """Export all your links to a JSON file.
+    """Export all your links to a JSON, JSON Lines (.ndjson/.jsonl), CSV or bookmark HTML file.
+
+    The format follows the file extension. HTML exports can be imported by browsers, with one
+    bookmark folder per tag.
 
     Examples:
         linkcovery export my-bookmarks.json
         linkcovery export backup.json --force
+        linkcovery export backup.json.gz
+        linkcovery export backup.ndjson
+        linkcovery export links.csv
+        linkcovery export bookmarks.html
 
     """
     output_path = Path(output)
@@ -31,39 +39,85 @@ def export(
         return
 
     data_service = get_data_service()
-    data_service.export_to_json(output_path)
+    name = output_path.name.removesuffix(".gz")
+    if name.endswith((".ndjson", ".jsonl")):
+        data_service.export_to_ndjson(output_path, compress=gzip or None)
+    elif name.endswith(".csv"):
+        data_service.export_to_csv(output_path, compress=gzip or None)
+    elif name.endswith((".html", ".htm")):
+        data_service.export_to_html(output_path, compress=gzip or None)
+    else:
+        data_service.export_to_json(output_path, compress=gzip or None)
 
 
 @app.command(name="import")
 @handle_errors
 def import_data(
-    file_path: Path = typer.Argument(..., help="File to import (JSON, HTML or TXT)"),
+    file_path: Path = typer.Argument(
+        ..., help="File to import (JSON, JSON Lines, HTML, TXT or a browser profile file)"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Continue an interrupted import of this file from its last checkpoint"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Only report which links are new, already stored or would collide"
+    ),
+    diff: Path | None = typer.Option(None, "--diff", help="With --dry-run, write a per-row TSV diff to this file"),
 ) -> None:
-    """Import links from a JSON, HTML, or TXT file.
+    """Import links from a JSON, JSON Lines (.ndjson/.jsonl), HTML, or TXT file.
+
+    Bookmarks can also be read straight from a browser profile: Chrome's 'Bookmarks'
+    file or Firefox's 'places.sqlite'.
+
+    Progress is checkpointed after every batch, so an import that is interrupted can be
+    continued with --resume without redoing the rows already committed.
+
+    --dry-run compares the file against the stored links without writing anything,
+    counting new links, links already stored, links that would collide with a stored
+    one after URL normalization, duplicates within the file and invalid rows.
 
     Examples:
         linkcovery import bookmarks.json
+        linkcovery import backup.ndjson
+        linkcovery import ~/.config/google-chrome/Default/Bookmarks
+        linkcovery import ~/.mozilla/firefox/xxxx.default/places.sqlite
         linkcovery import chrome-bookmarks.html
         linkcovery import links.txt
+        linkcovery import huge-export.ndjson --resume
+        linkcovery import huge-export.ndjson --dry-run --diff preview.tsv
 
     """
     if not file_path.exists():
         console.print(f"❌ File not found: {file_path}", style="red")
         raise typer.Exit(1)
 
-    # Confirm import
-    if not confirm_action(f"Import links from {file_path}?"):
+    if diff and not dry_run:
+        console.print("❌ --diff can only be used with --dry-run", style="red")
+        raise typer.Exit(1)
+
+    # Confirm import; a dry run writes nothing
+    if not dry_run and not confirm_action(f"Import links from {file_path}?"):
         console.print("🛑 Import cancelled", style="yellow")
         return
 
     data_service = get_data_service()
+    options = {"resume": resume, "dry_run": dry_run, "diff_path": diff}
 
     if file_path.name.endswith(".json"):
-        data_service.import_from_json(file_path)
+        data_service.import_from_json(file_path, **options)
+    elif file_path.name.endswith((".ndjson", ".jsonl")):
+        data_service.import_from_ndjson(file_path, **options)
     elif file_path.name.endswith(".html"):
-        data_service.import_from_html(file_path)
+        data_service.import_from_html(file_path, **options)
     elif file_path.name.endswith(".txt"):
-        data_service.import_from_txt(file_path)
+        data_service.import_from_txt(file_path, **options)
+    elif file_path.name in {"Bookmarks", "Bookmarks.bak"}:
+        data_service.import_from_chrome(file_path, **options)
+    elif file_path.name.endswith(".sqlite"):
+        if dry_run:
+            console.print("❌ --dry-run is not supported for Firefox places.sqlite", style="red")
+            raise typer.Exit(1)
+        data_service.import_from_firefox(file_path)
     else:
         console.print(f"❌ Unsupported file format: {file_path}", style="red")
         raise typer.Exit(1)
@@ -1,15 +1,21 @@
 """Link management commands for LinkCovery CLI."""
 
-from asyncio import run as asyncio_run
-
 import typer
+from rich.progress import Progress
 from rich.table import Table
 
+from linkcovery.core.http_client import run_async
+from linkcovery.core.models import LinkCheckResult, is_broken_status
 from linkcovery.core.utils import confirm_action, console, fetch_description, handle_errors
+from linkcovery.services.check_service import LinkChecker
+from linkcovery.services.enrichment_service import default_job_kinds
 from linkcovery.services.link_service import get_link_service
 
 app = typer.Typer(help="Manage your bookmarked links", no_args_is_help=True)
 
+# Changes and conflict groups listed by normalize --all before the rest are summarized
+MAX_LISTED_CHANGES = 20
+
 
 @app.command(rich_help_panel="Link Management")
 @handle_errors
@@ -19,15 +25,18 @@ def add(
     tag: str | None = typer.Option(None, "--tag", "-t", help="Tag to categorize link"),
     read: bool = typer.Option(False, "--read", "-r", help="Mark as already read"),
     no_fetch: bool = typer.Option(False, "--no-fetch", help="Skip fetching metadata from URL"),
-    timeout: int = typer.Option(10, "--timeout", help="Timeout for fetching metadata (seconds)"),
+    wait: bool = typer.Option(False, "--wait", "-w", help="Fetch the description now instead of queueing it"),
+    timeout: int = typer.Option(10, "--timeout", help="Timeout for fetching metadata with --wait (seconds)"),
 ) -> None:
     """Add a new link to your bookmarks.
 
+    Metadata is fetched in the background by 'linkcovery worker' (or the web UI) unless --wait is used.
+
     Examples:
         linkcovery add "https://github.com/arian24b/linkcovery"
         linkcovery add "url.com" --tag "python,cli" --desc "Great tool"
         linkcovery add "url.com" --read --no-fetch
-        linkcovery add "url.com" --timeout 30
+        linkcovery add "url.com" --wait --timeout 30
 
     """
     link_service = get_link_service()
@@ -35,14 +44,20 @@ def add(
     link = link_service.add_link(
         url=url,
         description=description
-        if description or no_fetch
-        else asyncio_run(fetch_description(url=url, timeout=timeout, show_spinner=True)),
+        if description or no_fetch or not wait
+        else run_async(fetch_description(url=url, timeout=timeout, show_spinner=True)),
         tag=tag or "",
         is_read=read,
     )
 
+    queued = False
+    if not no_fetch and (kinds := default_job_kinds(has_description=bool(link.description))):
+        queued = link_service.enqueue_enrichment([(link.id, link.url)], kinds) > 0
+
     console.print(f"✅ Added link #{link.id}", style="green")
     console.print(f"   URL: {url}")
+    if queued:
+        console.print("🕓 Metadata queued, run 'linkcovery worker' to fetch it", style="dim")
 
 
 @app.command(name="list", rich_help_panel="Link Management")
@@ -74,10 +89,10 @@ def list_links(
     # Get links with filter
     if is_read is not None:
         links = link_service.search_links(is_read=is_read, limit=limit)
+    elif limit:
+        links, _ = link_service.list_links_page(limit=limit)
     else:
         links = link_service.list_all_links()
-        if limit and len(links) > limit:
-            links = links[:limit]
 
     if not links:
         console.print("📭 No links found", style="yellow")
@@ -112,26 +127,34 @@ def list_links(
 def search(
     query: str = typer.Argument(None, help="Search in URLs, descriptions, and tags"),
     domain: str = typer.Option("", "--domain", help="Filter by domain"),
-    tag: str = typer.Option("", "--tag", "-t", help="Filter by tag"),
+    tag: list[str] = typer.Option([], "--tag", "-t", help="Filter by exact tag (repeatable; links must have all)"),
+    any_tag: bool = typer.Option(False, "--any-tag", help="Match links with any of the --tag values"),
     read_only: bool = typer.Option(False, "--read-only", help="Show only read links"),
     unread_only: bool = typer.Option(False, "--unread-only", help="Show only unread links"),
+    broken: bool = typer.Option(False, "--broken", help="Show only links the last check found dead"),
+    status: int | None = typer.Option(None, "--status", help="Filter by HTTP status from the last check"),
     limit: int = typer.Option(20, "--limit", "-l", help="Maximum results"),
 ) -> None:
     """Search your bookmarks with filters.
 
-    All filters use AND logic (intersection).
+    All filters use AND logic (intersection). Tags match exactly, ignoring case; several --tag
+    values must all be present unless --any-tag is given.
 
     Examples:
         linkcovery search python                  # Search for 'python'
         linkcovery search --tag python            # Filter by tag only
         linkcovery search python --tag tools      # Search 'python' AND tag 'tools'
+        linkcovery search -t python -t web        # Tagged both 'python' and 'web'
+        linkcovery search -t rust -t go --any-tag # Tagged 'rust' or 'go'
         linkcovery search --domain github.com     # Filter by domain only
+        linkcovery search --broken                # Dead links found by 'check'
+        linkcovery search --status 404            # Links that returned 404
 
     """
     link_service = get_link_service()
 
     # If no query or filters provided, show help
-    if not query and not domain and not tag:
+    if not query and not domain and not tag and not broken and status is None:
         console.print("🔍 [bold blue]Search Help[/bold blue]")
         console.print()
         console.print("Please provide a search query or filters:")
@@ -141,9 +164,12 @@ def search(
         console.print("  linkcovery search --domain <domain>     # Filter by domain")
         console.print()
         console.print("Options:")
+        console.print("  --any-tag              Match any --tag instead of all")
         console.print("  --limit, -l           Maximum number of results")
         console.print("  --read-only            Show only read links")
         console.print("  --unread-only          Show only unread links")
+        console.print("  --broken               Show only dead links")
+        console.print("  --status <code>        Filter by checked HTTP status")
         console.print()
         return
 
@@ -157,8 +183,11 @@ def search(
     results = link_service.search_links(
         query=query or "",
         domain=domain,
-        tag=tag,
+        tags=tag,
+        any_tag=any_tag,
         is_read=is_read,
+        broken=True if broken else None,
+        http_status=status,
         limit=limit,
     )
 
@@ -173,14 +202,19 @@ def search(
     table.add_column("URL", style="blue")
     table.add_column("Description", style="dim")
     table.add_column("Tag", style="magenta")
+    if broken or status is not None:
+        table.add_column("HTTP", style="red")
 
     for link in results:
-        status = "✅" if link.is_read else "⏳"
+        read_status = "✅" if link.is_read else "⏳"
         description = link.description or ""
         desc = description[:50] + "..." if len(description) > 50 else description
         tag = link.tag or ""
 
-        table.add_row(str(link.id), status, link.url, desc, tag)
+        row = [str(link.id), read_status, link.url, desc, tag]
+        if broken or status is not None:
+            row.append(str(link.http_status or "down"))
+        table.add_row(*row)
 
     console.print(table)
 
@@ -205,6 +239,11 @@ def show(link_id: int = typer.Argument(..., help="Link ID to display")) -> None:
     console.print(f"   Status: {'✅ Read' if link.is_read else '⏳ Unread'}")
     console.print(f"   Created: {link.created_at}")
     console.print(f"   Updated: {link.updated_at}")
+    if link.checked_at:
+        health = "💀 Broken" if is_broken_status(link.http_status) else "🟢 Alive"
+        console.print(f"   Checked: {link.checked_at} ({health}, HTTP {link.http_status or '-'}, {link.latency_ms} ms)")
+        if link.final_url and link.final_url != link.url:
+            console.print(f"   Redirects to: {link.final_url}")
 
 
 @app.command(rich_help_panel="Link Management")
@@ -282,13 +321,20 @@ def delete(
 def normalize(
     link_id: list[int] = typer.Argument(None, help="Link IDs to normalize"),
     all_links: bool = typer.Option(False, "--all", "-a", help="Normalize all links"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="With --all, show what would change without writing"),
+    merge: bool = typer.Option(False, "--merge", help="With --all, merge links that are spellings of the same URL"),
 ) -> None:
     """Normalize link URLs by removing trailing slashes, converting http to https, and removing www.
 
+    With --all, links that would end up with the same URL are reported and left as they are, unless
+    --merge keeps one of them with the others' description, tag and read state.
+
     Examples:
         linkcovery normalize 1
         linkcovery normalize 1 2 3
         linkcovery normalize --all
+        linkcovery normalize --all --dry-run
+        linkcovery normalize --all --merge
 
     """
     link_service = get_link_service()
@@ -299,13 +345,39 @@ def normalize(
             console.print("⚠️ Ignoring specific link IDs when --all is used", style="yellow")
 
         console.print("🔄 Normalizing all links...", style="blue")
+        result = link_service.normalize_all_links(dry_run=dry_run, merge=merge)
 
-        if normalized_links := link_service.normalize_all_links():
-            console.print(f"✅ Normalized {len(normalized_links)} links", style="green")
-            for link in normalized_links:
-                console.print(f"   • Link #{link.id}: {link.url}", style="dim")
-        else:
+        if not result.scanned:
             console.print("📭 No links found to normalize", style="yellow")
+            return
+
+        for change in result.updated[:MAX_LISTED_CHANGES]:
+            console.print(f"   • Link #{change.link_id}: {change.url} → {change.normalized_url}", style="dim")
+        if len(result.updated) > MAX_LISTED_CHANGES:
+            console.print(f"   … and {len(result.updated) - MAX_LISTED_CHANGES} more", style="dim")
+
+        if result.conflicts:
+            console.print(f"⚠️ {len(result.conflicts)} groups of links are spellings of the same URL:", style="yellow")
+            for group in result.conflicts[:MAX_LISTED_CHANGES]:
+                ids = ", ".join(f"#{change.link_id}" for change in group)
+                console.print(f"   • {group[0].normalized_url}: {ids}", style="dim")
+            if len(result.conflicts) > MAX_LISTED_CHANGES:
+                console.print(f"   … and {len(result.conflicts) - MAX_LISTED_CHANGES} more", style="dim")
+        for change in result.failed[:MAX_LISTED_CHANGES]:
+            console.print(f"❌ Could not normalize link #{change.link_id}: {change.url}", style="red")
+
+        prefix = "🔍 Dry run: would normalize" if dry_run else "✅ Normalized"
+        if result.updated or result.merged:
+            console.print(f"{prefix} {len(result.updated)} of {result.scanned} links", style="green")
+        else:
+            console.print(f"✨ All {result.scanned} links are already normalized", style="green")
+        if result.merged:
+            verb = "would merge" if dry_run else "merged"
+            console.print(
+                f"🔀 {verb.capitalize()} {result.merged} links into the first link of their group", style="green"
+            )
+        elif result.conflicts:
+            console.print("💡 Links in a group were left unchanged; use --merge to keep one per group", style="blue")
     elif link_id:
         # Normalize specific links
         for id in link_id:
@@ -318,6 +390,51 @@ def normalize(
         console.print("⚠️ Please specify link IDs or use --all to normalize all links", style="yellow")
 
 
+@app.command(rich_help_panel="Link Management")
+@handle_errors
+def check(
+    days: int | None = typer.Option(None, "--days", help="Only re-check links not checked in this many days"),
+    concurrency: int = typer.Option(None, "--concurrency", "-c", help="Requests in flight overall"),
+    per_host: int = typer.Option(None, "--per-host", help="Requests in flight per host"),
+    timeout: int = typer.Option(None, "--timeout", help="Timeout per request (seconds)"),
+) -> None:
+    """Check your links for rot and record their HTTP status.
+
+    Examples:
+        linkcovery check
+        linkcovery check --days 30
+        linkcovery check --concurrency 128 --per-host 2
+
+    """
+    link_service = get_link_service()
+    checker = LinkChecker(
+        db=link_service.db,
+        concurrency=concurrency,
+        per_host_limit=per_host,
+        timeout=timeout,
+    )
+
+    total = link_service.count_links_to_check(LinkChecker.checked_before(days))
+    if not total:
+        console.print("📭 No links due for a check", style="yellow")
+        return
+
+    console.print(f"🩺 Checking {total} links...")
+    with Progress() as progress:
+        task = progress.add_task("Checking links...", total=total)
+
+        def advance(result: LinkCheckResult) -> None:
+            progress.update(task, advance=1)
+
+        run_async(checker.run(days=days, on_result=advance))
+
+    console.print(f"✅ Checked {checker.checked} links", style="green")
+    if checker.broken:
+        console.print(f"💀 {checker.broken} broken links, see 'linkcovery search --broken'", style="yellow")
+    if checker.skipped:
+        console.print(f"⏭️ {checker.skipped} links skipped after their host stopped answering", style="dim")
+
+
 @app.command(rich_help_panel="Link Management")
 @handle_errors
 def read_random(
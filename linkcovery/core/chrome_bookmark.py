@@ -1,22 +1,139 @@
+"""Readers for browser bookmark files: Netscape bookmark HTML exports and Chrome's Bookmarks JSON."""
+
+from codecs import getincrementaldecoder
+from collections.abc import Iterator
+from datetime import UTC, datetime
 from html.parser import HTMLParser
-from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+# Chrome stores times as microseconds since 1601-01-01 (the Windows FILETIME epoch)
+CHROME_EPOCH_OFFSET_US = 11_644_473_600 * 1_000_000
+
+
+class BookmarkRecord(NamedTuple):
+    """One bookmark read from a bookmark file."""
+
+    url: str
+    title: str
+    folders: tuple[str, ...]
+    add_date: str | None  # ISO 8601, or None when missing or unparsable
+
+    @property
+    def tag(self) -> str:
+        """Folder path used as the link's tag; commas in folder names become ";" as they separate tags."""
+        return "/".join(folder.replace(",", ";") for folder in self.folders if folder)
+
+
+def parse_add_date(value: str | None) -> str | None:
+    """Convert an ADD_DATE epoch timestamp (seconds, or milli/microseconds in some exports) to ISO 8601."""
+    try:
+        timestamp = int(value or "")
+    except ValueError:
+        return None
+    if timestamp <= 0:
+        return None
+    if timestamp > 10**14:
+        timestamp //= 1_000_000
+    elif timestamp > 10**11:
+        timestamp //= 1000
+    try:
+        return datetime.fromtimestamp(timestamp, UTC).isoformat()
+    except (OverflowError, OSError, ValueError):
+        return None
+
 
+class BookmarkParser(HTMLParser):
+    """Collect bookmarks with their folder path from Netscape bookmark HTML fed in chunks.
+
+    Folders are <H3> headings followed by a nested <DL> list; finished records are queued in
+    records for the caller to drain between chunks.
+    """
 
-class LinkParser(HTMLParser):
     def __init__(self) -> None:
-        super().__init__()
-        self.links = []
+        super().__init__(convert_charrefs=True)
+        self.records: list[BookmarkRecord] = []
+        self._folders: list[str | None] = []
+        self._heading: str | None = None
+        self._in_heading = False
+        self._link: dict[str, str | None] | None = None
+        self._text: list[str] = []
 
     def handle_starttag(self, tag, attrs) -> None:
         if tag == "a":
             attrs = dict(attrs)
-            href = attrs.get("href")
-            if href:
-                self.links.append(href)
+            if href := (attrs.get("href") or "").strip():
+                self._link = {"href": href, "add_date": attrs.get("add_date")}
+                self._text = []
+        elif tag == "h3":
+            self._in_heading = True
+            self._text = []
+        elif tag == "dl":
+            # A list opened right after a heading holds that folder's bookmarks
+            self._folders.append(self._heading)
+            self._heading = None
+
+    def handle_endtag(self, tag) -> None:
+        if tag == "a" and self._link:
+            self.records.append(
+                BookmarkRecord(
+                    url=self._link["href"] or "",
+                    title=" ".join("".join(self._text).split()),
+                    folders=tuple(folder for folder in self._folders if folder),
+                    add_date=parse_add_date(self._link["add_date"]),
+                ),
+            )
+            self._link = None
+        elif tag == "h3" and self._in_heading:
+            self._in_heading = False
+            self._heading = " ".join("".join(self._text).split())
+        elif tag == "dl" and self._folders:
+            self._folders.pop()
+
+    def handle_data(self, data) -> None:
+        if self._link or self._in_heading:
+            self._text.append(data)
+
+
+def iter_bookmarks(file: IO[bytes], chunk_size: int = 256 * 1024) -> Iterator[BookmarkRecord]:
+    """Yield bookmarks from a Netscape bookmark HTML file as it is read in chunks."""
+    parser = BookmarkParser()
+    decoder = getincrementaldecoder("utf-8")(errors="replace")
+    while chunk := file.read(chunk_size):
+        parser.feed(decoder.decode(chunk))
+        yield from parser.records
+        parser.records.clear()
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    yield from parser.records
+
+
+def parse_chrome_date(value: str | int | None) -> str | None:
+    """Convert a Chrome date_added value (microseconds since 1601) to ISO 8601."""
+    try:
+        timestamp = int(value or 0) - CHROME_EPOCH_OFFSET_US
+    except ValueError:
+        return None
+    if timestamp <= 0:
+        return None
+    return datetime.fromtimestamp(timestamp / 1_000_000, UTC).isoformat()
+
 
+def iter_chrome_bookmarks(data: dict[str, Any]) -> Iterator[BookmarkRecord]:
+    """Yield bookmarks from the parsed contents of a Chrome (or Chromium-based browser) Bookmarks file."""
+    roots = [root for root in data.get("roots", {}).values() if isinstance(root, dict)]
+    stack: list[tuple[dict, tuple[str, ...]]] = [(root, ()) for root in reversed(roots)]
+    while stack:
+        node, folders = stack.pop()
+        if node.get("type") == "url":
+            if url := (node.get("url") or "").strip():
+                yield BookmarkRecord(
+                    url=url,
+                    title=" ".join((node.get("name") or "").split()),
+                    folders=folders,
+                    add_date=parse_chrome_date(node.get("date_added")),
+                )
+            continue
 
-def extractor(file_path: Path) -> list[str]:
-    content = file_path.read_text(encoding="utf-8")
-    parser = LinkParser()
-    parser.feed(content)
-    return parser.links
+        # Children are pushed in reverse so bookmarks come out in the browser's order
+        path = (*folders, node.get("name") or "")
+        stack.extend((child, path) for child in reversed(node.get("children") or []) if isinstance(child, dict))
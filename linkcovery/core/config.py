@@ -20,11 +20,44 @@ class AppConfig(BaseModel):
 
     # Database configuration
     database_path: str | None = None
+    db_read_pool_size: int = 0  # Read connections shared by concurrent requests, 0 for one per CPU
+    db_busy_timeout: int = 20  # Seconds to wait for the write connection or for another process's lock
 
     # Export/Import settings
     default_export_format: str = "json"
     max_search_results: int = 50
     allowed_extensions: list[str] = [".json"]
+    import_batch_size: int = 2000
+    import_queue_batches: int = 4  # Batches buffered between import pipeline stages
+    export_chunk_size: int = 1000
+    import_workers: int = 0  # Processes parsing JSON Lines imports, 0 for one per CPU
+    ndjson_chunk_bytes: int = 4 * 1024 * 1024
+    normalize_workers: int = 0  # Processes normalizing URLs for normalize --all, 0 for one per CPU
+
+    # Metadata fetching
+    fetch_concurrency: int = 16
+    fetch_per_host_limit: int = 4
+    fetch_timeout: int = 10
+    metadata_max_bytes: int = 512_000
+    metadata_cache_ttl_hours: int = 168
+    metadata_cache_max_entries: int = 50_000
+    fetch_failure_backoff: int = 60
+
+    # Background enrichment
+    enrichment_concurrency: int = 8
+    enrichment_max_attempts: int = 4
+    enrichment_retry_delay: int = 60
+    enrich_canonical_urls: bool = False
+    webui_enrichment_worker: bool = True
+
+    # Dead link checking
+    check_concurrency: int = 64
+    check_batch_size: int = 500
+
+    # Shared HTTP connection pool
+    http_max_connections: int = 64
+    http_max_keepalive_connections: int = 32
+    http_keepalive_expiry: float = 30.0
 
     # Debug and development
     debug: bool = False
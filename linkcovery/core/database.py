@@ -1,19 +1,261 @@
 """Database service for LinkCovery."""
 
-from collections.abc import Generator
+import re
+from asyncio import get_running_loop
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from json import dumps
+from os import cpu_count
+from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine, or_
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import (
+    Select,
+    and_,
+    column,
+    create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy import exists as sqlal_exists
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Row
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool
 
 from linkcovery.core.config import get_config
-from linkcovery.core.exceptions import DatabaseError, LinkAlreadyExistsError, LinkNotFoundError
-from linkcovery.core.models import Base, Link, LinkCreate, LinkFilter, LinkUpdate
-from linkcovery.core.utils import extract_domain
+from linkcovery.core.exceptions import (
+    DatabaseError,
+    LinkAlreadyExistsError,
+    LinKCoveryError,
+    LinkNotFoundError,
+    ValidationError,
+)
+from linkcovery.core.models import (
+    Base,
+    EnrichmentJob,
+    ImportCheckpoint,
+    ImportFailure,
+    ImportSession,
+    Link,
+    LinkCheckResult,
+    LinkCreate,
+    LinkFilter,
+    LinkImportResult,
+    LinkRow,
+    LinkTag,
+    LinkUpdate,
+    NormalizeChange,
+    StatCounter,
+    Tag,
+    parse_tags,
+)
+from linkcovery.core.utils import extract_domain, url_key
+
+# FTS5 index mirroring links(url, description, tag); kept in sync by triggers
+links_fts = table("links_fts", column("rowid"))
+
+FTS_TABLE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS links_fts USING fts5("
+    "url, description, tag, content='links', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+)
+
+FTS_TRIGGERS_SQL = (
+    """CREATE TRIGGER IF NOT EXISTS links_fts_ai AFTER INSERT ON links BEGIN
+        INSERT INTO links_fts(rowid, url, description, tag) VALUES (new.id, new.url, new.description, new.tag);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS links_fts_ad AFTER DELETE ON links BEGIN
+        INSERT INTO links_fts(links_fts, rowid, url, description, tag)
+        VALUES ('delete', old.id, old.url, old.description, old.tag);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS links_fts_au AFTER UPDATE OF url, description, tag ON links BEGIN
+        INSERT INTO links_fts(links_fts, rowid, url, description, tag)
+        VALUES ('delete', old.id, old.url, old.description, old.tag);
+        INSERT INTO links_fts(rowid, url, description, tag) VALUES (new.id, new.url, new.description, new.tag);
+    END""",
+)
+
+# Counters in stat_counters follow every insert, delete and change of domain or read status, and every
+# link_tags row; a count reaching zero drops its domain or tag row
+STATS_TRIGGERS_SQL = (
+    """CREATE TRIGGER IF NOT EXISTS links_stats_ai AFTER INSERT ON links BEGIN
+        INSERT INTO stat_counters(kind, name, count)
+        VALUES ('links', '', 1), ('read', '', coalesce(new.is_read, 0)), ('domain', new.domain, 1)
+        ON CONFLICT(kind, name) DO UPDATE SET count = count + excluded.count;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS links_stats_ad AFTER DELETE ON links BEGIN
+        INSERT INTO stat_counters(kind, name, count)
+        VALUES ('links', '', -1), ('read', '', -coalesce(old.is_read, 0)), ('domain', old.domain, -1)
+        ON CONFLICT(kind, name) DO UPDATE SET count = count + excluded.count;
+        DELETE FROM stat_counters WHERE kind = 'domain' AND name = old.domain AND count <= 0;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS links_stats_au AFTER UPDATE OF domain, is_read ON links
+    WHEN old.domain IS NOT new.domain OR old.is_read IS NOT new.is_read BEGIN
+        INSERT INTO stat_counters(kind, name, count)
+        VALUES ('read', '', coalesce(new.is_read, 0) - coalesce(old.is_read, 0)),
+               ('domain', old.domain, -1), ('domain', new.domain, 1)
+        ON CONFLICT(kind, name) DO UPDATE SET count = count + excluded.count;
+        DELETE FROM stat_counters WHERE kind = 'domain' AND name = old.domain AND count <= 0;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS link_tags_stats_ai AFTER INSERT ON link_tags BEGIN
+        INSERT INTO stat_counters(kind, name, count)
+        SELECT 'tag', name, 1 FROM tags WHERE id = new.tag_id
+        ON CONFLICT(kind, name) DO UPDATE SET count = count + excluded.count;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS link_tags_stats_ad AFTER DELETE ON link_tags BEGIN
+        INSERT INTO stat_counters(kind, name, count)
+        SELECT 'tag', name, -1 FROM tags WHERE id = old.tag_id
+        ON CONFLICT(kind, name) DO UPDATE SET count = count + excluded.count;
+        DELETE FROM stat_counters
+        WHERE kind = 'tag' AND name = (SELECT name FROM tags WHERE id = old.tag_id) AND count <= 0;
+    END""",
+)
+
+# Recompute every counter from the links and link_tags tables
+STATS_REBUILD_SQL = (
+    "DELETE FROM stat_counters",
+    "INSERT INTO stat_counters(kind, name, count) SELECT 'links', '', count(*) FROM links",
+    "INSERT INTO stat_counters(kind, name, count) SELECT 'read', '', count(*) FROM links WHERE is_read",
+    "INSERT INTO stat_counters(kind, name, count) SELECT 'domain', domain, count(*) FROM links GROUP BY domain",
+    "INSERT INTO stat_counters(kind, name, count) "
+    "SELECT 'tag', t.name, count(*) FROM link_tags lt JOIN tags t ON t.id = lt.tag_id GROUP BY t.id",
+)
+
+# Columns written by the link checker, added to databases created before it existed
+CHECK_COLUMNS = (
+    ("http_status", "INTEGER"),
+    ("final_url", "TEXT DEFAULT ''"),
+    ("latency_ms", "INTEGER"),
+    ("checked_at", "TEXT"),
+)
+
+# Copy bookmarks from an attached Firefox places.sqlite in one statement. Folder paths are built by a
+# recursive CTE, the built-in root folders get their display names, commas in folder names become ";"
+# as they separate tags, and OR IGNORE skips stored links.
+FIREFOX_IMPORT_SQL = """
+WITH RECURSIVE folders(id, path) AS (
+    SELECT id, '' FROM places.moz_bookmarks WHERE parent = 0
+    UNION ALL
+    SELECT b.id, ltrim(f.path || '/' || CASE b.guid
+        WHEN 'menu________' THEN 'Bookmarks Menu'
+        WHEN 'toolbar_____' THEN 'Bookmarks Toolbar'
+        WHEN 'unfiled_____' THEN 'Other Bookmarks'
+        WHEN 'mobile______' THEN 'Mobile Bookmarks'
+        ELSE replace(coalesce(b.title, ''), ',', ';') END, '/')
+    FROM places.moz_bookmarks b JOIN folders f ON b.parent = f.id
+    WHERE b.type = 2
+)
+INSERT OR IGNORE INTO links (url, url_key, domain, description, tag, is_read, preview_url, created_at, updated_at)
+SELECT p.url, url_key(p.url), extract_domain(p.url), coalesce(nullif(b.title, ''), p.title, ''), f.path, 0, '',
+       coalesce(epoch_us_to_iso(b.dateAdded), :now), :now
+FROM places.moz_bookmarks b
+JOIN places.moz_places p ON p.id = b.fk
+JOIN folders f ON f.id = b.parent
+WHERE b.type = 1 AND (p.url LIKE 'http://%' OR p.url LIKE 'https://%')
+ORDER BY b.dateAdded, b.id
+"""
+
+# Columns of a LinkRow, in its field order
+LINK_ROW_COLUMNS = (
+    Link.id,
+    Link.url,
+    Link.domain,
+    func.coalesce(Link.description, "").label("description"),
+    Link.tag,
+    func.coalesce(Link.is_read, False).label("is_read"),
+    func.coalesce(Link.preview_url, "").label("preview_url"),
+    Link.created_at,
+    Link.updated_at,
+    Link.http_status,
+)
+
+# Stay well below SQLite's bound-parameter limit for IN (...) lists
+SQLITE_MAX_PARAMS = 900
+
+# BM25 column weights for (url, description, tag); lower scores rank first
+FTS_RANK = literal_column("bm25(links_fts, 1.0, 2.0, 3.0)")
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_fts_query(query: str) -> str:
+    """Turn free text into an FTS5 MATCH expression of quoted prefix terms (ANDed)."""
+    return " ".join(f'"{token}"*' for token in _FTS_TOKEN_RE.findall(query))
+
+
+def _sql_extract_domain(url: str | None) -> str:
+    """extract_domain for use from SQL, returning '' instead of raising."""
+    try:
+        return extract_domain(url or "")
+    except ValueError:
+        return ""
+
+
+def _sql_epoch_us_to_iso(value: int | None) -> str | None:
+    """Convert microseconds since the Unix epoch to ISO 8601 for use from SQL."""
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(value / 1_000_000, UTC).isoformat()
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def configure_connection(dbapi_connection, connection_record) -> None:
+    """Apply per-connection pragmas and make Python helpers callable from SQL on every new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=10000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.close()
+    register_sqlite_functions(dbapi_connection)
+
+
+def configure_read_connection(dbapi_connection, connection_record) -> None:
+    """Configure a read pool connection, refusing writes so none can bypass the write connection."""
+    configure_connection(dbapi_connection, connection_record)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def register_sqlite_functions(dbapi_connection) -> None:
+    """Make Python helpers callable from SQL."""
+    dbapi_connection.create_function("extract_domain", 1, _sql_extract_domain, deterministic=True)
+    dbapi_connection.create_function("epoch_us_to_iso", 1, _sql_epoch_us_to_iso, deterministic=True)
+    dbapi_connection.create_function("url_key", 1, url_key, deterministic=True)
+
+
+def encode_cursor(link: Link | LinkRow) -> str:
+    """Encode the (created_at, id) keyset position after a link as an opaque cursor."""
+    return urlsafe_b64encode(f"{link.created_at}|{link.id}".encode()).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """Decode an opaque cursor back into its (created_at, id) keyset position."""
+    try:
+        created_at, link_id = urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").rsplit("|", 1)
+        return created_at, int(link_id)
+    except Exception:
+        msg = "Invalid pagination cursor"
+        raise ValidationError(msg, hint="Start again from the first page")
 
 
 class DatabaseService:
@@ -21,41 +263,61 @@ class DatabaseService:
 
     def __init__(self, database_path: str | None = None) -> None:
         """Initialize database service with connection pooling."""
+        config = get_config()
         if database_path is None:
-            database_path = get_config().get_database_path()
+            database_path = config.get_database_path()
 
         try:
-            # Enable connection pooling and optimization for SQLite
+            url = f"sqlite:///{database_path}"
+            # Pooled connections move between threads, but the pool hands each to one thread at a time
+            connect_args = {"check_same_thread": False, "timeout": config.db_busy_timeout}
+            # All writes go through one connection, so writers queue here instead of on SQLite's lock
             self.engine = create_engine(
-                f"sqlite:///{database_path}",
-                poolclass=StaticPool,
-                pool_pre_ping=True,
-                connect_args={
-                    "check_same_thread": False,
-                    # SQLite optimization pragmas
-                    "timeout": 20,
-                },
+                url,
+                poolclass=QueuePool,
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=config.db_busy_timeout,
+                connect_args=connect_args,
                 echo=False,  # Disable SQL logging for performance
             )
+            # Reads run concurrently on their own connections, which WAL lets proceed alongside the writer
+            self.read_engine = create_engine(
+                url,
+                poolclass=QueuePool,
+                pool_size=config.db_read_pool_size or cpu_count() or 1,
+                max_overflow=0,
+                pool_timeout=config.db_busy_timeout,
+                connect_args=connect_args,
+                echo=False,
+            )
+            event.listen(self.engine, "connect", configure_connection)
+            event.listen(self.read_engine, "connect", configure_read_connection)
 
-            # Apply SQLite optimization pragmas
             with self.engine.connect() as conn:
-                # Performance optimizations
+                # WAL is a property of the database file, so setting it once covers every connection
                 conn.exec_driver_sql("PRAGMA journal_mode=WAL")
-                conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
-                conn.exec_driver_sql("PRAGMA cache_size=10000")
-                conn.exec_driver_sql("PRAGMA temp_store=MEMORY")
-                conn.exec_driver_sql("PRAGMA mmap_size=268435456")  # 256MB
                 conn.commit()
 
             Base.metadata.create_all(bind=self.engine)
             self._ensure_preview_column()
+            self._ensure_check_columns()
+            self._ensure_search_index()
+            self._ensure_url_key_column()
+            self._ensure_tag_index()
+            self._ensure_stat_counters()
             self.SessionLocal = sessionmaker(
                 autocommit=False,
                 autoflush=False,
                 bind=self.engine,
                 expire_on_commit=False,  # Keep objects accessible after commit
             )
+            self.ReadSessionLocal = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=self.read_engine,
+                expire_on_commit=False,
+            )
         except Exception as e:
             msg = f"Failed to initialize database: {e}"
             raise DatabaseError(msg)
@@ -69,6 +331,182 @@ class DatabaseService:
                 conn.exec_driver_sql("ALTER TABLE links ADD COLUMN preview_url TEXT DEFAULT ''")
                 conn.commit()
 
+    def _ensure_check_columns(self) -> None:
+        """Ensure link check columns and their indexes exist for links table."""
+        with self.engine.connect() as conn:
+            result = conn.exec_driver_sql("PRAGMA table_info(links)")
+            columns = {row[1] for row in result}
+            for name, sql_type in CHECK_COLUMNS:
+                if name not in columns:
+                    conn.exec_driver_sql(f"ALTER TABLE links ADD COLUMN {name} {sql_type}")
+            conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_links_http_status ON links (http_status)")
+            conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_links_checked_at ON links (checked_at)")
+            conn.commit()
+
+    def _ensure_search_index(self) -> None:
+        """Ensure the FTS5 search index and its sync triggers exist, backfilling it on creation."""
+        with self.engine.connect() as conn:
+            exists = conn.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'links_fts'")
+            created = exists.first() is None
+            conn.exec_driver_sql(FTS_TABLE_SQL)
+            for trigger_sql in FTS_TRIGGERS_SQL:
+                conn.exec_driver_sql(trigger_sql)
+            if created:
+                # Existing databases: index every row that predates the FTS table
+                conn.exec_driver_sql("INSERT INTO links_fts(links_fts) VALUES ('rebuild')")
+            conn.commit()
+
+    def _ensure_url_key_column(self) -> None:
+        """Ensure the url_key column and its unique index exist, backfilling rows without a key."""
+        with self.engine.connect() as conn:
+            columns = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(links)")}
+            if "url_key" not in columns:
+                conn.exec_driver_sql("ALTER TABLE links ADD COLUMN url_key INTEGER")
+            conn.exec_driver_sql("CREATE UNIQUE INDEX IF NOT EXISTS ux_links_url_key ON links (url_key)")
+            conn.commit()
+        self.backfill_url_keys()
+
+    def backfill_url_keys(self, batch_size: int = 10_000) -> None:
+        """Set url_key on links that have none, in id order, 10k per transaction.
+
+        Uses UPDATE OR IGNORE, so when stored links share a key the oldest one takes it and the others
+        stay NULL until normalize --all --merge folds them into it.
+        """
+        try:
+            with self.engine.connect() as conn:
+                last_id = 0
+                while rows := conn.execute(
+                    select(Link.id, Link.url)
+                    .where(Link.url_key.is_(None), Link.id > last_id)
+                    .order_by(Link.id)
+                    .limit(batch_size),
+                ).all():
+                    last_id = rows[-1][0]
+                    conn.exec_driver_sql(
+                        "UPDATE OR IGNORE links SET url_key = ? WHERE id = ?",
+                        [(url_key(url), link_id) for link_id, url in rows],
+                    )
+                    conn.commit()
+        except SQLAlchemyError as e:
+            msg = f"Database error while backfilling URL keys: {e}"
+            raise DatabaseError(msg)
+
+    def _ensure_tag_index(self, batch_size: int = 10_000) -> None:
+        """Backfill link_tags for tagged links that predate it.
+
+        Links are synced in id order, one transaction per batch, so an interrupted backfill resumes
+        after the highest link already indexed.
+        """
+        with self.engine.connect() as conn:
+            last_id = conn.execute(select(func.coalesce(func.max(LinkTag.link_id), 0))).scalar_one()
+            while rows := conn.execute(
+                select(Link.id, Link.tag)
+                .where(Link.id > last_id, Link.tag.is_not(None), Link.tag != "")
+                .order_by(Link.id)
+                .limit(batch_size),
+            ).all():
+                last_id = rows[-1][0]
+                self._sync_link_tags(conn, rows, replace=False)
+                conn.commit()
+
+    def _ensure_stat_counters(self) -> None:
+        """Ensure the statistics counter triggers exist, filling the counters when they are first created."""
+        with self.engine.connect() as conn:
+            exists = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'links_stats_ai'"
+            )
+            created = exists.first() is None
+            for trigger_sql in STATS_TRIGGERS_SQL:
+                conn.exec_driver_sql(trigger_sql)
+            if created:
+                # Existing databases: count every row that predates the triggers
+                for statement in STATS_REBUILD_SQL:
+                    conn.exec_driver_sql(statement)
+            conn.commit()
+
+    @staticmethod
+    def _sync_link_tags(conn: Connection, links: Sequence[tuple[int, str | None]], replace: bool = True) -> None:
+        """Write the link_tags rows for (link_id, tag string) pairs inside the caller's transaction.
+
+        The existing rows of the links are replaced; new links can skip that delete with replace=False.
+        """
+        if replace:
+            link_ids = [link_id for link_id, _ in links]
+            for start in range(0, len(link_ids), SQLITE_MAX_PARAMS):
+                chunk = link_ids[start : start + SQLITE_MAX_PARAMS]
+                conn.execute(delete(LinkTag).where(LinkTag.link_id.in_(chunk)))
+
+        pairs = [(link_id, name) for link_id, tag in links for name in parse_tags(tag)]
+        if not pairs:
+            return
+        names = list(dict.fromkeys(name for _, name in pairs))
+        conn.execute(sqlite_insert(Tag).on_conflict_do_nothing(), [{"name": name} for name in names])
+        tag_ids: dict[str, int] = {}
+        for start in range(0, len(names), SQLITE_MAX_PARAMS):
+            chunk = names[start : start + SQLITE_MAX_PARAMS]
+            tag_ids.update(conn.execute(select(Tag.name, Tag.id).where(Tag.name.in_(chunk))).all())
+        conn.execute(insert(LinkTag), [{"link_id": link_id, "tag_id": tag_ids[name]} for link_id, name in pairs])
+
+    def import_firefox_places(self, places_path: str | Path) -> tuple[int, int]:
+        """Copy bookmarks from a Firefox places.sqlite into links with one INSERT ... SELECT.
+
+        The file is attached to the connection so rows never pass through Python; it should be a copy,
+        as Firefox keeps the live database locked. Returns (bookmarks found, links added).
+        """
+        now = datetime.now(UTC).isoformat()
+        try:
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql("ATTACH DATABASE ? AS places", (str(places_path),))
+                try:
+                    total = conn.exec_driver_sql(
+                        "SELECT count(*) FROM places.moz_bookmarks b JOIN places.moz_places p ON p.id = b.fk "
+                        "WHERE b.type = 1 AND (p.url LIKE 'http://%' OR p.url LIKE 'https://%')",
+                    ).scalar_one()
+                    last_id = conn.execute(select(func.coalesce(func.max(Link.id), 0))).scalar_one()
+                    conn.execute(text(FIREFOX_IMPORT_SQL), {"now": now})
+                    # rowcount is not reported for statements starting with WITH
+                    added = conn.exec_driver_sql("SELECT changes()").scalar_one()
+                    new_links = conn.execute(select(Link.id, Link.tag).where(Link.id > last_id)).all()
+                    self._sync_link_tags(conn, new_links, replace=False)
+                    conn.commit()
+                finally:
+                    conn.rollback()
+                    conn.exec_driver_sql("DETACH DATABASE places")
+                return total, added
+        except SQLAlchemyError as e:
+            msg = f"Database error while importing Firefox bookmarks: {e}"
+            raise DatabaseError(msg)
+
+    def rebuild_search_index(self) -> None:
+        """Rebuild the full-text search index from the links table."""
+        try:
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql("INSERT INTO links_fts(links_fts) VALUES ('rebuild')")
+                conn.exec_driver_sql("INSERT INTO links_fts(links_fts) VALUES ('optimize')")
+                conn.commit()
+        except SQLAlchemyError as e:
+            msg = f"Database error while rebuilding search index: {e}"
+            raise DatabaseError(msg)
+
+    def rebuild_statistics(self) -> None:
+        """Recompute the statistics counters from the links and link_tags tables."""
+        try:
+            with self.engine.begin() as conn:
+                for statement in STATS_REBUILD_SQL:
+                    conn.exec_driver_sql(statement)
+        except SQLAlchemyError as e:
+            msg = f"Database error while rebuilding statistics: {e}"
+            raise DatabaseError(msg)
+
+    @contextmanager
+    def get_read_session(self) -> Generator[Session]:
+        """Get a session on the read pool for queries that do not write."""
+        session = self.ReadSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
     @contextmanager
     def get_session(self) -> Generator[Session]:
         """Get a database session with proper cleanup."""
@@ -82,11 +520,16 @@ class DatabaseService:
         finally:
             session.close()
 
+    def _link_rows(self, query: Select) -> list[LinkRow]:
+        """Run a select of LINK_ROW_COLUMNS on the read pool, returning plain rows without ORM objects."""
+        with self.read_engine.connect() as conn:
+            return list(map(LinkRow._make, conn.execute(query)))
+
     def exists(self, link_url: str) -> bool:
-        """Check if a link with the given URL exists."""
+        """Check if a link with the given URL, or another spelling of it, exists."""
         try:
-            with self.get_session() as session:
-                return session.query(sqlal_exists().where(Link.url == link_url)).scalar()
+            with self.get_read_session() as session:
+                return session.query(sqlal_exists().where(Link.url_key == url_key(link_url))).scalar()
         except SQLAlchemyError as e:
             msg = f"Database error while checking link existence: {e}"
             raise DatabaseError(msg)
@@ -98,28 +541,33 @@ class DatabaseService:
         """Create a new link."""
         try:
             with self.get_session() as session:
-                # Check if link already exists
-                if session.query(Link).filter(Link.url == link_data.url).first():
+                # Check if link already exists, under any spelling of its URL
+                key = url_key(link_data.url)
+                if session.query(sqlal_exists().where(Link.url_key == key)).scalar():
                     raise LinkAlreadyExistsError(link_data.url)
 
                 # Create new link
                 now = datetime.now(UTC).isoformat()
                 link = Link(
                     url=link_data.url,
+                    url_key=key,
                     domain=extract_domain(url=link_data.url),
                     description=link_data.description,
                     tag=link_data.tag,
                     is_read=link_data.is_read,
                     preview_url="",
-                    created_at=now,
+                    created_at=link_data.created_at or now,
                     updated_at=now,
                 )
 
                 session.add(link)
                 session.flush()  # Get the ID before committing
+                self._sync_link_tags(session.connection(), [(link.id, link.tag)], replace=False)
                 session.expunge(link)  # Detach from session
                 return link
 
+        except LinKCoveryError:
+            raise
         except SQLAlchemyError as e:
             msg = f"Database error while creating link: {e}"
             raise DatabaseError(msg)
@@ -127,14 +575,241 @@ class DatabaseService:
             msg = f"Unexpected error while creating link: {e}"
             raise DatabaseError(msg)
 
+    def existing_keys(self, keys: Sequence[int]) -> set[int]:
+        """Return the subset of url_keys already stored, using set-based IN queries on the unique key index."""
+        found: set[int] = set()
+        try:
+            with self.read_engine.connect() as conn:
+                for start in range(0, len(keys), SQLITE_MAX_PARAMS):
+                    chunk = keys[start : start + SQLITE_MAX_PARAMS]
+                    found.update(conn.execute(select(Link.url_key).where(Link.url_key.in_(chunk))).scalars())
+            return found
+        except SQLAlchemyError as e:
+            msg = f"Database error while checking link existence: {e}"
+            raise DatabaseError(msg)
+
+    def create_links_bulk(
+        self,
+        links: Sequence[LinkCreate | dict | LinkImportResult],
+        chunk_size: int = 500,
+        check_existing: bool = True,
+        checkpoint: ImportCheckpoint | None = None,
+    ) -> list[LinkImportResult]:
+        """Create many links at once, returning one result per input row in order.
+
+        Rows are validated, de-duplicated by url_key within the batch and against the database, then
+        inserted with executemany in one transaction per chunk. LinkCreate rows are trusted as already
+        validated, and LinkImportResult rows (failures found while parsing the input) are passed through
+        as-is. Callers that already filtered out stored links can skip the existence query with check_existing.
+
+        With a checkpoint, the rows are written as a single chunk and the import session's progress and
+        failed rows are committed in the same transaction, so a resumed import never redoes them.
+        """
+        results: list[LinkImportResult] = []
+        seen: set[int] = set()
+        if checkpoint:
+            chunk_size = max(len(links), 1)
+
+        try:
+            for start in range(0, len(links), chunk_size):
+                chunk_results: list[LinkImportResult] = []
+                candidates: dict[int, tuple[int, LinkCreate]] = {}
+
+                for item in links[start : start + chunk_size]:
+                    if isinstance(item, LinkImportResult):
+                        chunk_results.append(item)
+                        continue
+                    try:
+                        link_data = item if isinstance(item, LinkCreate) else LinkCreate.model_validate(item)
+                    except PydanticValidationError as e:
+                        url = item.get("url") if isinstance(item, dict) else ""
+                        error = e.errors()[0]["msg"] if e.errors() else str(e)
+                        chunk_results.append(LinkImportResult(url=str(url or ""), status="invalid", error=error))
+                        continue
+
+                    if (key := url_key(link_data.url)) in seen:
+                        chunk_results.append(
+                            LinkImportResult(url=link_data.url, status="duplicate", error="Duplicate URL in input"),
+                        )
+                        continue
+
+                    seen.add(key)
+                    candidates[key] = (len(chunk_results), link_data)
+                    chunk_results.append(LinkImportResult(url=link_data.url, status="added"))
+
+                existing = self.existing_keys(list(candidates)) if check_existing else set()
+                now = datetime.now(UTC).isoformat()
+                rows = []
+                for key, (position, link_data) in candidates.items():
+                    if key in existing:
+                        chunk_results[position] = LinkImportResult(
+                            url=link_data.url, status="duplicate", error="Already exists"
+                        )
+                        continue
+                    rows.append(
+                        {
+                            "url": link_data.url,
+                            "url_key": key,
+                            "domain": extract_domain(url=link_data.url),
+                            "description": link_data.description,
+                            "tag": link_data.tag,
+                            "is_read": link_data.is_read,
+                            "preview_url": "",
+                            "created_at": link_data.created_at or now,
+                            "updated_at": now,
+                        },
+                    )
+
+                if rows or checkpoint:
+                    with self.engine.begin() as conn:
+                        if rows:
+                            # OR IGNORE skips rows stored concurrently since the existence check (or,
+                            # without check_existing, any stored row); those are reported as duplicates
+                            statement = insert(Link).prefix_with("OR IGNORE").returning(Link.id, Link.url_key)
+                            inserted = {key: link_id for link_id, key in conn.execute(statement, rows)}
+                            self._sync_link_tags(
+                                conn,
+                                [(inserted[row["url_key"]], row["tag"]) for row in rows if row["url_key"] in inserted],
+                                replace=False,
+                            )
+                        for row in rows:
+                            position = candidates[row["url_key"]][0]
+                            if (link_id := inserted.get(row["url_key"])) is None:
+                                chunk_results[position] = LinkImportResult(
+                                    url=row["url"], status="duplicate", error="Already exists"
+                                )
+                            else:
+                                chunk_results[position].link_id = link_id
+                        if checkpoint:
+                            self._save_import_checkpoint(conn, checkpoint, chunk_results)
+
+                results.extend(chunk_results)
+
+            return results
+
+        except SQLAlchemyError as e:
+            msg = f"Database error while creating links: {e}"
+            raise DatabaseError(msg)
+
+    @staticmethod
+    def _save_import_checkpoint(
+        conn: Connection,
+        checkpoint: ImportCheckpoint,
+        results: Sequence[LinkImportResult],
+    ) -> None:
+        """Record a batch's failed rows and advance its import session inside the batch's transaction."""
+        failures = [
+            {"session_id": checkpoint.session_id, "position": position, "url": result.url, "error": result.error}
+            for position, result in zip(checkpoint.positions, results, strict=True)
+            if result.status != "added"
+        ]
+        if failures:
+            conn.execute(insert(ImportFailure), failures)
+        conn.execute(
+            update(ImportSession)
+            .where(ImportSession.id == checkpoint.session_id)
+            .values(
+                rows_committed=checkpoint.rows_committed,
+                committed_ahead=dumps(checkpoint.committed_ahead),
+                added_count=ImportSession.added_count + len(results) - len(failures),
+                failed_count=ImportSession.failed_count + len(failures),
+                updated_at=datetime.now(UTC).isoformat(),
+            ),
+        )
+
+    def start_import_session(self, source_path: str, source_hash: str) -> ImportSession:
+        """Start tracking an import of a file.
+
+        Earlier sessions for the same contents are discarded, along with completed sessions of other
+        files, so only interrupted imports that can still be resumed are kept.
+        """
+        now = datetime.now(UTC).isoformat()
+        stale = or_(ImportSession.source_hash == source_hash, ImportSession.status == "completed")
+        try:
+            with self.get_session() as session:
+                stale_ids = select(ImportSession.id).where(stale)
+                session.execute(delete(ImportFailure).where(ImportFailure.session_id.in_(stale_ids)))
+                session.execute(delete(ImportSession).where(stale))
+                import_session = ImportSession(
+                    source_path=source_path,
+                    source_hash=source_hash,
+                    status="running",
+                    rows_committed=0,
+                    committed_ahead="[]",
+                    added_count=0,
+                    failed_count=0,
+                    created_at=now,
+                    updated_at=now,
+                )
+                session.add(import_session)
+                session.flush()
+                session.expunge(import_session)
+                return import_session
+        except SQLAlchemyError as e:
+            msg = f"Database error while starting import session: {e}"
+            raise DatabaseError(msg)
+
+    def get_unfinished_import_session(self, source_hash: str) -> ImportSession | None:
+        """Find the latest import of a file's contents that did not run to completion."""
+        try:
+            with self.get_read_session() as session:
+                import_session = (
+                    session.query(ImportSession)
+                    .filter(ImportSession.source_hash == source_hash, ImportSession.status == "running")
+                    .order_by(ImportSession.id.desc())
+                    .first()
+                )
+                if import_session:
+                    session.expunge(import_session)
+                return import_session
+        except SQLAlchemyError as e:
+            msg = f"Database error while looking up import session: {e}"
+            raise DatabaseError(msg)
+
+    def finish_import_session(self, session_id: int) -> ImportSession:
+        """Mark an import session completed and return its final totals."""
+        try:
+            with self.get_session() as session:
+                if not (import_session := session.get(ImportSession, session_id)):
+                    msg = f"Import session {session_id} not found"
+                    raise DatabaseError(msg)
+                import_session.status = "completed"
+                import_session.committed_ahead = "[]"
+                import_session.updated_at = datetime.now(UTC).isoformat()
+                session.flush()
+                session.expunge(import_session)
+                return import_session
+        except SQLAlchemyError as e:
+            msg = f"Database error while finishing import session: {e}"
+            raise DatabaseError(msg)
+
+    def get_import_failures(self, session_id: int, limit: int = 1000) -> list[ImportFailure]:
+        """Get the first failed rows of an import session in source order."""
+        try:
+            with self.get_read_session() as session:
+                failures = (
+                    session.query(ImportFailure)
+                    .filter(ImportFailure.session_id == session_id)
+                    .order_by(ImportFailure.position)
+                    .limit(limit)
+                    .all()
+                )
+                session.expunge_all()
+                return failures
+        except SQLAlchemyError as e:
+            msg = f"Database error while retrieving import failures: {e}"
+            raise DatabaseError(msg)
+
     def get_link(self, link_id: int) -> Link:
         """Get a link by ID."""
         try:
-            with self.get_session() as session:
+            with self.get_read_session() as session:
                 if not (link := session.query(Link).filter(Link.id == link_id).first()):
                     raise LinkNotFoundError(link_id)
                 session.expunge(link)  # Detach from session
                 return link
+        except LinKCoveryError:
+            raise
         except SQLAlchemyError as e:
             msg = f"Database error while retrieving link: {e}"
             raise DatabaseError(msg)
@@ -142,13 +817,10 @@ class DatabaseService:
             msg = f"Unexpected error while retrieving link: {e}"
             raise DatabaseError(msg)
 
-    def get_all_links(self) -> list[Link]:
+    def get_all_links(self) -> list[LinkRow]:
         """Get all links ordered by creation date."""
         try:
-            with self.get_session() as session:
-                for link in (links := session.query(Link).order_by(Link.created_at.desc()).all()):
-                    session.expunge(link)  # Detach from session
-                return links
+            return self._link_rows(select(*LINK_ROW_COLUMNS).order_by(Link.created_at.desc()))
         except SQLAlchemyError as e:
             msg = f"Database error while retrieving links: {e}"
             raise DatabaseError(msg)
@@ -156,14 +828,33 @@ class DatabaseService:
             msg = f"Unexpected error while retrieving links: {e}"
             raise DatabaseError(msg)
 
-    def get_links_paginated(self, offset: int = 0, limit: int = 50) -> list[Link]:
+    def get_links_paginated(self, offset: int = 0, limit: int = 50) -> list[LinkRow]:
         """Get links with pagination."""
         try:
-            with self.get_session() as session:
-                query = session.query(Link).order_by(Link.created_at.desc()).offset(offset).limit(limit)
-                for link in (links := query.all()):
-                    session.expunge(link)
-                return links
+            return self._link_rows(
+                select(*LINK_ROW_COLUMNS).order_by(Link.created_at.desc()).offset(offset).limit(limit),
+            )
+        except SQLAlchemyError as e:
+            msg = f"Database error while retrieving links: {e}"
+            raise DatabaseError(msg)
+        except Exception as e:
+            msg = f"Unexpected error while retrieving links: {e}"
+            raise DatabaseError(msg)
+
+    def get_links_page(self, cursor: str | None = None, limit: int = 50) -> tuple[list[LinkRow], str | None]:
+        """Get links after a keyset cursor, returning the page and the cursor for the next one.
+
+        Seeks on (created_at, id) through the created_at index, so deep pages cost the same as the first.
+        """
+        try:
+            query = select(*LINK_ROW_COLUMNS)
+            if cursor:
+                query = query.where(tuple_(Link.created_at, Link.id) < decode_cursor(cursor))
+
+            links = self._link_rows(query.order_by(Link.created_at.desc(), Link.id.desc()).limit(limit))
+            return links, encode_cursor(links[-1]) if len(links) == limit else None
+        except LinKCoveryError:
+            raise
         except SQLAlchemyError as e:
             msg = f"Database error while retrieving links: {e}"
             raise DatabaseError(msg)
@@ -171,17 +862,102 @@ class DatabaseService:
             msg = f"Unexpected error while retrieving links: {e}"
             raise DatabaseError(msg)
 
-    def search_links(self, filters: LinkFilter) -> list[Link]:
+    def iter_links(self, chunk_size: int = 1000) -> Generator[list[LinkRow]]:
+        """Yield every link newest first in chunks, keyset-paged so memory stays flat at any size."""
+        cursor = None
+        while True:
+            links, cursor = self.get_links_page(cursor=cursor, limit=chunk_size)
+            if links:
+                yield links
+            if not cursor:
+                return
+
+    def iter_link_urls(self, chunk_size: int = 10_000) -> Generator[list[tuple[int, str]]]:
+        """Yield (id, url) of every stored link in chunks, in id order."""
+        last_id = 0
+        try:
+            while True:
+                with self.read_engine.connect() as conn:
+                    rows = conn.execute(
+                        select(Link.id, Link.url).where(Link.id > last_id).order_by(Link.id).limit(chunk_size),
+                    ).all()
+                if not rows:
+                    return
+                last_id = rows[-1][0]
+                yield [(link_id, url) for link_id, url in rows]
+        except SQLAlchemyError as e:
+            msg = f"Database error while reading links: {e}"
+            raise DatabaseError(msg)
+
+    def iter_url_keys(self, chunk_size: int = 10_000) -> Generator[list[tuple[str, int | None]]]:
+        """Yield (url, url_key) of every stored link in chunks, paging by id."""
+        last_id = 0
+        try:
+            while True:
+                with self.read_engine.connect() as conn:
+                    rows = conn.execute(
+                        select(Link.id, Link.url, Link.url_key)
+                        .where(Link.id > last_id)
+                        .order_by(Link.id)
+                        .limit(chunk_size),
+                    ).all()
+                if not rows:
+                    return
+                last_id = rows[-1][0]
+                yield [(url, key) for _, url, key in rows]
+        except SQLAlchemyError as e:
+            msg = f"Database error while reading links: {e}"
+            raise DatabaseError(msg)
+
+    def count_links(self) -> int:
+        """Count stored links."""
+        try:
+            with self.read_engine.connect() as conn:
+                return conn.execute(select(func.count()).select_from(Link)).scalar_one()
+        except SQLAlchemyError as e:
+            msg = f"Database error while counting links: {e}"
+            raise DatabaseError(msg)
+
+    def iter_links_by_tag(self, chunk_size: int = 1000) -> Generator[list[LinkRow]]:
+        """Yield every link grouped by tag in chunks, oldest first within a tag.
+
+        Tags are visited in folder order, treating '/' as a path separator, so nested folders come out
+        together. Each tag is read by keyset on id through the tag index.
+        """
+        try:
+            with self.read_engine.connect() as conn:
+                tags = conn.execute(select(Link.tag).distinct()).scalars().all()
+
+            for tag in sorted(tags, key=lambda tag: tuple((tag or "").split("/"))):
+                last_id = 0
+                while True:
+                    query = select(*LINK_ROW_COLUMNS).where(Link.tag == tag, Link.id > last_id)
+                    links = self._link_rows(query.order_by(Link.id).limit(chunk_size))
+                    if not links:
+                        break
+                    yield links
+                    last_id = links[-1].id
+        except SQLAlchemyError as e:
+            msg = f"Database error while retrieving links: {e}"
+            raise DatabaseError(msg)
+
+    def search_links(self, filters: LinkFilter) -> list[LinkRow]:
         """Search links with filters using optimized queries."""
         try:
-            with self.get_session() as session:
-                query = session.query(Link)
+            query = select(*LINK_ROW_COLUMNS)
 
-                # Apply filters with optimized query patterns
-                conditions = []
+            # Apply filters with optimized query patterns
+            conditions = []
+            order_by = [Link.created_at.desc()]
 
-                if filters.query:
-                    # Use LIKE for text search, could be optimized with FTS if needed
+            if filters.query:
+                if fts_query := build_fts_query(filters.query):
+                    # Full-text match through the FTS5 index, best BM25 rank first
+                    query = query.join(links_fts, links_fts.c.rowid == Link.id)
+                    conditions.append(literal_column("links_fts").op("MATCH")(fts_query))
+                    order_by = [FTS_RANK, Link.created_at.desc()]
+                else:
+                    # Punctuation-only queries have no indexable tokens, fall back to LIKE
                     conditions.append(
                         or_(
                             Link.url.contains(filters.query),
@@ -190,28 +966,34 @@ class DatabaseService:
                         ),
                     )
 
-                if filters.domain:
-                    # Use indexed domain column
-                    conditions.append(Link.domain.contains(filters.domain))
+            if filters.domain:
+                # Use indexed domain column
+                conditions.append(Link.domain.contains(filters.domain))
+
+            if filters.tags:
+                # Exact tag match through the link_tags index: links with every tag, or with any of them
+                matching = select(LinkTag.link_id).join(Tag, Tag.id == LinkTag.tag_id).where(Tag.name.in_(filters.tags))
+                if not filters.any_tag:
+                    matching = matching.group_by(LinkTag.link_id).having(func.count() == len(filters.tags))
+                conditions.append(Link.id.in_(matching))
 
-                if filters.tag:
-                    # Use indexed tag column
-                    conditions.append(Link.tag.contains(filters.tag))
+            if filters.is_read is not None:
+                # Use indexed is_read column
+                conditions.append(Link.is_read == filters.is_read)
 
-                if filters.is_read is not None:
-                    # Use indexed is_read column
-                    conditions.append(Link.is_read == filters.is_read)
+            if filters.broken is not None:
+                # Unreachable (0) or error status from the last check; unchecked links are neither
+                broken = or_(Link.http_status == 0, Link.http_status >= 400)
+                conditions.append(broken if filters.broken else and_(Link.http_status.is_not(None), ~broken))
 
-                # Apply all conditions at once
-                if conditions:
-                    from sqlalchemy import and_
+            if filters.http_status is not None:
+                conditions.append(Link.http_status == filters.http_status)
 
-                    query = query.filter(and_(*conditions))
+            # Apply all conditions at once
+            if conditions:
+                query = query.where(and_(*conditions))
 
-                # Order by indexed created_at column and limit
-                for link in (links := query.order_by(Link.created_at.desc()).limit(filters.limit).all()):
-                    session.expunge(link)  # Detach from session
-                return links
+            return self._link_rows(query.order_by(*order_by).limit(filters.limit))
 
         except SQLAlchemyError as e:
             msg = f"Database error while searching links: {e}"
@@ -229,8 +1011,9 @@ class DatabaseService:
 
                 # Apply updates only for fields that were actually set
                 if "url" in (update_data := updates.model_dump(exclude_unset=True, exclude_none=True)):
-                    # Update domain if URL changed
+                    # Update domain and key if URL changed
                     link.domain = extract_domain(url=update_data["url"])
+                    link.url_key = url_key(update_data["url"])
                     link.url = update_data["url"]
 
                 for key, value in update_data.items():
@@ -241,9 +1024,13 @@ class DatabaseService:
                 link.updated_at = datetime.now(UTC).isoformat()
 
                 session.flush()
+                if "tag" in update_data:
+                    self._sync_link_tags(session.connection(), [(link.id, link.tag)])
                 session.expunge(link)  # Detach from session
                 return link
 
+        except LinKCoveryError:
+            raise
         except IntegrityError as e:
             if "UNIQUE constraint failed" in str(e):
                 raise LinkAlreadyExistsError(updates.url or "")
@@ -263,8 +1050,11 @@ class DatabaseService:
                 if not (link := session.query(Link).filter(Link.id == link_id).first()):
                     raise LinkNotFoundError(link_id)
 
+                session.execute(delete(LinkTag).where(LinkTag.link_id == link_id))
                 session.delete(link)
 
+        except LinKCoveryError:
+            raise
         except SQLAlchemyError as e:
             msg = f"Database error while deleting link: {e}"
             raise DatabaseError(msg)
@@ -272,22 +1062,17 @@ class DatabaseService:
             msg = f"Unexpected error while deleting link: {e}"
             raise DatabaseError(msg)
 
-    def get_random_links(self, limit: int = 5, unread_only: bool = True) -> list[Link]:
+    def get_random_links(self, limit: int = 5, unread_only: bool = True) -> list[LinkRow]:
         """Get random links from the database."""
         try:
-            with self.get_session() as session:
-                from sqlalchemy import func
-
-                query = session.query(Link)
+            query = select(*LINK_ROW_COLUMNS)
 
-                # Filter for unread links by default
-                if unread_only:
-                    query = query.filter(Link.is_read == False)  # noqa: E712
+            # Filter for unread links by default
+            if unread_only:
+                query = query.where(Link.is_read == False)  # noqa: E712
 
-                # Order randomly and limit
-                for link in (links := query.order_by(func.random()).limit(limit).all()):
-                    session.expunge(link)  # Detach from session
-                return links
+            # Order randomly and limit
+            return self._link_rows(query.order_by(func.random()).limit(limit))
 
         except SQLAlchemyError as e:
             msg = f"Database error while getting random links: {e}"
@@ -296,36 +1081,313 @@ class DatabaseService:
             msg = f"Unexpected error while getting random links: {e}"
             raise DatabaseError(msg)
 
-    def get_statistics(self) -> dict:
-        """Get database statistics with optimized queries."""
-        try:
-            with self.get_session() as session:
-                # Get counts efficiently with single query
-                total_links = session.query(Link).count()
-                read_links = session.query(Link).filter(Link.is_read == True).count()  # noqa: E712
-
-                # Get top domains efficiently with group by
-                from sqlalchemy import func
+    def get_statistics(self, top: int = 5) -> dict:
+        """Get link totals and the top domains and tags from the maintained counters.
 
-                domain_counts = (
-                    session.query(Link.domain, func.count(Link.domain).label("count"))
-                    .group_by(Link.domain)
-                    .order_by(func.count(Link.domain).desc())
-                    .all()
+        Reads a few rows of stat_counters instead of scanning links, so the cost does not grow with
+        the library: the totals by primary key, the top entries through the (kind, count) index.
+        """
+        try:
+            with self.read_engine.connect() as conn:
+                totals = dict(
+                    conn.execute(
+                        select(StatCounter.kind, StatCounter.count).where(
+                            StatCounter.kind.in_(("links", "read")),
+                            StatCounter.name == "",
+                        ),
+                    ).all(),
                 )
 
+                def top_counts(kind: str) -> list[tuple[str, int]]:
+                    query = (
+                        select(StatCounter.name, StatCounter.count)
+                        .where(StatCounter.kind == kind, StatCounter.count > 0)
+                        .order_by(StatCounter.count.desc(), StatCounter.name)
+                        .limit(top)
+                    )
+                    return [(name, count) for name, count in conn.execute(query)]
+
+                total_links = totals.get("links", 0)
+                read_links = totals.get("read", 0)
                 return {
                     "total_links": total_links,
                     "read_links": read_links,
                     "unread_links": total_links - read_links,
-                    "top_domains": [(domain, count) for domain, count in domain_counts],
+                    "top_domains": top_counts("domain"),
+                    "top_tags": top_counts("tag"),
                 }
 
         except SQLAlchemyError as e:
             msg = f"Database error while getting statistics: {e}"
             raise DatabaseError(msg)
-        except Exception as e:
-            msg = f"Unexpected error while getting statistics: {e}"
+
+    def iter_links_to_check(
+        self,
+        checked_before: str | None = None,
+        batch_size: int = 1000,
+    ) -> Generator[list[tuple[int, str]]]:
+        """Yield (id, url) batches of links never checked or last checked before the given ISO time.
+
+        Batches are read by keyset on id, so results written back while iterating do not shift later pages.
+        """
+        last_id = 0
+        try:
+            while True:
+                query = select(Link.id, Link.url).where(Link.id > last_id)
+                if checked_before:
+                    query = query.where(or_(Link.checked_at.is_(None), Link.checked_at < checked_before))
+                with self.read_engine.connect() as conn:
+                    rows = conn.execute(query.order_by(Link.id).limit(batch_size)).all()
+                if not rows:
+                    return
+                yield [(row.id, row.url) for row in rows]
+                last_id = rows[-1].id
+        except SQLAlchemyError as e:
+            msg = f"Database error while reading links to check: {e}"
+            raise DatabaseError(msg)
+
+    def count_links_to_check(self, checked_before: str | None = None) -> int:
+        """Count links never checked or last checked before the given ISO time."""
+        query = select(func.count()).select_from(Link)
+        if checked_before:
+            query = query.where(or_(Link.checked_at.is_(None), Link.checked_at < checked_before))
+        try:
+            with self.read_engine.connect() as conn:
+                return conn.execute(query).scalar_one()
+        except SQLAlchemyError as e:
+            msg = f"Database error while counting links to check: {e}"
+            raise DatabaseError(msg)
+
+    def record_check_results(self, results: Sequence[LinkCheckResult]) -> None:
+        """Store link check results in a single transaction."""
+        if not results:
+            return
+
+        rows = [
+            {
+                "id": result.link_id,
+                "http_status": result.http_status,
+                "final_url": result.final_url,
+                "latency_ms": result.latency_ms,
+                "checked_at": result.checked_at,
+            }
+            for result in results
+        ]
+        try:
+            with self.get_session() as session:
+                # Bulk UPDATE by primary key, sent as one executemany
+                session.execute(update(Link), rows)
+        except SQLAlchemyError as e:
+            msg = f"Database error while saving link checks: {e}"
+            raise DatabaseError(msg)
+
+    def apply_normalization(self, changes: Sequence[NormalizeChange], merges: Sequence[Sequence[int]]) -> None:
+        """Rewrite normalized URLs and fold merged links into their keeper, all in one transaction.
+
+        Each merge is a group of link ids whose normalized URLs share a url_key, the keeper first. The
+        keeper takes the first description and tag found in the group where its own are empty, and is
+        read if any link in the group was. The other links and their queued jobs are deleted before the
+        keeper and the URLs are rewritten, so no update collides with the unique URL and key indexes,
+        and the keeper takes the group's key even if a merged link held it.
+        """
+        now = datetime.now(UTC).isoformat()
+        try:
+            with self.get_session() as session:
+                if merges:
+                    merged_ids = [link_id for group in merges for link_id in group[1:]]
+                    rows: dict[int, Row] = {}
+                    group_ids = [link_id for group in merges for link_id in group]
+                    for start in range(0, len(group_ids), SQLITE_MAX_PARAMS):
+                        chunk = group_ids[start : start + SQLITE_MAX_PARAMS]
+                        query = select(Link.id, Link.url, Link.description, Link.tag, Link.is_read).where(
+                            Link.id.in_(chunk)
+                        )
+                        rows.update((row.id, row) for row in session.execute(query))
+
+                    keepers = []
+                    for keeper_id, *others in merges:
+                        if keeper_id not in rows:
+                            continue
+                        group = [rows[link_id] for link_id in (keeper_id, *others) if link_id in rows]
+                        keepers.append(
+                            {
+                                "id": keeper_id,
+                                "url_key": url_key(rows[keeper_id].url),
+                                "description": next((row.description for row in group if row.description), ""),
+                                "tag": next((row.tag for row in group if row.tag), ""),
+                                "is_read": any(row.is_read for row in group),
+                                "updated_at": now,
+                            },
+                        )
+
+                    for start in range(0, len(merged_ids), SQLITE_MAX_PARAMS):
+                        chunk = merged_ids[start : start + SQLITE_MAX_PARAMS]
+                        session.execute(delete(EnrichmentJob).where(EnrichmentJob.link_id.in_(chunk)))
+                        session.execute(delete(LinkTag).where(LinkTag.link_id.in_(chunk)))
+                        session.execute(delete(Link).where(Link.id.in_(chunk)))
+
+                    session.execute(update(Link), keepers)
+                    self._sync_link_tags(session.connection(), [(keeper["id"], keeper["tag"]) for keeper in keepers])
+
+                if changes:
+                    # Bulk UPDATE by primary key, sent as one executemany
+                    session.execute(
+                        update(Link),
+                        [
+                            {
+                                "id": change.link_id,
+                                "url": change.normalized_url,
+                                "url_key": url_key(change.normalized_url),
+                                "domain": extract_domain(url=change.normalized_url),
+                                "updated_at": now,
+                            }
+                            for change in changes
+                        ],
+                    )
+        except IntegrityError as e:
+            msg = f"Database constraint error while normalizing links: {e}"
+            raise DatabaseError(msg)
+        except SQLAlchemyError as e:
+            msg = f"Database error while normalizing links: {e}"
+            raise DatabaseError(msg)
+
+    def enqueue_jobs(self, links: Sequence[tuple[int, str]], kinds: Sequence[str]) -> int:
+        """Queue enrichment jobs for (link_id, url) pairs, resetting any existing job of the same kind.
+
+        Links whose URL is too malformed to fetch are skipped, so one bad row does not hold back the
+        rest of the batch. Returns the number of jobs queued.
+        """
+        if not links or not kinds:
+            return 0
+
+        now = datetime.now(UTC).isoformat()
+        rows = []
+        for link_id, url in links:
+            try:
+                host = extract_domain(url=url)
+            except ValueError:
+                continue  # Kept without a description or preview, as when an import cannot fetch it
+            rows.extend(
+                {
+                    "link_id": link_id,
+                    "kind": kind,
+                    "host": host,
+                    "status": "pending",
+                    "attempts": 0,
+                    "last_error": "",
+                    "run_after": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for kind in kinds
+            )
+        if not rows:
+            return 0
+
+        statement = sqlite_insert(EnrichmentJob)
+        statement = statement.on_conflict_do_update(
+            index_elements=["link_id", "kind"],
+            set_={"status": "pending", "attempts": 0, "last_error": "", "run_after": now, "updated_at": now},
+        )
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(statement, rows)
+            return len(rows)
+        except SQLAlchemyError as e:
+            msg = f"Database error while queueing enrichment jobs: {e}"
+            raise DatabaseError(msg)
+
+    def claim_jobs(self, limit: int, per_host_limit: int, host_load: dict[str, int]) -> list[EnrichmentJob]:
+        """Claim up to limit due jobs, keeping each host under per_host_limit including jobs in flight."""
+        now = datetime.now(UTC).isoformat()
+        try:
+            with self.get_session() as session:
+                candidates = (
+                    session.query(EnrichmentJob)
+                    .filter(EnrichmentJob.status == "pending", EnrichmentJob.run_after <= now)
+                    .order_by(EnrichmentJob.run_after, EnrichmentJob.id)
+                    .limit(limit * 4)
+                    .all()
+                )
+
+                claimed: list[EnrichmentJob] = []
+                load = dict(host_load)
+                for job in candidates:
+                    if len(claimed) >= limit:
+                        break
+                    if load.get(job.host, 0) >= per_host_limit:
+                        continue
+                    load[job.host] = load.get(job.host, 0) + 1
+                    job.status = "running"
+                    job.attempts += 1
+                    job.claimed_at = now
+                    job.updated_at = now
+                    claimed.append(job)
+
+                session.flush()
+                for job in claimed:
+                    session.expunge(job)
+                return claimed
+        except SQLAlchemyError as e:
+            msg = f"Database error while claiming enrichment jobs: {e}"
+            raise DatabaseError(msg)
+
+    def complete_job(self, job_id: int) -> None:
+        """Remove a finished job from the queue."""
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(EnrichmentJob).where(EnrichmentJob.id == job_id))
+        except SQLAlchemyError as e:
+            msg = f"Database error while completing enrichment job: {e}"
+            raise DatabaseError(msg)
+
+    def fail_job(self, job: EnrichmentJob, error: str, max_attempts: int, retry_delay: int) -> None:
+        """Reschedule a failed job with exponential backoff, or park it once out of attempts."""
+        now = datetime.now(UTC)
+        values = {"last_error": error, "updated_at": now.isoformat()}
+        if job.attempts >= max_attempts:
+            values["status"] = "failed"
+        else:
+            values["status"] = "pending"
+            values["run_after"] = (now + timedelta(seconds=retry_delay * 2 ** (job.attempts - 1))).isoformat()
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(update(EnrichmentJob).where(EnrichmentJob.id == job.id).values(**values))
+        except SQLAlchemyError as e:
+            msg = f"Database error while rescheduling enrichment job: {e}"
+            raise DatabaseError(msg)
+
+    def requeue_running_jobs(self, claimed_before: str) -> int:
+        """Return jobs left running by a worker that exited uncleanly to the queue.
+
+        Only jobs claimed before the claimed_before ISO cutoff are requeued, so the jobs another live
+        worker has in flight are left alone.
+        """
+        try:
+            with self.engine.begin() as conn:
+                result = conn.execute(
+                    update(EnrichmentJob)
+                    .where(
+                        EnrichmentJob.status == "running",
+                        or_(EnrichmentJob.claimed_at.is_(None), EnrichmentJob.claimed_at < claimed_before),
+                    )
+                    .values(status="pending", claimed_at=None),
+                )
+                return result.rowcount
+        except SQLAlchemyError as e:
+            msg = f"Database error while requeueing enrichment jobs: {e}"
+            raise DatabaseError(msg)
+
+    def count_jobs(self) -> dict[str, int]:
+        """Count queued enrichment jobs by status."""
+        try:
+            with self.read_engine.connect() as conn:
+                rows = conn.execute(
+                    select(EnrichmentJob.status, func.count()).group_by(EnrichmentJob.status),
+                ).all()
+                return dict(rows)
+        except SQLAlchemyError as e:
+            msg = f"Database error while counting enrichment jobs: {e}"
             raise DatabaseError(msg)
 
 
@@ -339,3 +1401,52 @@ def get_database() -> DatabaseService:
     if _db_service is None:
         _db_service = DatabaseService()
     return _db_service
+
+
+class AsyncDatabaseService:
+    """Awaitable access to DatabaseService for code running on an event loop.
+
+    Calls run on dedicated threads instead of the loop: writes on a single thread, matching the single
+    write connection, and reads on one thread per read connection. Requests queue on these executors
+    rather than on the default thread pool that FastAPI and to_thread share with everything else.
+    """
+
+    def __init__(self, db: DatabaseService | None = None) -> None:
+        """Initialize the executors over a database service."""
+        self.db = db or get_database()
+        read_threads = get_config().db_read_pool_size or cpu_count() or 1
+        self._reads = ThreadPoolExecutor(max_workers=read_threads, thread_name_prefix="linkcovery-db-read")
+        self._writes = ThreadPoolExecutor(max_workers=1, thread_name_prefix="linkcovery-db-write")
+
+    async def read(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a call that only reads the database on a read thread."""
+        return await get_running_loop().run_in_executor(self._reads, partial(func, *args, **kwargs))
+
+    async def write(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a call that writes to the database on the write thread."""
+        return await get_running_loop().run_in_executor(self._writes, partial(func, *args, **kwargs))
+
+    def close(self) -> None:
+        """Wait for queued calls to finish and stop the threads."""
+        self._reads.shutdown()
+        self._writes.shutdown()
+
+
+# Global async database service instance
+_async_db_service: AsyncDatabaseService | None = None
+
+
+def get_async_database() -> AsyncDatabaseService:
+    """Get the global async database service instance."""
+    global _async_db_service
+    if _async_db_service is None:
+        _async_db_service = AsyncDatabaseService()
+    return _async_db_service
+
+
+def close_async_database() -> None:
+    """Stop the global async database service's threads, if it was started."""
+    global _async_db_service
+    if _async_db_service is not None:
+        _async_db_service.close()
+        _async_db_service = None
@@ -0,0 +1,53 @@
+"""Shared HTTP client management for LinkCovery."""
+
+from asyncio import AbstractEventLoop, get_running_loop
+from asyncio import run as asyncio_run
+from collections.abc import Coroutine
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from httpx import AsyncClient, Limits
+
+from linkcovery.core.config import get_config
+
+# httpx connection pools are bound to the event loop they were opened on, so keep one client per loop
+_clients: WeakKeyDictionary[AbstractEventLoop, AsyncClient] = WeakKeyDictionary()
+
+
+def get_http_client() -> AsyncClient:
+    """Get the pooled HTTP client for the running event loop, creating it on first use."""
+    loop = get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        config = get_config()
+        client = AsyncClient(
+            timeout=config.fetch_timeout,
+            follow_redirects=True,
+            verify=False,
+            http2=True,
+            limits=Limits(
+                max_connections=config.http_max_connections,
+                max_keepalive_connections=config.http_max_keepalive_connections,
+                keepalive_expiry=config.http_keepalive_expiry,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the HTTP client of the running event loop, releasing its pooled connections."""
+    if (client := _clients.pop(get_running_loop(), None)) is not None:
+        await client.aclose()
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine in a new event loop, closing that loop's HTTP client when it finishes."""
+
+    async def runner() -> Any:
+        try:
+            return await coro
+        finally:
+            await close_http_client()
+
+    return asyncio_run(runner())
@@ -0,0 +1,158 @@
+"""Incremental JSON array and JSON Lines readers for LinkCovery."""
+
+from codecs import getincrementaldecoder
+from collections.abc import Iterator
+from json import JSONDecodeError, JSONDecoder, loads
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import ValidationError as PydanticValidationError
+
+from linkcovery.core.models import LinkCreate
+
+WHITESPACE = " \t\n\r"
+
+# An item still failing to parse after this many buffered characters is treated as malformed
+MAX_ITEM_CHARS = 16 * 1024 * 1024
+
+
+class JsonArrayReader:
+    """Yield the items of a top-level JSON array one at a time, reading the file in fixed-size chunks.
+
+    Only the current chunk and the item being decoded are held in memory, so files of any size can be
+    read in constant memory. position tracks the bytes read so far for progress reporting.
+    """
+
+    def __init__(self, file: IO[bytes], chunk_size: int = 1024 * 1024) -> None:
+        """Initialize the reader over a binary file object."""
+        self.file = file
+        self.chunk_size = chunk_size
+        self.position = 0
+        self.count = 0
+        self._decoder = JSONDecoder()
+        self._text = getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._offset = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        """Append the next chunk to the buffer, dropping what was already parsed. Returns False at EOF."""
+        if self._eof:
+            return False
+        data = self.file.read(self.chunk_size)
+        self.position += len(data)
+        self._eof = not data
+        self._buffer = self._buffer[self._offset :] + self._text.decode(data, final=self._eof)
+        self._offset = 0
+        return not self._eof
+
+    def _next_char(self) -> str:
+        """Skip whitespace and return the next significant character, or "" at EOF."""
+        while True:
+            while self._offset < len(self._buffer) and self._buffer[self._offset] in WHITESPACE:
+                self._offset += 1
+            if self._offset < len(self._buffer):
+                return self._buffer[self._offset]
+            if not self._read():
+                return ""
+
+    def _error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self._buffer, self._offset)
+
+    def _decode_item(self) -> Any:
+        """Decode the value at the current offset, reading more of the file until it is complete."""
+        while True:
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._offset)
+                # A value running to the end of the buffer (e.g. a number) may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._offset = end
+                    return item
+            except JSONDecodeError:
+                if self._eof or len(self._buffer) - self._offset > MAX_ITEM_CHARS:
+                    raise
+            self._read()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the array items."""
+        if self._next_char() != "[":
+            msg = "Expecting '[' at the start of a JSON array"
+            raise self._error(msg)
+        self._offset += 1
+
+        if self._next_char() == "]":
+            return
+
+        while True:
+            if not self._next_char():
+                msg = "Unexpected end of file inside JSON array"
+                raise self._error(msg)
+            yield self._decode_item()
+            self.count += 1
+
+            separator = self._next_char()
+            self._offset += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                msg = "Expecting ',' or ']' after array item"
+                raise self._error(msg)
+
+
+def link_fields(link_data: Any) -> dict:
+    """Pick the importable fields out of one exported link object."""
+    if not isinstance(link_data, dict):
+        return {"url": ""}
+    return {
+        "url": link_data.get("url") or "",
+        "description": link_data.get("description") or "",
+        "tag": link_data.get("tag", ""),
+        "is_read": link_data.get("is_read", False),
+        "created_at": link_data.get("created_at") or None,
+    }
+
+
+def line_ranges(file_path: Path, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Split a file into (start, end) byte ranges of about chunk_size that begin and end on line boundaries."""
+    size = file_path.stat().st_size
+    with open(file_path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()  # Extend the range to the end of the line it would otherwise split
+            end = f.tell()
+            yield start, end
+            start = end
+
+
+def parse_link_lines(file_path: Path, start: int, end: int) -> list[tuple[bool, dict]]:
+    """Parse and validate the JSON Lines link records in a byte range of a file.
+
+    Runs in worker processes, so it only returns plain data: (True, link fields) for a valid record,
+    or (False, {"url": ..., "error": ...}) for a line that is not valid JSON or not a valid link.
+    """
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    records: list[tuple[bool, dict]] = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            fields = link_fields(loads(line))
+        except ValueError as e:
+            records.append((False, {"url": "", "error": f"Invalid JSON: {e}"}))
+            continue
+        try:
+            records.append((True, LinkCreate.model_validate(fields).model_dump()))
+        except PydanticValidationError as e:
+            error = e.errors()[0]["msg"] if e.errors() else str(e)
+            records.append((False, {"url": str(fields["url"]), "error": error}))
+    return records
+
+
+def parse_link_range(file_path: Path, byte_range: tuple[int, int]) -> list[tuple[bool, dict]]:
+    """parse_link_lines over a (start, end) range from line_ranges, as a picklable single-argument pool task."""
+    start, end = byte_range
+    return parse_link_lines(file_path, start, end)
@@ -0,0 +1,195 @@
+"""Persistent page metadata cache for LinkCovery."""
+
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import NamedTuple
+
+from linkcovery.core.config import get_config
+from linkcovery.core.models import PageMetadata
+
+# Hosts that keep timing out are retried after base * 2^(failures - 1) seconds, up to a day
+MAX_HOST_BACKOFF = 86_400
+
+# Evict once every this many writes instead of on each one
+PRUNE_EVERY = 500
+
+SCHEMA_SQL = (
+    """CREATE TABLE IF NOT EXISTS metadata (
+        key TEXT PRIMARY KEY,
+        url TEXT NOT NULL,
+        title TEXT NOT NULL DEFAULT '',
+        description TEXT NOT NULL DEFAULT '',
+        image_url TEXT NOT NULL DEFAULT '',
+        canonical_url TEXT NOT NULL DEFAULT '',
+        etag TEXT NOT NULL DEFAULT '',
+        last_modified TEXT NOT NULL DEFAULT '',
+        complete INTEGER NOT NULL DEFAULT 0,
+        fetched_at REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_metadata_fetched_at ON metadata (fetched_at)",
+    """CREATE TABLE IF NOT EXISTS host_failures (
+        host TEXT PRIMARY KEY,
+        failures INTEGER NOT NULL,
+        retry_after REAL NOT NULL
+    )""",
+)
+
+
+class CachedMetadata(NamedTuple):
+    """A cached metadata entry with the validators needed to revalidate it."""
+
+    metadata: PageMetadata
+    etag: str
+    last_modified: str
+    complete: bool
+    fetched_at: float
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        """Whether the entry can be served without contacting the origin."""
+        return time() - self.fetched_at < ttl_seconds
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating the entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MetadataCache:
+    """SQLite-backed metadata cache keyed by normalized URL, with a negative cache for dead hosts."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (or create) the cache database."""
+        config = get_config()
+        self.path = path or config.get_cache_dir() / "metadata.db"
+        self.ttl_seconds = config.metadata_cache_ttl_hours * 3600
+        self.max_entries = config.metadata_cache_max_entries
+        self.failure_backoff = config.fetch_failure_backoff
+
+        self._lock = Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA_SQL:
+            self._conn.execute(statement)
+        self.prune()
+
+    def get(self, key: str) -> CachedMetadata | None:
+        """Get a cached entry, fresh or stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, title, description, image_url, canonical_url, etag, last_modified, complete, fetched_at "
+                "FROM metadata WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, title, description, image_url, canonical_url, etag, last_modified, complete, fetched_at = row
+        return CachedMetadata(
+            metadata=PageMetadata(
+                url=url,
+                title=title,
+                description=description,
+                image_url=image_url,
+                canonical_url=canonical_url,
+                fetched=True,
+            ),
+            etag=etag,
+            last_modified=last_modified,
+            complete=bool(complete),
+            fetched_at=fetched_at,
+        )
+
+    def put(
+        self,
+        key: str,
+        metadata: PageMetadata,
+        etag: str = "",
+        last_modified: str = "",
+        complete: bool = True,
+    ) -> None:
+        """Store freshly fetched metadata and its validators."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata "
+                "(key, url, title, description, image_url, canonical_url, etag, last_modified, complete, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    metadata.url,
+                    metadata.title,
+                    metadata.description,
+                    metadata.image_url,
+                    metadata.canonical_url,
+                    etag,
+                    last_modified,
+                    int(complete),
+                    time(),
+                ),
+            )
+            self._writes += 1
+        if self._writes % PRUNE_EVERY == 0:
+            self.prune()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as fresh again after a 304 Not Modified."""
+        with self._lock:
+            self._conn.execute("UPDATE metadata SET fetched_at = ? WHERE key = ?", (time(), key))
+
+    def host_blocked(self, host: str) -> bool:
+        """Whether a host is still backing off after repeated failures."""
+        with self._lock:
+            row = self._conn.execute("SELECT retry_after FROM host_failures WHERE host = ?", (host,)).fetchone()
+        return row is not None and row[0] > time()
+
+    def record_host_failure(self, host: str) -> None:
+        """Record a timeout or connection failure, doubling the host's backoff."""
+        with self._lock:
+            row = self._conn.execute("SELECT failures FROM host_failures WHERE host = ?", (host,)).fetchone()
+            failures = (row[0] if row else 0) + 1
+            backoff = min(self.failure_backoff * 2 ** (failures - 1), MAX_HOST_BACKOFF)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO host_failures (host, failures, retry_after) VALUES (?, ?, ?)",
+                (host, failures, time() + backoff),
+            )
+
+    def record_host_success(self, host: str) -> None:
+        """Clear a host's failure history."""
+        with self._lock:
+            self._conn.execute("DELETE FROM host_failures WHERE host = ?", (host,))
+
+    def prune(self) -> None:
+        """Evict long-expired entries, then the oldest ones beyond max_entries."""
+        with self._lock:
+            # Stale entries stay around for a while as they can still be revalidated cheaply
+            self._conn.execute("DELETE FROM metadata WHERE fetched_at < ?", (time() - 4 * self.ttl_seconds,))
+            self._conn.execute(
+                "DELETE FROM metadata WHERE key IN "
+                "(SELECT key FROM metadata ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.execute("DELETE FROM host_failures WHERE retry_after < ?", (time() - MAX_HOST_BACKOFF,))
+
+    def clear(self) -> None:
+        """Remove every cached entry and host failure."""
+        with self._lock:
+            self._conn.execute("DELETE FROM metadata")
+            self._conn.execute("DELETE FROM host_failures")
+
+
+# Global metadata cache instance
+_metadata_cache: MetadataCache | None = None
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Get the global metadata cache instance."""
+    global _metadata_cache
+    if _metadata_cache is None:
+        _metadata_cache = MetadataCache()
+    return _metadata_cache
@@ -1,9 +1,11 @@
 """Database and data models for LinKCovery."""
 
+from datetime import UTC, datetime
+from typing import Any, Literal, NamedTuple
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import Boolean, Column, Index, Integer, String
+from sqlalchemy import Boolean, Column, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -17,11 +19,19 @@ class Link(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     url = Column(String, nullable=False, unique=True)
+    # url_key of the URL, unique so spellings of the same link are stored once; NULL only for rows
+    # that predate the column and duplicate an older row's key
+    url_key = Column(Integer, nullable=True)
     domain = Column(String, nullable=False, index=True)
     description = Column(String, nullable=True, default="")
     tag = Column(String, nullable=False, default="", index=True)
     is_read = Column(Boolean, default=False, index=True)
     preview_url = Column(String, nullable=True, default="")
+    # Last liveness check: status is 0 when the host could not be reached
+    http_status = Column(Integer, nullable=True, index=True)
+    final_url = Column(String, nullable=True, default="")
+    latency_ms = Column(Integer, nullable=True)
+    checked_at = Column(String, nullable=True, index=True)
     created_at = Column(String, nullable=False, index=True)
     updated_at = Column(String, nullable=False)
 
@@ -30,12 +40,126 @@ class Link(Base):
         Index("idx_domain_is_read", "domain", "is_read"),
         Index("idx_tag_is_read", "tag", "is_read"),
         Index("idx_created_at_desc", "created_at"),
+        Index("ux_links_url_key", "url_key", unique=True),
     )
 
     def __repr__(self) -> str:
         return f"<Link(id={self.id}, url='{self.url}', domain='{self.domain}')>"
 
 
+# Database model for pending background enrichment work
+class EnrichmentJob(Base):
+    """SQLAlchemy model for a queued link enrichment job."""
+
+    __tablename__ = "enrichment_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    link_id = Column(Integer, nullable=False)
+    kind = Column(String, nullable=False)  # one of JOB_KINDS
+    host = Column(String, nullable=False, default="")
+    status = Column(String, nullable=False, default="pending")  # pending, running or failed
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=False, default="")
+    run_after = Column(String, nullable=False)
+    # When a worker took the job; a job running much longer than a fetch belongs to a worker that died
+    claimed_at = Column(String, nullable=True)
+    created_at = Column(String, nullable=False)
+    updated_at = Column(String, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("link_id", "kind", name="uq_job_link_kind"),
+        Index("idx_job_status_run_after", "status", "run_after"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EnrichmentJob(id={self.id}, link_id={self.link_id}, kind='{self.kind}', status='{self.status}')>"
+
+
+# Database model for tracking file imports so an interrupted one can be resumed
+class ImportSession(Base):
+    """SQLAlchemy model for one import of a source file and its last committed checkpoint."""
+
+    __tablename__ = "import_sessions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_path = Column(String, nullable=False)
+    source_hash = Column(String, nullable=False, index=True)  # SHA-256 of the file contents
+    status = Column(String, nullable=False, default="running")  # running or completed
+    # Every input row up to rows_committed is committed, plus the rows listed in committed_ahead
+    rows_committed = Column(Integer, nullable=False, default=0)
+    committed_ahead = Column(String, nullable=False, default="[]")  # JSON list of row positions
+    added_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(String, nullable=False)
+    updated_at = Column(String, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ImportSession(id={self.id}, status='{self.status}', rows_committed={self.rows_committed})>"
+
+
+# Database model for rows of an import that were not added
+class ImportFailure(Base):
+    """SQLAlchemy model for one failed row of an import session."""
+
+    __tablename__ = "import_failures"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(Integer, nullable=False)
+    position = Column(Integer, nullable=False)  # 1-based row number in the source file
+    url = Column(String, nullable=False, default="")
+    error = Column(String, nullable=False, default="")
+
+    __table_args__ = (Index("idx_import_failure_session_position", "session_id", "position"),)
+
+
+# Database model for the distinct tag names used by links
+class Tag(Base):
+    """SQLAlchemy model for a normalized tag name."""
+
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False, unique=True)  # as returned by parse_tags
+
+    def __repr__(self) -> str:
+        return f"<Tag(id={self.id}, name='{self.name}')>"
+
+
+# Join table mirroring each link's comma-separated tag string, kept in sync on every write
+class LinkTag(Base):
+    """SQLAlchemy model linking a link to one of its tags."""
+
+    __tablename__ = "link_tags"
+
+    link_id = Column(Integer, primary_key=True)
+    tag_id = Column(Integer, primary_key=True)
+
+    # Tag filters start from the tag, then read its links in id order
+    __table_args__ = (Index("idx_link_tags_tag_link", "tag_id", "link_id"),)
+
+
+# Database model for library counters, kept up to date by triggers on links and link_tags
+class StatCounter(Base):
+    """SQLAlchemy model for one maintained count: all links, read links, or links per domain or tag."""
+
+    __tablename__ = "stat_counters"
+
+    kind = Column(String, primary_key=True)  # "links", "read", "domain" or "tag"
+    name = Column(String, primary_key=True)  # domain or tag name; "" for the totals
+    count = Column(Integer, nullable=False, default=0)
+
+    # Top-k reads walk this index from the largest count down, ties by name
+    __table_args__ = (Index("idx_stat_counters_kind_count_name", kind, count.desc(), name),)
+
+
+def parse_tags(tag: str | None) -> list[str]:
+    """Split a link's comma-separated tag string into distinct, lowercased tag names."""
+    return list(dict.fromkeys(name for part in (tag or "").split(",") if (name := part.strip().lower())))
+
+
+JOB_KINDS = ("description", "preview", "canonical")
+
+
 # Schema for link services
 class LinkCreate(BaseModel):
     """Pydantic model for creating new links."""
@@ -44,6 +168,7 @@ class LinkCreate(BaseModel):
     description: str = Field("", description="Optional description for the link")
     tag: str = Field("", description="Tag to categorize the link")
     is_read: bool = Field(False, description="Whether the link has been read")
+    created_at: str | None = Field(None, description="Original creation time (ISO 8601 or Unix epoch), defaults to now")
 
     @field_validator("url")
     @classmethod
@@ -75,6 +200,21 @@ class LinkCreate(BaseModel):
         """Validate and clean description and tag."""
         return v.strip() if v else ""
 
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def validate_created_at(cls, v: Any) -> str | None:
+        """Normalize an ISO 8601 string or Unix epoch to a UTC ISO timestamp; anything else means now."""
+        try:
+            if isinstance(v, int | float) and not isinstance(v, bool):
+                return datetime.fromtimestamp(v, UTC).isoformat()
+            if isinstance(v, str) and v.strip():
+                parsed = datetime.fromisoformat(v.strip())
+                # Timestamps without an offset are taken to be UTC, like the ones LinkCovery stores
+                return (parsed.astimezone(UTC) if parsed.tzinfo else parsed.replace(tzinfo=UTC)).isoformat()
+        except (ValueError, OverflowError, OSError):
+            pass
+        return None
+
 
 class LinkUpdate(BaseModel):
     """Pydantic model for updating existing links."""
@@ -127,13 +267,105 @@ class LinkFilter(BaseModel):
 
     query: str = Field("", description="Search query for URL, description, or tags")
     domain: str = Field("", description="Filter by domain")
-    tag: str = Field("", description="Filter by tag")
+    tags: list[str] = Field([], description="Filter by these exact tags")
+    any_tag: bool = Field(False, description="Match links with any of the tags instead of all of them")
     is_read: bool | None = Field(None, description="Filter by read status")
+    broken: bool | None = Field(None, description="Filter by whether the last check found the link broken")
+    http_status: int | None = Field(None, description="Filter by HTTP status of the last check")
     limit: int = Field(50, description="Maximum number of results", ge=1, le=1000)
 
+    @field_validator("tags")
+    @classmethod
+    def validate_tags(cls, v: list[str]) -> list[str]:
+        """Normalize tag filters like stored tags, splitting any comma-separated entries."""
+        return parse_tags(",".join(v))
+
+
+class LinkImportResult(BaseModel):
+    """Pydantic model for the outcome of one row in a bulk insert."""
+
+    url: str = Field("", description="The URL as given in the input row")
+    status: Literal["added", "duplicate", "invalid"] = Field(..., description="What happened to the row")
+    error: str = Field("", description="Why the row was not added")
+    link_id: int | None = Field(None, description="ID of the created link")
+
+
+class ImportCheckpoint(BaseModel):
+    """Pydantic model for the import session state to commit together with one batch of rows."""
+
+    session_id: int = Field(..., description="ID of the import session")
+    positions: list[int] = Field(..., description="Source row position of each row in the batch")
+    rows_committed: int = Field(..., description="Rows up to this position are committed once the batch is")
+    committed_ahead: list[int] = Field([], description="Committed positions past rows_committed")
+
+
+class LinkCheckResult(BaseModel):
+    """Pydantic model for the outcome of checking whether a link is still alive."""
+
+    link_id: int = Field(..., description="ID of the checked link")
+    url: str = Field(..., description="The URL that was checked")
+    http_status: int | None = Field(
+        0, description="Final HTTP status, 0 when the host could not be reached, None when the link was skipped"
+    )
+    final_url: str = Field("", description="URL after following redirects")
+    latency_ms: int = Field(0, description="Time taken by the check in milliseconds")
+    error: str = Field("", description="Why the request failed")
+    checked_at: str = Field(..., description="When the check ran (ISO 8601)")
+
+    @property
+    def broken(self) -> bool:
+        """Whether the link is unreachable or answered with an error status."""
+        return is_broken_status(self.http_status)
+
+    @property
+    def skipped(self) -> bool:
+        """Whether the link was not requested because its host had stopped answering."""
+        return self.http_status is None
+
+
+def is_broken_status(http_status: int | None) -> bool:
+    """Whether a checked HTTP status means the link is dead."""
+    return http_status is not None and (http_status == 0 or http_status >= 400)
+
+
+class NormalizeChange(NamedTuple):
+    """A stored link's URL and the URL it normalizes to."""
+
+    link_id: int
+    url: str
+    normalized_url: str
 
-class LinkExport(BaseModel):
-    """Pydantic model for exporting link data."""
+
+class NormalizeResult(BaseModel):
+    """Pydantic model for the outcome of normalizing every stored link."""
+
+    scanned: int = Field(0, description="Links read")
+    updated: list[NormalizeChange] = Field([], description="Links whose URL is rewritten")
+    conflicts: list[list[NormalizeChange]] = Field(
+        [],
+        description="Groups of links that normalize to the same URL, the link that keeps it first",
+    )
+    merged: int = Field(0, description="Links folded into the first link of their conflict group")
+    failed: list[NormalizeChange] = Field([], description="Links whose URL could not be normalized")
+    applied: bool = Field(False, description="Whether the changes were written, False for a dry run")
+
+
+class PageMetadata(BaseModel):
+    """Pydantic model for metadata extracted from a web page."""
+
+    url: str = Field(..., description="Final URL after redirects")
+    title: str = Field("", description="Page title")
+    description: str = Field("", description="Meta or Open Graph description")
+    image_url: str = Field("", description="Absolute og:image or first image URL")
+    canonical_url: str = Field("", description="Absolute <link rel=canonical> URL")
+    fetched: bool = Field(False, description="Whether the page was actually retrieved")
+
+
+class LinkRow(NamedTuple):
+    """Read-only link record for listings, search and export, built straight from a Core select.
+
+    Carries only the columns those need, with NULL text already replaced by "".
+    """
 
     id: int
     url: str
@@ -144,18 +376,32 @@ class LinkExport(BaseModel):
     preview_url: str
     created_at: str
     updated_at: str
+    http_status: int | None
+
+    def export_fields(self) -> dict:
+        """The fields of LinkExport, in its order, without building a model per row."""
+        return {
+            "id": self.id,
+            "url": self.url,
+            "domain": self.domain,
+            "description": self.description,
+            "tag": self.tag,
+            "is_read": self.is_read,
+            "preview_url": self.preview_url,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
-    @classmethod
-    def from_db_link(cls, link: Link) -> "LinkExport":
-        """Create export model from database link."""
-        return cls(
-            id=link.id,
-            url=link.url,
-            domain=link.domain,
-            description=link.description or "",
-            tag=link.tag or "",
-            is_read=link.is_read,
-            preview_url=link.preview_url or "",
-            created_at=link.created_at,
-            updated_at=link.updated_at,
-        )
+
+class LinkExport(BaseModel):
+    """Pydantic model for exporting link data; its fields are the export columns, filled by LinkRow.export_fields."""
+
+    id: int
+    url: str
+    domain: str
+    description: str
+    tag: str
+    is_read: bool
+    preview_url: str
+    created_at: str
+    updated_at: str
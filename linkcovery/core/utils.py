@@ -1,16 +1,26 @@
 """Core utilities for LinKCovery."""
 
 import functools
-from collections.abc import Callable
+from asyncio import to_thread
+from codecs import getincrementaldecoder
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+from hashlib import blake2b, sha256
 from html.parser import HTMLParser
+from pathlib import Path
 from typing import Any
-from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse
 
-from httpx import AsyncClient
+from httpx import TransportError
 from rich.console import Console
 from typer import Exit
 
+from linkcovery.core.config import get_config
 from linkcovery.core.exceptions import LinKCoveryError
+from linkcovery.core.http_client import get_http_client
+from linkcovery.core.metadata_cache import MetadataCache, get_metadata_cache
+from linkcovery.core.models import PageMetadata
 
 console = Console()
 
@@ -87,32 +97,230 @@ def normalize_url(url: str) -> str:
         raise ValueError(msg)
 
 
-class DescriptionParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
+def normalize_link_urls(rows: list[tuple[int, str]]) -> list[str | None]:
+    """Normalize the URLs of a chunk of (id, url) rows, with None where a URL cannot be normalized.
+
+    Runs in worker processes when every stored link is normalized, so it only takes and returns plain data.
+    """
+    normalized: list[str | None] = []
+    for _, url in rows:
+        try:
+            normalized.append(normalize_url(url))
+        except ValueError:
+            normalized.append(None)
+    return normalized
+
+
+def bounded_map(
+    pool: Executor, fn: Callable[[Any], Any], items: Iterable[Any], limit: int
+) -> Iterator[tuple[Any, Any]]:
+    """Like Executor.map, yielding (item, result) in order, but with at most limit items submitted at a time."""
+    pending: deque[tuple[Any, Future]] = deque()
+    for item in items:
+        pending.append((item, pool.submit(fn, item)))
+        if len(pending) >= limit:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+
+def hash64(text: str) -> int:
+    """Stable 64-bit hash of a string, as a signed integer that fits a SQLite INTEGER column."""
+    return int.from_bytes(blake2b(text.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+@functools.lru_cache(maxsize=32_768)
+def url_key(url: str) -> int:
+    """Duplicate-detection key of a URL: a 64-bit hash of its normalized form without the scheme.
+
+    Follows the rules of normalize_url, so spellings that only differ in scheme, a www. prefix,
+    host case or a trailing slash share a key. Works on urlsplit directly as it runs for every row
+    of large imports; recent keys are cached because an import computes each one twice, once to
+    de-duplicate the row and again to write it.
+    """
+    try:
+        parts = urlsplit(url)
+        host = parts.netloc.lower()
+        if "@" in host or ":" in host:
+            host = (parts.hostname or "").removeprefix("www.")
+            if parts.port:
+                host = f"{host}:{parts.port}"
+            if parts.username:
+                userinfo = f"{parts.username}:{parts.password}" if parts.password else parts.username
+                host = f"{userinfo}@{host}"
+        else:
+            host = host.removeprefix("www.")
+    except ValueError:
+        return hash64(url)
+
+    text = host + parts.path.rstrip("/")
+    if parts.query:
+        text = f"{text}?{parts.query}"
+    if parts.fragment:
+        text = f"{text}#{parts.fragment}"
+    return hash64(text)
+
+
+class MetadataParser(HTMLParser):
+    """Collect title, description, canonical URL and preview image from a page fed in chunks."""
+
+    def __init__(self, need_image: bool = True) -> None:
+        super().__init__(convert_charrefs=True)
+        self.need_image = need_image
+        self.title = ""
         self.description = ""
+        self.og_description = ""
+        self.og_image = ""
+        self.first_img = ""
+        self.canonical = ""
+        self.head_closed = False
+        self._in_title = False
+
+    @property
+    def done(self) -> bool:
+        """Whether enough has been seen to stop reading the page."""
+        if self.first_img:
+            return True
+        return self.head_closed and (self.og_image or not self.need_image)
 
     def handle_starttag(self, tag, attrs) -> None:
-        if tag.lower() == "meta":
+        tag = tag.lower()
+        if tag == "meta":
+            attrs = dict(attrs)
+            name = (attrs.get("name") or attrs.get("property") or "").lower()
+            content = (attrs.get("content") or "").strip()
+
+            # match: <meta name="description" content="..."> and Open Graph fallbacks
+            if name == "description" and not self.description:
+                self.description = content
+            elif name == "og:description" and not self.og_description:
+                self.og_description = content
+            elif name == "og:image" and not self.og_image:
+                self.og_image = content
+        elif tag == "link":
             attrs = dict(attrs)
+            if (attrs.get("rel") or "").lower() == "canonical" and not self.canonical:
+                self.canonical = (attrs.get("href") or "").strip()
+        elif tag == "title" and not self.title:
+            self._in_title = True
+        elif tag == "body":
+            self.head_closed = True
+        elif tag == "img" and self.head_closed and not self.first_img:
+            self.first_img = (dict(attrs).get("src") or "").strip()
+
+    def handle_endtag(self, tag) -> None:
+        tag = tag.lower()
+        if tag == "title":
+            self._in_title = False
+        elif tag == "head":
+            self.head_closed = True
+
+    def handle_data(self, data) -> None:
+        if self._in_title:
+            self.title = f"{self.title}{data}".strip()
+
+
+async def _cache_call(method: Callable[..., Any], *args: Any, default: Any = None, **kwargs: Any) -> Any:
+    """Call a MetadataCache method on the global cache from a worker thread, keeping disk I/O off the event loop.
+
+    The cache is only an optimization, so any failure (including opening it) is treated as a miss.
+    """
 
-            # match: <meta name="description" content="...">
-            if (attrs.get("name") or "").lower() == "description":
-                self.description = (attrs.get("content") or "").strip()
+    def call() -> Any:
+        return method(get_metadata_cache(), *args, **kwargs)
 
+    try:
+        return await to_thread(call)
+    except Exception:
+        return default
 
-class PreviewParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self.og_image = ""
-        self.first_img = ""
 
-    def handle_starttag(self, tag, attrs) -> None:
-        attrs = dict(attrs)
-        if tag.lower() == "meta" and (attrs.get("property") or "").lower() == "og:image":
-            self.og_image = (attrs.get("content") or "").strip()
-        if tag.lower() == "img" and not self.first_img:
-            self.first_img = (attrs.get("src") or "").strip()
+async def fetch_metadata(url: str, timeout: int = 10, need_image: bool = True) -> PageMetadata:
+    """Fetch title, description and preview image of a page in a single streamed request.
+
+    The body is parsed as it arrives and the download stops once the parser has what it needs
+    (usually at </head>) or after metadata_max_bytes. Results are kept in the metadata cache and
+    revalidated with ETag / Last-Modified once stale; hosts that time out are skipped while backing off.
+
+    Args:
+        url: URL to fetch metadata from
+        timeout: Timeout in seconds (default: 10)
+        need_image: Keep reading past </head> for a first <img> when there is no og:image
+
+    Returns:
+        Page metadata, with empty fields on failure
+
+    """
+    try:
+        key = normalize_url(url)
+    except ValueError:
+        key = url
+    try:
+        host = extract_domain(url)
+    except ValueError:
+        return PageMetadata(url=url)
+
+    headers: dict[str, str] = {}
+    cached = await _cache_call(MetadataCache.get, key)
+    if cached and (cached.complete or not need_image):
+        if cached.is_fresh(get_config().metadata_cache_ttl_hours * 3600):
+            return cached.metadata
+        headers = cached.validators()
+    else:
+        cached = None
+
+    if await _cache_call(MetadataCache.host_blocked, host, default=False):
+        return cached.metadata if cached else PageMetadata(url=url)
+
+    parser = MetadataParser(need_image=need_image)
+    try:
+        async with get_http_client().stream("GET", url, timeout=timeout, headers=headers) as resp:
+            if resp.status_code == 304 and cached:
+                # Not modified: skip both the download and parsing
+                await _cache_call(MetadataCache.touch, key)
+                return cached.metadata
+
+            resp.raise_for_status()
+            final_url = str(resp.url)
+            try:
+                decoder = getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+            except LookupError:
+                decoder = getincrementaldecoder("utf-8")(errors="replace")
+
+            received = 0
+            async for chunk in resp.aiter_bytes():
+                received += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if parser.done or received >= get_config().metadata_max_bytes:
+                    break
+    except TransportError:
+        # Timeouts and connection failures put the whole host on a backoff
+        await _cache_call(MetadataCache.record_host_failure, host)
+        return cached.metadata if cached else PageMetadata(url=url)
+    except Exception:
+        return PageMetadata(url=url)
+
+    await _cache_call(MetadataCache.record_host_success, host)
+    image = parser.og_image or parser.first_img
+    metadata = PageMetadata(
+        url=final_url,
+        title=parser.title,
+        description=parser.description or parser.og_description,
+        image_url=urljoin(final_url, image) if image else "",
+        canonical_url=urljoin(final_url, parser.canonical) if parser.canonical else "",
+        fetched=True,
+    )
+    await _cache_call(
+        MetadataCache.put,
+        key,
+        metadata,
+        etag=resp.headers.get("etag", ""),
+        last_modified=resp.headers.get("last-modified", ""),
+        complete=need_image or bool(image),
+    )
+    return metadata
 
 
 async def fetch_description(url: str, timeout: int = 10, show_spinner: bool = True) -> str:
@@ -131,54 +339,52 @@ async def fetch_description(url: str, timeout: int = 10, show_spinner: bool = Tr
         from rich.status import Status
 
         with Status("📥 Fetching metadata...", console=console):
-            try:
-                async with AsyncClient(
-                    timeout=timeout,
-                    follow_redirects=True,
-                    verify=False,
-                    http2=True,
-                ) as client:
-                    resp = await client.get(url)
-                    resp.raise_for_status()
-            except Exception:
-                return ""
-        parser = DescriptionParser()
-        parser.feed(resp.text)
-        return parser.description
-    try:
-        async with AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            verify=False,
-            http2=True,
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-    except Exception:
-        return ""
-    parser = DescriptionParser()
-    parser.feed(resp.text)
-    return parser.description
+            metadata = await fetch_metadata(url=url, timeout=timeout, need_image=False)
+    else:
+        metadata = await fetch_metadata(url=url, timeout=timeout, need_image=False)
+
+    return metadata.description
 
 
 async def fetch_preview_image(url: str, timeout: int = 10) -> str:
     """Fetch og:image or first image URL from a page."""
+    return (await fetch_metadata(url=url, timeout=timeout)).image_url
+
+
+async def cache_preview_image(image_url: str, cache_dir: Path | None = None) -> Path | None:
+    """Download image and store in cache directory."""
     try:
-        async with AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            verify=False,
-            http2=True,
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
+        cache_dir = cache_dir or get_config().get_cache_dir() / "previews"
+        digest = sha256(image_url.encode("utf-8")).hexdigest()
+        parsed_path = urlparse(image_url).path
+        suffix = Path(parsed_path).suffix.lower()
+        if not suffix or len(suffix) > 5:
+            suffix = ".jpg"
+        filename = f"{digest}{suffix}"
+        path = cache_dir / filename
+        if path.exists():
+            return path
+
+        resp = await get_http_client().get(image_url, timeout=10)
+        resp.raise_for_status()
+        content_length = int(resp.headers.get("content-length", "0") or "0")
+        if content_length and content_length > 3_000_000:
+            return None
+        content = resp.content
+        if len(content) > 3_000_000:
+            return None
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        return path
     except Exception:
-        return ""
+        return None
 
-    parser = PreviewParser()
-    parser.feed(resp.text)
-    if parser.og_image:
-        return urljoin(str(resp.url), parser.og_image)
-    if parser.first_img:
-        return urljoin(str(resp.url), parser.first_img)
-    return ""
+
+async def resolve_preview_url(url: str, metadata: PageMetadata | None = None) -> str:
+    """Find a page's preview image, preferring a locally cached copy served under /cache."""
+    image_url = metadata.image_url if metadata else await fetch_preview_image(url)
+    if not image_url:
+        return ""
+    if cache_path := await cache_preview_image(image_url):
+        return f"/cache/{cache_path.name}"
+    return image_url
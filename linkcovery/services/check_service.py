@@ -0,0 +1,154 @@
+"""Dead link checking service for LinkCovery."""
+
+from asyncio import Semaphore, Task, create_task, to_thread, wait
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from time import perf_counter
+
+from httpx import HTTPError, InvalidURL, TransportError
+
+from linkcovery.core.config import get_config
+from linkcovery.core.database import DatabaseService, get_database
+from linkcovery.core.http_client import get_http_client
+from linkcovery.core.models import LinkCheckResult
+from linkcovery.core.utils import extract_domain
+
+# Consecutive connection failures after which the rest of a host's links are not requested this run
+HOST_FAILURE_LIMIT = 3
+
+
+async def check_url(url: str, timeout: int = 10) -> tuple[int, str]:
+    """Request a URL with HEAD, retrying with GET when HEAD is refused, and return (status, final URL)."""
+    client = get_http_client()
+    response = await client.head(url, timeout=timeout)
+    if response.status_code >= 400:
+        # Many servers reject or mishandle HEAD; only the status line of the GET is read
+        async with client.stream("GET", url, timeout=timeout) as response:
+            pass
+    return response.status_code, str(response.url)
+
+
+class LinkChecker:
+    """Check stored links for rot with bounded concurrency, writing results back in batches."""
+
+    def __init__(
+        self,
+        db: DatabaseService | None = None,
+        concurrency: int | None = None,
+        per_host_limit: int | None = None,
+        timeout: int | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        """Initialize the checker with database dependency and request limits."""
+        config = get_config()
+        self.db = db or get_database()
+        self.concurrency = concurrency or config.check_concurrency
+        self.per_host_limit = per_host_limit or config.fetch_per_host_limit
+        self.timeout = timeout or config.fetch_timeout
+        self.batch_size = batch_size or config.check_batch_size
+        self.checked = 0
+        self.broken = 0
+        self.skipped = 0
+        self._results: list[LinkCheckResult] = []
+        self._host_failures: Counter[str] = Counter()
+
+    @staticmethod
+    def checked_before(days: int | None) -> str | None:
+        """ISO cutoff for links due a re-check, or None to check every link."""
+        if days is None:
+            return None
+        return (datetime.now(UTC) - timedelta(days=days)).isoformat()
+
+    async def run(
+        self,
+        days: int | None = None,
+        on_result: Callable[[LinkCheckResult], None] | None = None,
+    ) -> None:
+        """Check all links, or only those not checked in the last days, calling on_result for each."""
+        global_limit = Semaphore(self.concurrency)
+        host_limits: defaultdict[str, Semaphore] = defaultdict(lambda: Semaphore(self.per_host_limit))
+        # Bound the links held in memory as tasks while the database is streamed
+        window = Semaphore(self.concurrency * 4)
+        tasks: set[Task] = set()
+
+        async def check_one(link_id: int, url: str) -> None:
+            try:
+                host = extract_domain(url)
+                async with host_limits[host], global_limit:
+                    result = await self._check(link_id, url, host)
+            except Exception as e:
+                # A malformed URL or an unexpected failure is still recorded, as a broken link
+                result = LinkCheckResult(
+                    link_id=link_id,
+                    url=url,
+                    http_status=0,
+                    error=str(e) or type(e).__name__,
+                    checked_at=datetime.now(UTC).isoformat(),
+                )
+            finally:
+                window.release()
+            self._results.append(result)
+            self.checked += not result.skipped
+            self.broken += result.broken
+            self.skipped += result.skipped
+            if on_result:
+                on_result(result)
+
+        batches = self.db.iter_links_to_check(checked_before=self.checked_before(days), batch_size=self.batch_size)
+        while batch := await to_thread(next, batches, None):
+            for link_id, url in batch:
+                await window.acquire()
+                task = create_task(check_one(link_id, url))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                # Results are written from this loop only, so database access stays on one thread at a time
+                if len(self._results) >= self.batch_size:
+                    await self._flush()
+
+        if tasks:
+            await wait(tasks)
+        await self._flush()
+
+    async def _check(self, link_id: int, url: str, host: str) -> LinkCheckResult:
+        """Check one link, skipping the request when its host has stopped answering."""
+        checked_at = datetime.now(UTC).isoformat()
+        if self._host_failures[host] >= HOST_FAILURE_LIMIT:
+            return LinkCheckResult(
+                link_id=link_id,
+                url=url,
+                http_status=None,
+                error="Host unreachable (skipped)",
+                checked_at=checked_at,
+            )
+
+        started = perf_counter()
+        status, final_url, error = 0, "", ""
+        try:
+            status, final_url = await check_url(url, timeout=self.timeout)
+            self._host_failures[host] = 0
+        except TransportError as e:
+            self._host_failures[host] += 1
+            error = str(e) or type(e).__name__
+        except (HTTPError, InvalidURL) as e:
+            error = str(e) or type(e).__name__
+
+        return LinkCheckResult(
+            link_id=link_id,
+            url=url,
+            http_status=status,
+            final_url=final_url,
+            latency_ms=round((perf_counter() - started) * 1000),
+            error=error,
+            checked_at=checked_at,
+        )
+
+    async def _flush(self) -> None:
+        """Write collected results back in one transaction.
+
+        Skipped links are not written, so they keep their last real check and stay due for the next run.
+        """
+        if not self._results:
+            return
+        results, self._results = [result for result in self._results if not result.skipped], []
+        await to_thread(self.db.record_check_results, results)
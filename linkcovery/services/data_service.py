@@ -1,103 +1,245 @@
 """Import and export service for LinkCovery."""
 
-from asyncio import run as asyncio_run
-from json import JSONDecodeError, dump, load
+from asyncio import to_thread
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from csv import writer as csv_writer
+from datetime import datetime
+from functools import partial
+from gzip import open as gzip_open
+from hashlib import file_digest
+from html import escape
+from io import StringIO
+from itertools import chain
+from json import JSONDecodeError, dumps, load
+from multiprocessing import get_context
+from os import cpu_count
 from pathlib import Path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+from textwrap import indent
+from typing import IO, Any
+from zlib import compressobj
 
 from rich.progress import Progress, TaskID
 
-from linkcovery.core.chrome_bookmark import extractor
-from linkcovery.core.exceptions import ImportExportError
-from linkcovery.core.models import LinkExport
-from linkcovery.core.utils import console, fetch_description
+from linkcovery.core.chrome_bookmark import iter_bookmarks, iter_chrome_bookmarks
+from linkcovery.core.config import get_config
+from linkcovery.core.database import AsyncDatabaseService, get_async_database
+from linkcovery.core.exceptions import DatabaseError, ImportExportError
+from linkcovery.core.http_client import run_async
+from linkcovery.core.json_stream import JsonArrayReader, line_ranges, link_fields, parse_link_range
+from linkcovery.core.models import ImportSession, LinkCreate, LinkExport, LinkImportResult, LinkRow
+from linkcovery.core.utils import bounded_map, console
+from linkcovery.services.import_pipeline import (
+    MAX_REPORTED_FAILURES,
+    ImportPipeline,
+    ImportPreview,
+    ImportRow,
+    PipelineProgress,
+)
 from linkcovery.services.link_service import LinkService, get_link_service
 
+# Turns chunks of links into chunks of output text
+Serializer = Callable[[Iterable[list[LinkRow]]], Iterator[str]]
+
+# Columns written by the CSV exporter, matching the fields of LinkExport
+EXPORT_FIELDS = tuple(LinkExport.model_fields)
+
+NETSCAPE_HEADER = """<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<!-- This is an automatically generated file.
+     It will be read and overwritten.
+     DO NOT EDIT! -->
+<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+<TITLE>Bookmarks</TITLE>
+<H1>Bookmarks</H1>
+<DL><p>
+"""
+
 
 class DataService:
     """Service for handling data operations."""
 
-    def __init__(self, link_service: LinkService | None = None) -> None:
-        """Initialize with link service dependency."""
+    def __init__(
+        self,
+        link_service: LinkService | None = None,
+        write: Callable[..., Awaitable[Any]] | None = None,
+    ) -> None:
+        """Initialize with link service dependency and, optionally, what runs the imports' batch writes."""
         self.link_service = link_service or get_link_service()
-
-    def export_to_json(self, output_path: str | Path) -> None:
-        """Export all links to JSON format."""
+        self.write = write
+
+    def export_to_json(self, output_path: str | Path, compress: bool | None = None) -> None:
+        """Export all links to JSON format, streaming rows from the database in chunks.
+
+        Output is gzip-compressed when compress is set, or by default when the path ends in .gz.
+        """
+        self._write_export(output_path, *self._export_source("json"), compress)
+
+    def export_to_ndjson(self, output_path: str | Path, compress: bool | None = None) -> None:
+        """Export all links as JSON Lines (one object per line), streaming rows from the database in chunks."""
+        self._write_export(output_path, *self._export_source("ndjson"), compress)
+
+    def export_to_csv(self, output_path: str | Path, compress: bool | None = None) -> None:
+        """Export all links as CSV with a header row, streaming rows from the database in chunks."""
+        self._write_export(output_path, *self._export_source("csv"), compress)
+
+    def export_to_html(self, output_path: str | Path, compress: bool | None = None) -> None:
+        """Export all links as a Netscape bookmark HTML file that browsers can import, one folder per tag."""
+        self._write_export(output_path, *self._export_source("html"), compress)
+
+    def iter_export(self, export_format: str = "json", compress: bool = False) -> Iterator[str] | Iterator[bytes]:
+        """Yield all links in one of EXPORT_FORMATS as text chunks, or gzip-compressed bytes."""
+        chunks, serialize = self._export_source(export_format)
+        text_chunks = serialize(chunks)
+        return gzip_chunks(text_chunks) if compress else text_chunks
+
+    def _export_source(self, export_format: str) -> tuple[Iterable[list[LinkRow]], Serializer]:
+        """Pick the chunked link source and serializer for an export format."""
+        if export_format not in EXPORT_FORMATS:
+            msg = f"Unsupported export format: {export_format}"
+            raise ImportExportError(msg, hint=f"Use one of: {', '.join(EXPORT_FORMATS)}")
+
+        chunk_size = get_config().export_chunk_size
+        if export_format == "html":
+            # Bookmark folders must be written contiguously, so links are read grouped by tag
+            return self.link_service.iter_links_by_tag(chunk_size), html_bookmark_chunks
+        return self.link_service.iter_links(chunk_size), EXPORT_FORMATS[export_format]
+
+    def import_from_json(
+        self,
+        file_path: Path,
+        defer_enrichment: bool = False,
+        resume: bool = False,
+        dry_run: bool = False,
+        diff_path: Path | None = None,
+    ) -> None:
+        """Import links from a JSON array file, parsing and inserting it incrementally."""
         try:
-            output_path = Path(output_path)
-            links = self.link_service.list_all_links()
-
-            if not links:
-                console.print("📭 No links to export", style="yellow")
-                return
-
-            # Convert to export format
-            export_data = [LinkExport.from_db_link(link).model_dump() for link in links]
-
-            # Write to file
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                dump(export_data, f, indent=2, ensure_ascii=False)
-
-            console.print(f"✅ Successfully exported {len(links)} links to {output_path}", style="green")
-
-        except Exception as e:
-            msg = f"Failed to export links: {e}"
+            with open(file_path, "rb") as f:
+                self._import_json_stream(f, file_path, defer_enrichment, resume, dry_run, diff_path)
+        except OSError as e:
+            msg = f"Failed to read file: {e}"
             raise ImportExportError(msg)
 
-    def import_from_json(self, file_path: Path) -> None:
-        """Import links from JSON file."""
+    def _import_json_stream(
+        self,
+        f: IO[bytes],
+        file_path: Path,
+        defer_enrichment: bool,
+        resume: bool,
+        dry_run: bool,
+        diff_path: Path | None,
+    ) -> None:
+        """Stream the items of a JSON array into batched inserts, reporting progress in bytes read."""
+        reader = JsonArrayReader(f)
+        items = iter(reader)
         try:
-            with open(file_path, encoding="utf-8") as f:
-                links_data = load(f)
-            if not links_data:
-                console.print("ℹ️ No links found in the JSON file", style="blue")
-                return
+            first = next(items, None)
         except JSONDecodeError as e:
             msg = f"Invalid JSON format: {e}"
             raise ImportExportError(msg)
-        except Exception as e:
+        if first is None:
+            console.print("ℹ️ No links found in the JSON file", style="blue")
+            return
+
+        def rows() -> Iterator[dict]:
+            try:
+                for link_data in chain([first], items):
+                    yield link_fields(link_data)
+            except JSONDecodeError as e:
+                msg = f"Invalid JSON format after {reader.count} links: {e}"
+                raise ImportExportError(msg)
+
+        self._import_rows(
+            rows(),
+            fetch_missing=True,
+            defer_enrichment=defer_enrichment,
+            total=file_path.stat().st_size,
+            position=lambda: reader.position,
+            source=file_path,
+            resume=resume,
+            dry_run=dry_run,
+            diff_path=diff_path,
+        )
+
+    def import_from_ndjson(
+        self,
+        file_path: Path,
+        defer_enrichment: bool = False,
+        resume: bool = False,
+        dry_run: bool = False,
+        diff_path: Path | None = None,
+    ) -> None:
+        """Import links from a JSON Lines file, parsing and validating byte ranges in parallel processes.
+
+        Ranges are handed to a process pool a few at a time and their records are inserted in file order
+        by this process, the single writer. Small files are parsed inline.
+        """
+        config = get_config()
+        try:
+            size = file_path.stat().st_size
+            ranges = list(line_ranges(file_path, config.ndjson_chunk_bytes))
+        except OSError as e:
             msg = f"Failed to read file: {e}"
             raise ImportExportError(msg)
 
-        added_count = 0
-        failed_count = 0
-        failed_links = []
-
-        console.print(f"📥 Importing {len(links_data)} links...")
-
-        with Progress() as progress:
-            task: TaskID = progress.add_task("Importing links...", total=len(links_data))
-
-            for i, link_data in enumerate(links_data, 1):
-                url = link_data.get("url")
-
-                if not url or self.link_service.exists(url):
-                    failed_count += 1
-                    failed_links.append({"index": i, "url": url or "", "error": "URL missing or already exists"})
-                    progress.update(task, advance=1)
-                    continue
+        if not size:
+            console.print("ℹ️ No links found in the JSON Lines file", style="blue")
+            return
 
-                try:
-                    self.link_service.add_link(
-                        url=url,
-                        description=link_data.get("description", asyncio_run(fetch_description(url=url))),
-                        tag=link_data.get("tag", ""),
-                        is_read=link_data.get("is_read", False),
+        position = 0
+
+        def rows(
+            parsed: Iterable[tuple[tuple[int, int], list[tuple[bool, dict]]]],
+        ) -> Iterator[LinkCreate | LinkImportResult]:
+            nonlocal position
+            for (_, end), records in parsed:
+                position = end
+                for valid, record in records:
+                    # Already validated by the parser, so skip validating again in the writer
+                    yield (
+                        LinkCreate.model_construct(**record) if valid else LinkImportResult(status="invalid", **record)
                     )
-                    added_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    failed_links.append({"index": i, "url": link_data.get("url", ""), "error": str(e)})
-
-                progress.update(task, advance=1)
 
-        console.print(f"✅ Import completed: {added_count} links added", style="green")
-        if failed_count > 0:
-            console.print(f"⚠️  {failed_count} links failed to import", style="yellow")
-            for failure in failed_links:
-                console.print(f"  #{failure['index']}: {failure['url']} - {failure['error']}")
+        workers = config.import_workers or cpu_count() or 1
+        if len(ranges) == 1 or workers == 1:
+            parsed = ((byte_range, parse_link_range(file_path, byte_range)) for byte_range in ranges)
+            self._import_rows(
+                rows(parsed),
+                defer_enrichment=defer_enrichment,
+                total=size,
+                position=lambda: position,
+                source=file_path,
+                resume=resume,
+                dry_run=dry_run,
+                diff_path=diff_path,
+            )
+            return
 
-    def import_from_txt(self, file_path: Path) -> None:
+        # Spawned rather than forked: the pool is fed from the import's event loop thread pool
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            parsed = bounded_map(pool, partial(parse_link_range, file_path), ranges, workers * 2)
+            self._import_rows(
+                rows(parsed),
+                defer_enrichment=defer_enrichment,
+                total=size,
+                position=lambda: position,
+                source=file_path,
+                resume=resume,
+                dry_run=dry_run,
+                diff_path=diff_path,
+            )
+
+    def import_from_txt(
+        self,
+        file_path: Path,
+        defer_enrichment: bool = False,
+        resume: bool = False,
+        dry_run: bool = False,
+        diff_path: Path | None = None,
+    ) -> None:
         """Import links from a text file (one URL per line)."""
         try:
             lines = file_path.read_text(encoding="utf-8").splitlines()
@@ -111,96 +253,425 @@ class DataService:
             console.print("ℹ️ No links found in the text file", style="blue")
             return
 
-        added_count = 0
-        failed_count = 0
-        failed_links = []
-
-        console.print(f"📥 Importing {len(urls)} links...")
-
-        with Progress() as progress:
-            task: TaskID = progress.add_task("Importing links...", total=len(urls))
-
-            for i, url in enumerate(urls, 1):
-                if self.link_service.exists(url):
-                    failed_count += 1
-                    failed_links.append({"index": i, "url": url or "", "error": "URL missing or already exists"})
-                    progress.update(task, advance=1)
-                    continue
-
-                try:
-                    self.link_service.add_link(url=url, description="", tag="", is_read=False)
-                    added_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    failed_links.append({"index": i, "url": url, "error": str(e)})
-
-                progress.update(task, advance=1)
+        self._import_rows(
+            [{"url": url} for url in urls],
+            defer_enrichment=defer_enrichment,
+            source=file_path,
+            resume=resume,
+            dry_run=dry_run,
+            diff_path=diff_path,
+        )
+
+    def import_from_html(
+        self,
+        file_path: Path,
+        defer_enrichment: bool = False,
+        resume: bool = False,
+        dry_run: bool = False,
+        diff_path: Path | None = None,
+    ) -> None:
+        """Import links from a Netscape bookmark HTML file, streaming it in chunks.
+
+        Folders become tags, titles become descriptions and ADD_DATE is kept as the creation time;
+        only links without a title have their description fetched.
+        """
+        try:
+            with open(file_path, "rb") as f:
+                size = file_path.stat().st_size
+                records = iter_bookmarks(f)
+                if (first := next(records, None)) is None:
+                    console.print("ℹ️ No links found in the HTML file", style="blue")
+                    return
+
+                rows = (
+                    {
+                        "url": record.url,
+                        "description": record.title,
+                        "tag": record.tag,
+                        "created_at": record.add_date,
+                    }
+                    for record in chain([first], records)
+                )
+                self._import_rows(
+                    rows,
+                    fetch_missing=True,
+                    defer_enrichment=defer_enrichment,
+                    total=size,
+                    position=f.tell,
+                    source=file_path,
+                    resume=resume,
+                    dry_run=dry_run,
+                    diff_path=diff_path,
+                )
+        except OSError as e:
+            msg = f"Failed to read file: {e}"
+            raise ImportExportError(msg)
 
-        console.print(f"✅ Import completed: {added_count} links added", style="green")
-        if failed_count > 0:
-            console.print(f"⚠️  {failed_count} links failed to import", style="yellow")
-            for failure in failed_links:
-                console.print(f"  #{failure['index']}: {failure['url']} - {failure['error']}")
+    def import_from_chrome(
+        self,
+        file_path: Path,
+        defer_enrichment: bool = False,
+        resume: bool = False,
+        dry_run: bool = False,
+        diff_path: Path | None = None,
+    ) -> None:
+        """Import links from a Chrome (or Chromium-based browser) Bookmarks file.
+
+        Folders become tags, names become descriptions and date_added is kept as the creation time.
+        """
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = load(f)
+        except JSONDecodeError as e:
+            msg = f"Invalid Chrome Bookmarks file: {e}"
+            raise ImportExportError(msg)
+        except OSError as e:
+            msg = f"Failed to read file: {e}"
+            raise ImportExportError(msg)
 
-    def import_from_html(self, file_path: Path) -> None:
-        """Import links from HTML file."""
-        links = extractor(file_path)
+        if not isinstance(data, dict) or "roots" not in data:
+            msg = "Invalid Chrome Bookmarks file: no bookmark roots found"
+            raise ImportExportError(msg, hint="Use the 'Bookmarks' file from the browser profile directory")
 
-        if not links:
-            console.print("ℹ️ No links found in the HTML file", style="blue")
+        rows = [
+            {"url": record.url, "description": record.title, "tag": record.tag, "created_at": record.add_date}
+            for record in iter_chrome_bookmarks(data)
+        ]
+        if not rows:
+            console.print("ℹ️ No links found in the Bookmarks file", style="blue")
             return
 
-        added_count = 0
-        failed_count = 0
-        failed_links = []
-
-        console.print(f"📥 Importing {len(links)} links...")
+        self._import_rows(
+            rows,
+            fetch_missing=True,
+            defer_enrichment=defer_enrichment,
+            source=file_path,
+            resume=resume,
+            dry_run=dry_run,
+            diff_path=diff_path,
+        )
+
+    def import_from_firefox(self, file_path: Path) -> None:
+        """Import links from a Firefox places.sqlite database in a single set-based insert.
+
+        The database (and its write-ahead log) is copied first, since Firefox locks it while running.
+        """
+        console.print(f"📥 Importing Firefox bookmarks from {file_path}...")
+        with TemporaryDirectory() as temp_dir:
+            places_path = Path(temp_dir) / "places.sqlite"
+            try:
+                copyfile(file_path, places_path)
+                if (wal_path := file_path.with_name(f"{file_path.name}-wal")).exists():
+                    copyfile(wal_path, places_path.with_name("places.sqlite-wal"))
+            except OSError as e:
+                msg = f"Failed to read file: {e}"
+                raise ImportExportError(msg)
+
+            try:
+                total, added = self.link_service.import_firefox_places(places_path)
+            except DatabaseError as e:
+                msg = f"Failed to import Firefox bookmarks: {e.message}"
+                raise ImportExportError(msg, hint="Use places.sqlite from the Firefox profile directory")
+
+        console.print(f"✅ Import completed: {added} links added", style="green")
+        if skipped := total - added:
+            console.print(f"ℹ️ {skipped} bookmarks skipped as already stored or duplicated", style="blue")
+
+    def _import_rows(
+        self,
+        rows: Iterable[ImportRow],
+        fetch_missing: bool = False,
+        defer_enrichment: bool = False,
+        total: int | None = None,
+        position: Callable[[], int] | None = None,
+        source: Path | None = None,
+        resume: bool = False,
+        dry_run: bool = False,
+        diff_path: Path | None = None,
+    ) -> None:
+        """Run rows through the import pipeline and report the outcome.
+
+        Rows may be a lazy iterable: it is consumed a batch at a time, so inserts start as soon as the
+        first batch is parsed. Progress counts written rows, or whatever position() reports against
+        total (e.g. bytes read) when given, above a throughput table for each pipeline stage.
+
+        With fetch_missing, descriptions are fetched concurrently for new links that have none. With
+        defer_enrichment nothing is fetched; jobs are queued for the background worker instead.
+
+        Imports of a source file are tracked as an import session that is checkpointed with every
+        batch; with resume, an interrupted import of the same file continues from its checkpoint.
+        With dry_run the rows are only classified against the stored links (see _preview_rows).
+        """
+        if dry_run:
+            self._preview_rows(rows, total, position, diff_path)
+            return
 
-        with Progress() as progress:
-            task: TaskID = progress.add_task("Importing links...", total=len(links))
+        session = self._open_import_session(source, resume) if source else None
+        if isinstance(rows, list):
+            console.print(f"📥 Importing {len(rows)} links...")
+            total = len(rows)
+        else:
+            console.print("📥 Importing links...")
+
+        pipeline = ImportPipeline(
+            self.link_service,
+            fetch_missing=fetch_missing,
+            defer_enrichment=defer_enrichment,
+            session=session,
+            write=self.write,
+        )
+        try:
+            with PipelineProgress(pipeline, console=console) as progress:
+                task: TaskID = progress.add_task("Importing links...", total=total)
+
+                def report(count: int) -> None:
+                    if position:
+                        progress.update(task, completed=position())
+                    else:
+                        progress.advance(task, count)
+
+                run_async(pipeline.run(rows, on_progress=report))
+                progress.update(task, completed=total)
+        except BaseException:
+            if session:
+                console.print("💾 Progress is checkpointed; import again with --resume to continue", style="yellow")
+            raise
+
+        if not session:
+            added, failed = pipeline.added, pipeline.failed
+            failures = sorted(pipeline.failures, key=lambda failure: failure["index"])
+        else:
+            # Totals and failures span every run of a resumed import
+            session = self.link_service.finish_import_session(session.id)
+            added, failed = session.added_count, session.failed_count
+            failures = [
+                {"index": failure.position, "url": failure.url, "error": failure.error}
+                for failure in self.link_service.get_import_failures(session.id, MAX_REPORTED_FAILURES)
+            ]
+
+        console.print(f"✅ Import completed: {added} links added", style="green")
+        if failed:
+            console.print(f"⚠️  {failed} links failed to import", style="yellow")
+            for failure in failures:
+                console.print(f"  #{failure['index']}: {failure['url']} - {failure['error']}")
+            if failed > len(failures):
+                console.print(f"  ... and {failed - len(failures)} more", style="dim")
+
+    def _preview_rows(
+        self,
+        rows: Iterable[ImportRow],
+        total: int | None,
+        position: Callable[[], int] | None,
+        diff_path: Path | None,
+    ) -> None:
+        """Report how many rows would be added, are already stored or would collide, writing nothing.
+
+        Stored URLs are loaded once as in-memory hash sets and joined against the streamed rows. With
+        diff_path, one tab-separated line (status, row number, URL, detail) is written per input row.
+        """
+        console.print("🔍 Loading stored links...")
+        preview = ImportPreview(self.link_service.load_url_keys())
+        if isinstance(rows, list):
+            total = len(rows)
 
-            for i, link in enumerate(links, 1):
-                if not link or self.link_service.exists(link):
-                    failed_count += 1
-                    failed_links.append({"index": i, "url": link or "", "error": "URL missing or already exists"})
-                    progress.update(task, advance=1)
-                    continue
+        try:
+            with (
+                open(diff_path, "w", encoding="utf-8") if diff_path else nullcontext() as diff,
+                Progress(console=console) as progress,
+            ):
+                task: TaskID = progress.add_task("Comparing links...", total=total)
+                if diff:
+                    diff.write("status\trow\turl\tdetail\n")
+                for index, row in enumerate(rows, 1):
+                    status, url, detail = preview.classify(row)
+                    if diff:
+                        diff.write(f"{status}\t{index}\t{url}\t{detail}\n")
+                    if not index % 10_000:
+                        progress.update(task, completed=position() if position else index)
+                progress.update(task, completed=total)
+        except OSError as e:
+            msg = f"Failed to write diff file: {e}"
+            raise ImportExportError(msg)
 
-                try:
-                    self.link_service.add_link(
-                        url=link,
-                        description=asyncio_run(fetch_description(url=link)),
-                    )
-                    added_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    failed_links.append({"index": i, "url": link, "error": str(e)})
+        console.print(preview.summary_table())
+        if diff_path:
+            console.print(f"📝 Row-by-row diff written to {diff_path}", style="blue")
+        console.print("🧪 Dry run: nothing was imported", style="yellow")
 
-                progress.update(task, advance=1)
+    def _open_import_session(self, source: Path, resume: bool) -> ImportSession:
+        """Continue the interrupted import of a file when resuming, otherwise start a new one."""
+        try:
+            with open(source, "rb") as f:
+                source_hash = file_digest(f, "sha256").hexdigest()
+        except OSError as e:
+            msg = f"Failed to read file: {e}"
+            raise ImportExportError(msg)
 
-        console.print(f"✅ Import completed: {added_count} links added", style="green")
-        if failed_count > 0:
-            console.print(f"⚠️  {failed_count} links failed to import", style="yellow")
-            for failure in failed_links:
-                console.print(f"  #{failure['index']}: {failure['url']} - {failure['error']}")
+        unfinished = self.link_service.get_unfinished_import_session(source_hash)
+        if resume and unfinished:
+            console.print(
+                f"⏩ Resuming import from row {unfinished.rows_committed + 1} "
+                f"({unfinished.added_count} links already added)",
+                style="blue",
+            )
+            return unfinished
+        if resume:
+            console.print("ℹ️ No interrupted import of this file found, starting from the beginning", style="blue")
+        elif unfinished:
+            console.print("ℹ️ Starting over; use --resume to continue an interrupted import instead", style="blue")
+        return self.link_service.start_import_session(str(source), source_hash)
 
     def export_links(self, links: list, output_path: str | Path) -> None:
         """Export a specific list of links."""
-        try:
-            output_path = Path(output_path)
-            export_data = [LinkExport.from_db_link(link).model_dump() for link in links]
+        self._write_export(output_path, [links], json_array_chunks)
+
+    def _write_export(
+        self,
+        output_path: str | Path,
+        chunks: Iterable[list[LinkRow]],
+        serialize: Serializer,
+        compress: bool | None = None,
+    ) -> None:
+        """Write serialized link chunks to a file through a temporary file, replacing the target only on success."""
+        output_path = Path(output_path)
+        if compress is None:
+            compress = output_path.suffix == ".gz"
+        temp_path = output_path.with_name(f"{output_path.name}.tmp")
+        count = 0
+
+        def counted(chunks: Iterable[list[LinkRow]]) -> Iterator[list[LinkRow]]:
+            nonlocal count
+            for links in chunks:
+                count += len(links)
+                yield links
 
+        try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                dump(export_data, f, indent=2, ensure_ascii=False)
+            opener = gzip_open if compress else open
+            with opener(temp_path, "wt", encoding="utf-8") as f:
+                f.writelines(serialize(counted(chunks)))
+
+            if not count:
+                temp_path.unlink()
+                console.print("📭 No links to export", style="yellow")
+                return
 
-            console.print(f"✅ Successfully exported {len(links)} links to {output_path}", style="green")
+            temp_path.replace(output_path)
+            console.print(f"✅ Successfully exported {count} links to {output_path}", style="green")
 
         except Exception as e:
+            temp_path.unlink(missing_ok=True)
             msg = f"Failed to export links: {e}"
             raise ImportExportError(msg)
 
 
+def json_array_chunks(chunks: Iterable[list[LinkRow]]) -> Iterator[str]:
+    """Serialize link chunks as one JSON array, producing the same text as json.dump(..., indent=2).
+
+    Yields one string per chunk so only a chunk of rows is ever held in memory.
+    """
+    empty = True
+    yield "["
+    for links in chunks:
+        if not links:
+            continue
+        items = (indent(dumps(link.export_fields(), indent=2, ensure_ascii=False), "  ") for link in links)
+        yield ("\n" if empty else ",\n") + ",\n".join(items)
+        empty = False
+    yield "]" if empty else "\n]"
+
+
+def ndjson_chunks(chunks: Iterable[list[LinkRow]]) -> Iterator[str]:
+    """Serialize link chunks as JSON Lines, one compact object per line."""
+    for links in chunks:
+        if links:
+            yield "".join(f"{dumps(link.export_fields(), ensure_ascii=False)}\n" for link in links)
+
+
+def csv_chunks(chunks: Iterable[list[LinkRow]]) -> Iterator[str]:
+    """Serialize link chunks as CSV, one header row followed by one row per link."""
+    buffer = StringIO()
+    writer = csv_writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for links in chunks:
+        writer.writerows(
+            (
+                link.id,
+                link.url,
+                link.domain,
+                link.description or "",
+                link.tag or "",
+                "true" if link.is_read else "false",
+                link.preview_url or "",
+                link.created_at,
+                link.updated_at,
+            )
+            for link in links
+        )
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def html_bookmark_chunks(chunks: Iterable[list[LinkRow]]) -> Iterator[str]:
+    """Serialize tag-grouped link chunks as a Netscape bookmark file, nesting folders on '/' in tags."""
+    yield NETSCAPE_HEADER
+    folders: list[str] = []
+    for links in chunks:
+        lines: list[str] = []
+        for link in links:
+            path = [folder for folder in (link.tag or "").split("/") if folder]
+            if path != folders:
+                # Close folders not shared with the new path, then open the new ones
+                shared = 0
+                while shared < min(len(path), len(folders)) and path[shared] == folders[shared]:
+                    shared += 1
+                for depth in range(len(folders), shared, -1):
+                    lines.append(f"{'    ' * depth}</DL><p>")
+                for depth in range(shared, len(path)):
+                    pad = "    " * (depth + 1)
+                    lines.append(f"{pad}<DT><H3>{escape(path[depth])}</H3>")
+                    lines.append(f"{pad}<DL><p>")
+                folders = path
+
+            attrs = f'HREF="{escape(link.url)}"'
+            if add_date := iso_to_epoch(link.created_at):
+                attrs += f' ADD_DATE="{add_date}"'
+            if last_modified := iso_to_epoch(link.updated_at):
+                attrs += f' LAST_MODIFIED="{last_modified}"'
+            title = escape(link.description or link.url, quote=False)
+            lines.append(f"{'    ' * (len(folders) + 1)}<DT><A {attrs}>{title}</A>")
+        yield "\n".join(lines) + "\n" if lines else ""
+
+    yield "".join(f"{'    ' * depth}</DL><p>\n" for depth in range(len(folders), 0, -1))
+    yield "</DL><p>\n"
+
+
+def iso_to_epoch(value: str | None) -> int | None:
+    """Convert an ISO 8601 timestamp to Unix seconds, or None if it cannot be parsed."""
+    try:
+        return int(datetime.fromisoformat(value or "").timestamp())
+    except ValueError:
+        return None
+
+
+def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip-compress a stream of text chunks on the fly."""
+    compressor = compressobj(wbits=31)  # 16 + MAX_WBITS selects the gzip container
+    for chunk in chunks:
+        if data := compressor.compress(chunk.encode("utf-8")):
+            yield data
+    yield compressor.flush()
+
+
+EXPORT_FORMATS: dict[str, Serializer] = {
+    "json": json_array_chunks,
+    "ndjson": ndjson_chunks,
+    "csv": csv_chunks,
+    "html": html_bookmark_chunks,
+}
+
+
 # Global service instance
 _data_service: DataService | None = None
 
@@ -211,3 +682,53 @@ def get_data_service() -> DataService:
     if _data_service is None:
         _data_service = DataService()
     return _data_service
+
+
+class AsyncDataService:
+    """Awaitable imports for async web endpoints.
+
+    An import is parsed and fetched on a worker thread; only its batch writes go to the serialized
+    database write thread, one batch at a time, so other writes are not held up for the whole import.
+    """
+
+    def __init__(self, data_service: DataService | None = None, db: AsyncDatabaseService | None = None) -> None:
+        """Initialize over a data service and, optionally, the executors its calls run on."""
+        self.data_service = data_service or get_data_service()
+        self._db = db
+
+    @property
+    def db(self) -> AsyncDatabaseService:
+        """Executors for database calls; the global ones are looked up per call as the app may restart them."""
+        return self._db or get_async_database()
+
+    def _importer(self) -> DataService:
+        """A data service over the same links whose batch writes are submitted to the write thread."""
+        return DataService(self.data_service.link_service, write=self.db.write)
+
+    async def import_from_json(self, file_path: Path, defer_enrichment: bool = False) -> None:
+        """Import links from a JSON file."""
+        await to_thread(self._importer().import_from_json, file_path, defer_enrichment=defer_enrichment)
+
+    async def import_from_ndjson(self, file_path: Path, defer_enrichment: bool = False) -> None:
+        """Import links from a JSON Lines file."""
+        await to_thread(self._importer().import_from_ndjson, file_path, defer_enrichment=defer_enrichment)
+
+    async def import_from_txt(self, file_path: Path, defer_enrichment: bool = False) -> None:
+        """Import links from a text file (one URL per line)."""
+        await to_thread(self._importer().import_from_txt, file_path, defer_enrichment=defer_enrichment)
+
+    async def import_from_html(self, file_path: Path, defer_enrichment: bool = False) -> None:
+        """Import links from a bookmark HTML file."""
+        await to_thread(self._importer().import_from_html, file_path, defer_enrichment=defer_enrichment)
+
+
+# Global async service instance
+_async_data_service: AsyncDataService | None = None
+
+
+def get_async_data_service() -> AsyncDataService:
+    """Get the global async import service instance."""
+    global _async_data_service
+    if _async_data_service is None:
+        _async_data_service = AsyncDataService()
+    return _async_data_service
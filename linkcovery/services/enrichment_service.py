@@ -0,0 +1,143 @@
+"""Background link enrichment service for LinkCovery."""
+
+from asyncio import FIRST_COMPLETED, Event, Task, create_task, to_thread, wait, wait_for
+from collections import Counter
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from time import monotonic
+
+from linkcovery.core.config import get_config
+from linkcovery.core.database import DatabaseService, get_database
+from linkcovery.core.exceptions import DatabaseError, LinkAlreadyExistsError, LinkNotFoundError
+from linkcovery.core.models import JOB_KINDS, EnrichmentJob, LinkUpdate
+from linkcovery.core.utils import fetch_metadata, resolve_preview_url
+
+# A job still running after this many fetch timeouts is taken to belong to a worker that died
+JOB_LEASE_TIMEOUTS = 4
+
+
+class EnrichmentWorker:
+    """Asyncio worker pool that drains the enrichment job queue stored in the database."""
+
+    def __init__(
+        self,
+        db: DatabaseService | None = None,
+        concurrency: int | None = None,
+        per_host_limit: int | None = None,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """Initialize the worker with database dependency and pool limits."""
+        config = get_config()
+        self.db = db or get_database()
+        self.concurrency = concurrency or config.enrichment_concurrency
+        self.per_host_limit = per_host_limit or config.fetch_per_host_limit
+        self.poll_interval = poll_interval
+        self.processed = 0
+        self.failed = 0
+        self._host_load: Counter[str] = Counter()
+        self._stop = Event()
+
+    def stop(self) -> None:
+        """Ask the worker to stop after the jobs in flight finish."""
+        self._stop.set()
+
+    async def run(self, until_idle: bool = False) -> None:
+        """Process jobs until stopped, or until no job is due when until_idle is set."""
+        lease = get_config().fetch_timeout * JOB_LEASE_TIMEOUTS
+        next_requeue = 0.0
+        tasks: set[Task] = set()
+
+        while not self._stop.is_set():
+            if monotonic() >= next_requeue:
+                # Recover jobs whose worker died, checking again once any job claimed now would be stale
+                claimed_before = (datetime.now(UTC) - timedelta(seconds=lease)).isoformat()
+                with suppress(DatabaseError):
+                    await to_thread(self.db.requeue_running_jobs, claimed_before)
+                    next_requeue = monotonic() + lease
+
+            claimed: list[EnrichmentJob] = []
+            if (free := self.concurrency - len(tasks)) > 0:
+                try:
+                    claimed = await to_thread(self.db.claim_jobs, free, self.per_host_limit, dict(self._host_load))
+                except DatabaseError:
+                    # Typically the database stayed locked past the busy timeout; try again next poll
+                    await self._sleep()
+                    continue
+                for job in claimed:
+                    self._host_load[job.host] += 1
+                    tasks.add(create_task(self._run_job(job)))
+
+            if not tasks:
+                if until_idle:
+                    break
+                await self._sleep()
+                continue
+
+            # Wake on the first finished job, or periodically to pick up newly queued work
+            _, tasks = await wait(tasks, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+
+        if tasks:
+            await wait(tasks)
+
+    async def _sleep(self) -> None:
+        """Wait for the poll interval or until stopped."""
+        try:
+            await wait_for(self._stop.wait(), timeout=self.poll_interval)
+        except TimeoutError:
+            return
+
+    async def _run_job(self, job: EnrichmentJob) -> None:
+        """Run one job and record its outcome."""
+        config = get_config()
+        try:
+            await self._process(job)
+            await to_thread(self.db.complete_job, job.id)
+            self.processed += 1
+        except Exception as e:
+            self.failed += 1
+            # A job that cannot be marked failed stays running until a worker requeues it as stale
+            with suppress(DatabaseError):
+                await to_thread(
+                    self.db.fail_job,
+                    job,
+                    str(e),
+                    config.enrichment_max_attempts,
+                    config.enrichment_retry_delay,
+                )
+        finally:
+            self._host_load[job.host] -= 1
+
+    async def _process(self, job: EnrichmentJob) -> None:
+        """Fetch metadata for the job's link and store the requested piece of it."""
+        try:
+            link = await to_thread(self.db.get_link, job.link_id)
+        except LinkNotFoundError:
+            return  # Link was deleted since the job was queued
+
+        timeout = get_config().fetch_timeout
+        metadata = await fetch_metadata(url=link.url, timeout=timeout, need_image=job.kind == "preview")
+        if not metadata.fetched:
+            msg = "Failed to fetch page"
+            raise RuntimeError(msg)
+
+        updates = {}
+        if job.kind == "description" and not link.description:
+            updates["description"] = metadata.description or metadata.title
+        elif job.kind == "preview" and not link.preview_url:
+            updates["preview_url"] = await resolve_preview_url(link.url, metadata=metadata)
+        elif job.kind == "canonical" and metadata.canonical_url and metadata.canonical_url != link.url:
+            updates["url"] = metadata.canonical_url
+
+        if updates:
+            try:
+                await to_thread(self.db.update_link, link.id, LinkUpdate(**updates))
+            except LinkAlreadyExistsError:
+                return  # Canonical URL is already bookmarked as a separate link
+
+
+def default_job_kinds(has_description: bool = False) -> list[str]:
+    """Job kinds to queue for a newly added link."""
+    kinds = [kind for kind in JOB_KINDS if kind != "canonical" or get_config().enrich_canonical_urls]
+    if has_description:
+        kinds.remove("description")
+    return kinds
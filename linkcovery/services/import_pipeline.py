@@ -0,0 +1,427 @@
+"""Staged import pipeline for LinkCovery.
+
+Rows flow read → validate → dedupe → enrich → write through bounded queues, so a slow stage
+(usually description fetching or the database writer) makes the stages before it wait instead of
+the whole input piling up in memory.
+"""
+
+from asyncio import Queue, Semaphore, Task, create_task, gather, to_thread, wait
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import suppress
+from itertools import islice
+from json import loads
+from time import perf_counter
+from typing import Any
+
+from pydantic import ValidationError as PydanticValidationError
+from rich.console import RenderableType
+from rich.progress import Progress
+from rich.table import Table
+
+from linkcovery.core.config import get_config
+from linkcovery.core.models import ImportCheckpoint, ImportSession, LinkCreate, LinkImportResult
+from linkcovery.core.utils import extract_domain, fetch_description, hash64, url_key
+from linkcovery.services.enrichment_service import default_job_kinds
+from linkcovery.services.link_service import LinkService, get_link_service
+
+# A row to import: raw fields, an already validated link, or a row that failed parsing upstream
+ImportRow = dict | LinkCreate | LinkImportResult
+
+# Rows tagged with their 1-based position in the input
+Batch = list[tuple[int, ImportRow]]
+
+STAGES = ("read", "validate", "dedupe", "enrich", "write")
+
+# Outcomes reported by an import dry run
+PREVIEW_STATUSES = {
+    "new": "New links",
+    "exists": "Already stored",
+    "collision": "Stored or repeated under another spelling",
+    "duplicate": "Duplicates within the file",
+    "invalid": "Invalid rows",
+}
+
+# Failed rows listed individually after an import; the rest are only counted
+MAX_REPORTED_FAILURES = 1000
+
+
+class StageStats:
+    """Throughput counters for one pipeline stage."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize empty counters for the named stage."""
+        self.name = name
+        self.rows = 0
+        self.busy = 0.0  # Seconds spent working, not waiting on the queues around the stage
+
+    def record(self, rows: int, started: float) -> None:
+        """Count rows handled by work that began at the perf_counter() time started."""
+        self.rows += rows
+        self.busy += perf_counter() - started
+
+
+class ImportPipeline:
+    """Import rows through bounded stages: read → validate → dedupe → enrich → write.
+
+    Reading and validation run in worker threads, descriptions are fetched concurrently and a
+    single writer commits batches, so parsing, network and database work overlap. Each queue
+    between stages holds at most import_queue_batches batches.
+    """
+
+    def __init__(
+        self,
+        link_service: LinkService | None = None,
+        fetch_missing: bool = False,
+        defer_enrichment: bool = False,
+        batch_size: int | None = None,
+        queue_size: int | None = None,
+        session: ImportSession | None = None,
+        write: Callable[..., Awaitable[Any]] | None = None,
+    ) -> None:
+        """Initialize the pipeline with link service dependency and batching limits.
+
+        With an import session, each batch is committed together with the session's checkpoint, and
+        rows the session already committed are skipped without being validated, fetched or written.
+        write runs each batch's database writes, in a worker thread (to_thread) by default.
+        """
+        config = get_config()
+        self.link_service = link_service or get_link_service()
+        self.fetch_missing = fetch_missing and not defer_enrichment
+        self.defer_enrichment = defer_enrichment
+        self.batch_size = batch_size or config.import_batch_size
+        self.queue_size = queue_size or config.import_queue_batches
+        self.stats = {name: StageStats(name) for name in STAGES}
+        self.queues: dict[str, Queue[Batch | None]] = {}
+        self.added = 0
+        self.failed = 0
+        self.failures: list[dict] = []
+        self.session = session
+        self.write = write or to_thread
+        # Checkpoint: every row up to rows_committed is committed, plus the rows in committed_ahead
+        self.rows_committed = session.rows_committed if session else 0
+        self.committed_ahead: set[int] = set(loads(session.committed_ahead)) if session else set()
+        self._resume_through = self.rows_committed
+        self._resume_ahead = frozenset(self.committed_ahead)
+        self._seen: set[int] = set()  # url_keys of the input rows passed on so far
+        self._started = perf_counter()
+
+    async def run(self, rows: Iterable[ImportRow], on_progress: Callable[[int], None] | None = None) -> None:
+        """Import all rows, calling on_progress with the number of rows committed or skipped as already done."""
+        self._started = perf_counter()
+        # Each stage reads from the queue named after it
+        self.queues = {name: Queue(self.queue_size) for name in STAGES[1:]}
+        tasks = [
+            create_task(self._read(rows, on_progress)),
+            create_task(self._stage("validate", "dedupe", self._validate)),
+            create_task(self._stage("dedupe", "enrich", self._dedupe)),
+            create_task(self._enrich()),
+            create_task(self._write(on_progress)),
+        ]
+        try:
+            await gather(*tasks)
+        except BaseException:
+            # A failed stage would leave its neighbours blocked on a queue forever
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _read(self, rows: Iterable[ImportRow], on_progress: Callable[[int], None] | None) -> None:
+        """Pull batches from the (possibly lazy) row source in a worker thread, skipping committed rows."""
+        stats = self.stats["read"]
+        skipped = 0
+
+        def pending_rows() -> Iterator[tuple[int, ImportRow]]:
+            nonlocal skipped
+            for position, row in enumerate(rows, 1):
+                if position <= self._resume_through or position in self._resume_ahead:
+                    skipped += 1
+                    continue
+                yield position, row
+
+        row_iter = pending_rows()
+        reported = 0
+        while True:
+            started = perf_counter()
+            batch = await to_thread(list, islice(row_iter, self.batch_size))
+            stats.record(len(batch), started)
+            if on_progress and skipped > reported:
+                on_progress(skipped - reported)
+                reported = skipped
+            if not batch:
+                break
+            await self.queues["validate"].put(batch)
+        await self.queues["validate"].put(None)
+
+    async def _stage(self, name: str, target: str, process: Callable[[Batch], Awaitable[Batch]]) -> None:
+        """Run process over each batch from the stage's queue, passing results on to target."""
+        stats = self.stats[name]
+        while (batch := await self.queues[name].get()) is not None:
+            started = perf_counter()
+            batch = await process(batch)
+            stats.record(len(batch), started)
+            await self.queues[target].put(batch)
+        await self.queues[target].put(None)
+
+    async def _validate(self, batch: Batch) -> Batch:
+        """Validate raw rows into LinkCreate models in a worker thread."""
+        return await to_thread(validate_rows, batch)
+
+    async def _dedupe(self, batch: Batch) -> Batch:
+        """Mark rows repeating an earlier link in the input, or one already stored, as duplicates.
+
+        Links are compared by url_key, so other spellings of the same URL count as duplicates. This runs
+        before enrichment so nothing is fetched for a link that will not be inserted.
+        """
+        candidates: dict[int, int] = {}  # url_key -> index in the batch
+        for index, (position, row) in enumerate(batch):
+            if not isinstance(row, LinkCreate):
+                continue
+            if (key := url_key(row.url)) in self._seen:
+                batch[index] = (
+                    position,
+                    LinkImportResult(url=row.url, status="duplicate", error="Duplicate URL in input"),
+                )
+                continue
+            self._seen.add(key)
+            candidates[key] = index
+
+        if not candidates:
+            return batch
+        existing = await to_thread(self.link_service.existing_keys, list(candidates))
+        for key in existing:
+            position, row = batch[candidates[key]]
+            batch[candidates[key]] = (
+                position,
+                LinkImportResult(url=row.url, status="duplicate", error="Already exists"),
+            )
+        return batch
+
+    async def _enrich(self) -> None:
+        """Fetch descriptions for new links that have none; every other row passes straight through."""
+        config = get_config()
+        stats = self.stats["enrich"]
+        output = self.queues["write"]
+        global_limit = Semaphore(config.fetch_concurrency)
+        host_limits: defaultdict[str, Semaphore] = defaultdict(lambda: Semaphore(config.fetch_per_host_limit))
+        # Bound the rows waiting on fetches; a full window stalls this stage and, through the queue, the reader
+        window = Semaphore(config.fetch_concurrency * 4)
+        tasks: set[Task] = set()
+
+        async def fetch_one(position: int, row: LinkCreate) -> None:
+            try:
+                started = perf_counter()
+                description = ""
+                # A malformed URL or any fetch failure only costs the description, never the row
+                with suppress(Exception):
+                    async with host_limits[extract_domain(row.url)], global_limit:
+                        description = await fetch_description(
+                            url=row.url,
+                            timeout=config.fetch_timeout,
+                            show_spinner=False,
+                        )
+                # Fetches overlap, so busy time is counted as the share of fetch slots in use
+                stats.rows += 1
+                stats.busy += (perf_counter() - started) / config.fetch_concurrency
+                await output.put([(position, row.model_copy(update={"description": description}))])
+            finally:
+                window.release()
+
+        try:
+            while (batch := await self.queues["enrich"].get()) is not None:
+                started = perf_counter()
+                ready: Batch = []
+                for position, row in batch:
+                    if self.fetch_missing and isinstance(row, LinkCreate) and needs_description(row):
+                        await window.acquire()
+                        task = create_task(fetch_one(position, row))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    else:
+                        ready.append((position, row))
+                stats.record(len(ready), started)
+                if ready:
+                    await output.put(ready)
+
+            if tasks:
+                await wait(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        await output.put(None)
+
+    async def _write(self, on_progress: Callable[[int], None] | None) -> None:
+        """Collect rows into batches and commit them; the only stage that writes to the database."""
+        batch: Batch = []
+        while (rows := await self.queues["write"].get()) is not None:
+            batch.extend(rows)
+            if len(batch) >= self.batch_size:
+                await self._flush(batch, on_progress)
+                batch = []
+        if batch:
+            await self._flush(batch, on_progress)
+
+    async def _flush(self, batch: Batch, on_progress: Callable[[int], None] | None) -> None:
+        """Insert one batch, record its outcome and queue background enrichment for new links."""
+        started = perf_counter()
+        checkpoint = self._checkpoint([position for position, _ in batch]) if self.session else None
+        # Stored URLs were already filtered out by the dedupe stage
+        results = await self.write(
+            self.link_service.add_links_bulk,
+            [row for _, row in batch],
+            len(batch),
+            check_existing=False,
+            checkpoint=checkpoint,
+        )
+        if checkpoint:
+            self.rows_committed = checkpoint.rows_committed
+            self.committed_ahead = set(checkpoint.committed_ahead)
+        queued: dict[bool, list[tuple[int, str]]] = {True: [], False: []}
+        for (position, row), result in zip(batch, results, strict=True):
+            if result.status == "added":
+                self.added += 1
+                if self.defer_enrichment and result.link_id is not None:
+                    queued[bool(row_value(row, "description"))].append((result.link_id, result.url))
+            else:
+                self.failed += 1
+                if len(self.failures) < MAX_REPORTED_FAILURES:
+                    self.failures.append({"index": position, "url": result.url, "error": result.error})
+        for has_description, links in queued.items():
+            if links:
+                kinds = default_job_kinds(has_description=has_description)
+                await self.write(self.link_service.enqueue_enrichment, links, kinds)
+
+        self.stats["write"].record(len(batch), started)
+        if on_progress:
+            on_progress(len(batch))
+
+    def _checkpoint(self, positions: list[int]) -> ImportCheckpoint:
+        """Session state once a batch with these row positions is committed.
+
+        Enrichment lets rows overtake each other, so rows committed past the first gap are kept in
+        committed_ahead until the rows before them are committed too.
+        """
+        ahead = self.committed_ahead.union(positions)
+        rows_committed = self.rows_committed
+        while rows_committed + 1 in ahead:
+            rows_committed += 1
+            ahead.remove(rows_committed)
+        return ImportCheckpoint(
+            session_id=self.session.id,
+            positions=positions,
+            rows_committed=rows_committed,
+            committed_ahead=sorted(ahead),
+        )
+
+    def stats_table(self) -> Table:
+        """Render per-stage row counts, throughput, busy share and queue fill."""
+        elapsed = max(perf_counter() - self._started, 1e-6)
+        table = Table(box=None, padding=(0, 2), header_style="dim")
+        table.add_column("Stage")
+        table.add_column("Rows", justify="right")
+        table.add_column("Rows/s", justify="right")
+        table.add_column("Busy", justify="right")
+        table.add_column("Queued", justify="right")
+        for name, stats in self.stats.items():
+            queue = self.queues.get(name)
+            table.add_row(
+                name,
+                f"{stats.rows:,}",
+                f"{stats.rows / elapsed:,.0f}",
+                f"{min(stats.busy / elapsed, 1):.0%}",
+                f"{queue.qsize()}/{queue.maxsize}" if queue else "",
+            )
+        return table
+
+
+class ImportPreview:
+    """Classify import rows against the stored links without writing anything.
+
+    Stored URLs are loaded once as two sets of 64-bit hashes, of the exact URL and of its normalized
+    key, and the streamed input is joined against them, so each side is read exactly once.
+    """
+
+    def __init__(self, stored_keys: tuple[set[int], set[int]]) -> None:
+        """Initialize with the (exact, normalized) hash sets of the stored URLs."""
+        self.stored_exact, self.stored_normalized = stored_keys
+        self.counts: Counter[str] = Counter()
+        self._input_exact: set[int] = set()
+        self._input_normalized: set[int] = set()
+
+    def classify(self, row: ImportRow) -> tuple[str, str, str]:
+        """Return (status, url, detail) for the next input row; status is one of PREVIEW_STATUSES."""
+        row = validate_row(row)
+        if isinstance(row, LinkImportResult):
+            status, url, detail = "invalid", row.url, row.error
+        else:
+            url, detail = row.url, ""
+            exact = hash64(url)
+            if exact in self._input_exact:
+                status = "duplicate"
+            elif exact in self.stored_exact:
+                status = "exists"
+            else:
+                key = url_key(url)
+                if key in self.stored_normalized:
+                    status, detail = "collision", "normalizes to a stored link"
+                elif key in self._input_normalized:
+                    status, detail = "collision", "normalizes to an earlier row"
+                else:
+                    status = "new"
+                self._input_normalized.add(key)
+            self._input_exact.add(exact)
+
+        self.counts[status] += 1
+        return status, url, detail
+
+    def summary_table(self) -> Table:
+        """Render the number of rows in each status."""
+        table = Table(title="🔍 Import Preview")
+        table.add_column("Outcome", style="cyan")
+        table.add_column("Rows", style="green", justify="right")
+        for status, label in PREVIEW_STATUSES.items():
+            table.add_row(label, f"{self.counts[status]:,}")
+        return table
+
+
+class PipelineProgress(Progress):
+    """Progress bar followed by the pipeline's per-stage throughput table."""
+
+    def __init__(self, pipeline: ImportPipeline, *args: Any, **kwargs: Any) -> None:
+        """Initialize the display for a pipeline."""
+        self.pipeline = pipeline  # Set first: the base class renders once while initializing
+        super().__init__(*args, **kwargs)
+
+    def get_renderables(self) -> Iterator[RenderableType]:
+        """Render the progress bars, then the stage table."""
+        yield from super().get_renderables()
+        yield self.pipeline.stats_table()
+
+
+def validate_row(row: ImportRow) -> LinkCreate | LinkImportResult:
+    """Turn a raw field dict into a LinkCreate model, or an invalid result when it fails validation."""
+    if not isinstance(row, dict):
+        return row
+    try:
+        return LinkCreate.model_validate(row)
+    except PydanticValidationError as e:
+        error = e.errors()[0]["msg"] if e.errors() else str(e)
+        return LinkImportResult(url=str(row.get("url") or ""), status="invalid", error=error)
+
+
+def validate_rows(batch: Batch) -> Batch:
+    """Validate a batch of rows, keeping their positions."""
+    return [(position, validate_row(row)) for position, row in batch]
+
+
+def needs_description(row: LinkCreate) -> bool:
+    """Check whether a new link has no description and a URL worth fetching one from."""
+    return not row.description and row.url.startswith(("http://", "https://"))
+
+
+def row_value(row: ImportRow, field: str) -> Any:
+    """Read a field from an import row of any kind."""
+    if isinstance(row, dict):
+        return row.get(field)
+    return getattr(row, field, None)
@@ -1,9 +1,31 @@
 """Link management service for handling business logic."""
 
-from linkcovery.core.database import DatabaseService, get_database
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os import cpu_count
+from pathlib import Path
+
+from linkcovery.core.config import get_config
+from linkcovery.core.database import AsyncDatabaseService, DatabaseService, get_async_database, get_database
 from linkcovery.core.exceptions import LinKCoveryError
-from linkcovery.core.models import Link, LinkCreate, LinkFilter, LinkUpdate
-from linkcovery.core.utils import normalize_url
+from linkcovery.core.models import (
+    ImportCheckpoint,
+    ImportFailure,
+    ImportSession,
+    Link,
+    LinkCreate,
+    LinkFilter,
+    LinkImportResult,
+    LinkRow,
+    LinkUpdate,
+    NormalizeChange,
+    NormalizeResult,
+)
+from linkcovery.core.utils import bounded_map, hash64, normalize_link_urls, normalize_url, url_key
+
+# Below this many links, starting worker processes costs more than normalizing in this one
+PARALLEL_NORMALIZE_MIN_LINKS = 50_000
 
 
 class LinkService:
@@ -17,6 +39,10 @@ class LinkService:
         """Check if a link with the given URL exists."""
         return self.db.exists(url)
 
+    def existing_keys(self, keys: list[int]) -> set[int]:
+        """Return the subset of url_keys that are already stored."""
+        return self.db.existing_keys(keys)
+
     def add_link(self, url: str, description: str = "", tag: str = "", is_read: bool = False) -> Link:
         """Add a new link with validation."""
         link_data = LinkCreate(
@@ -27,32 +53,107 @@ class LinkService:
         )
         return self.db.create_link(link_data)
 
+    def add_links_bulk(
+        self,
+        links: list[LinkCreate | dict | LinkImportResult],
+        chunk_size: int = 500,
+        check_existing: bool = True,
+        checkpoint: ImportCheckpoint | None = None,
+    ) -> list[LinkImportResult]:
+        """Add many links at once, returning one result per input row."""
+        return self.db.create_links_bulk(
+            links,
+            chunk_size=chunk_size,
+            check_existing=check_existing,
+            checkpoint=checkpoint,
+        )
+
+    def start_import_session(self, source_path: str, source_hash: str) -> ImportSession:
+        """Start tracking an import of a file, discarding sessions that can no longer be resumed."""
+        return self.db.start_import_session(source_path, source_hash)
+
+    def get_unfinished_import_session(self, source_hash: str) -> ImportSession | None:
+        """Find the latest interrupted import of a file's contents."""
+        return self.db.get_unfinished_import_session(source_hash)
+
+    def finish_import_session(self, session_id: int) -> ImportSession:
+        """Mark an import session completed and return its final totals."""
+        return self.db.finish_import_session(session_id)
+
+    def get_import_failures(self, session_id: int, limit: int = 1000) -> list[ImportFailure]:
+        """Get the first failed rows of an import session in source order."""
+        return self.db.get_import_failures(session_id, limit)
+
+    def import_firefox_places(self, places_path: Path) -> tuple[int, int]:
+        """Copy bookmarks from a Firefox places.sqlite copy, returning (bookmarks found, links added)."""
+        return self.db.import_firefox_places(places_path)
+
+    def enqueue_enrichment(self, links: list[tuple[int, str]], kinds: list[str]) -> int:
+        """Queue background enrichment jobs for (link_id, url) pairs."""
+        return self.db.enqueue_jobs(links, kinds)
+
+    def get_job_counts(self) -> dict[str, int]:
+        """Count queued enrichment jobs by status."""
+        return self.db.count_jobs()
+
+    def count_links_to_check(self, checked_before: str | None = None) -> int:
+        """Count links never checked or last checked before the given ISO time."""
+        return self.db.count_links_to_check(checked_before)
+
     def get_link(self, link_id: int) -> Link:
         """Get a link by ID."""
         return self.db.get_link(link_id)
 
-    def list_all_links(self) -> list[Link]:
+    def list_all_links(self) -> list[LinkRow]:
         """Get all links."""
         return self.db.get_all_links()
 
-    def list_links_paginated(self, offset: int = 0, limit: int = 50) -> list[Link]:
+    def iter_links(self, chunk_size: int = 1000) -> Iterator[list[LinkRow]]:
+        """Iterate over all links in chunks without loading them all at once."""
+        return self.db.iter_links(chunk_size=chunk_size)
+
+    def load_url_keys(self) -> tuple[set[int], set[int]]:
+        """Load 64-bit hashes of every stored URL and its stored url_key, for in-memory duplicate checks."""
+        exact: set[int] = set()
+        normalized: set[int] = set()
+        for rows in self.db.iter_url_keys():
+            exact.update(hash64(url) for url, _ in rows)
+            # A row without a key repeats an older row's key, which is already in the set
+            normalized.update(key for _, key in rows if key is not None)
+        return exact, normalized
+
+    def iter_links_by_tag(self, chunk_size: int = 1000) -> Iterator[list[LinkRow]]:
+        """Iterate over all links in chunks grouped by tag."""
+        return self.db.iter_links_by_tag(chunk_size=chunk_size)
+
+    def list_links_paginated(self, offset: int = 0, limit: int = 50) -> list[LinkRow]:
         """Get links with pagination."""
         return self.db.get_links_paginated(offset=offset, limit=limit)
 
+    def list_links_page(self, cursor: str | None = None, limit: int = 50) -> tuple[list[LinkRow], str | None]:
+        """Get a page of links after a cursor, plus the cursor for the next page."""
+        return self.db.get_links_page(cursor=cursor, limit=limit)
+
     def search_links(
         self,
         query: str = "",
         domain: str = "",
-        tag: str = "",
+        tags: list[str] | None = None,
+        any_tag: bool = False,
         is_read: bool | None = None,
+        broken: bool | None = None,
+        http_status: int | None = None,
         limit: int = 50,
-    ) -> list[Link]:
-        """Search links with filters."""
+    ) -> list[LinkRow]:
+        """Search links with filters; tags match links having all of them, or any of them with any_tag."""
         filters = LinkFilter(
             query=query,
             domain=domain,
-            tag=tag,
+            tags=tags or [],
+            any_tag=any_tag,
             is_read=is_read,
+            broken=broken,
+            http_status=http_status,
             limit=limit,
         )
         return self.db.search_links(filters)
@@ -92,25 +193,78 @@ class LinkService:
         """Normalize a link's URL and domain."""
         return self.update_link(link_id, url=normalize_url(str(self.get_link(link_id).url)))
 
-    def normalize_all_links(self) -> list[Link]:
-        """Normalize all links' URLs and domains."""
-        normalized_links = []
+    def normalize_all_links(self, dry_run: bool = False, merge: bool = False) -> NormalizeResult:
+        """Normalize every stored URL in one set-based pass.
+
+        URLs are normalized in chunks, in worker processes for large databases, and grouped in memory by
+        the url_key of their normalized form, the key duplicates are detected by, so spellings that only
+        differ in scheme fall in one group too. Links that share a key are reported as conflicts and left
+        unchanged, or with merge folded into one link: the oldest one whose URL is already normalized if
+        any, otherwise the oldest. Everything else is rewritten in one transaction unless dry_run is set.
+        """
+        result = NormalizeResult()
+        owners: dict[int, NormalizeChange] = {}  # url_key -> first link seen with it
+        changed: dict[int, NormalizeChange] = {}
+        groups: dict[int, list[NormalizeChange]] = {}
+
+        for rows, normalized in self._normalized_chunks():
+            result.scanned += len(rows)
+            for (link_id, url), normalized_url in zip(rows, normalized, strict=True):
+                if normalized_url is None:
+                    result.failed.append(NormalizeChange(link_id, url, ""))
+                    continue
+                change = NormalizeChange(link_id, url, normalized_url)
+                if url != normalized_url:
+                    changed[link_id] = change
+                key = url_key(normalized_url)
+                if (owner := owners.setdefault(key, change)) is not change:
+                    groups.setdefault(key, [owner]).append(change)
 
-        for link in self.list_all_links():
-            try:
-                normalized_links.append(self.normalize_link(link.id))
-            except Exception:
-                continue
+        grouped: set[int] = set()
+        for group in groups.values():
+            # Links come in id order, so the oldest is first unless another one is already normalized
+            group.sort(key=lambda change: change.url != change.normalized_url)
+            grouped.update(change.link_id for change in group)
+            result.conflicts.append(group)
 
-        return normalized_links
+        result.updated = [change for change in changed.values() if change.link_id not in grouped]
+        if merge:
+            result.updated.extend(group[0] for group in result.conflicts if group[0].url != group[0].normalized_url)
+            result.merged = sum(len(group) - 1 for group in result.conflicts)
 
-    def get_random_links(self, number: int = 5, unread_only: bool = True) -> list[Link]:
+        if not dry_run and (result.updated or result.merged):
+            merges = [[change.link_id for change in group] for group in result.conflicts] if merge else []
+            self.db.apply_normalization(result.updated, merges)
+            # Links left without a key because a merged twin held it can take it now
+            self.db.backfill_url_keys()
+            result.applied = True
+        return result
+
+    def _normalized_chunks(self) -> Iterator[tuple[list[tuple[int, str]], list[str | None]]]:
+        """Yield chunks of stored (id, url) rows with their normalized URLs."""
+        chunks = self.db.iter_link_urls()
+        workers = get_config().normalize_workers or cpu_count() or 1
+        if workers == 1 or self.db.count_links() < PARALLEL_NORMALIZE_MIN_LINKS:
+            for rows in chunks:
+                yield rows, normalize_link_urls(rows)
+            return
+
+        # Spawned rather than forked, like the JSON Lines import pool
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            yield from bounded_map(pool, normalize_link_urls, chunks, workers * 2)
+
+    def get_random_links(self, number: int = 5, unread_only: bool = True) -> list[LinkRow]:
         """Get random links, optionally filtering for unread links only."""
         return self.db.get_random_links(limit=number, unread_only=unread_only)
 
-    def get_statistics(self) -> dict:
-        """Get link statistics."""
-        return self.db.get_statistics()
+    def get_statistics(self, top: int = 5) -> dict:
+        """Get link statistics with the top domains and tags."""
+        return self.db.get_statistics(top=top)
+
+    def rebuild(self) -> None:
+        """Recompute the statistics counters and the search index from the stored links."""
+        self.db.rebuild_statistics()
+        self.db.rebuild_search_index()
 
     def open_link(self, link_id: int) -> None:
         """Open a link in default web browser."""
@@ -135,3 +289,83 @@ def get_link_service() -> LinkService:
     if _link_service is None:
         _link_service = LinkService()
     return _link_service
+
+
+class AsyncLinkService:
+    """Awaitable LinkService for async web endpoints, running its database calls off the event loop."""
+
+    def __init__(self, link_service: LinkService | None = None, db: AsyncDatabaseService | None = None) -> None:
+        """Initialize over a link service and, optionally, the executors its calls run on."""
+        self.link_service = link_service or get_link_service()
+        self._db = db
+
+    @property
+    def db(self) -> AsyncDatabaseService:
+        """Executors for database calls; the global ones are looked up per call as the app may restart them."""
+        return self._db or get_async_database()
+
+    async def get_link(self, link_id: int) -> Link:
+        """Get a link by ID."""
+        return await self.db.read(self.link_service.get_link, link_id)
+
+    async def list_links_paginated(self, offset: int = 0, limit: int = 50) -> list[LinkRow]:
+        """Get links with pagination."""
+        return await self.db.read(self.link_service.list_links_paginated, offset=offset, limit=limit)
+
+    async def list_links_page(self, cursor: str | None = None, limit: int = 50) -> tuple[list[LinkRow], str | None]:
+        """Get a page of links after a cursor, plus the cursor for the next page."""
+        return await self.db.read(self.link_service.list_links_page, cursor=cursor, limit=limit)
+
+    async def add_link(self, url: str, description: str = "", tag: str = "", is_read: bool = False) -> Link:
+        """Add a new link with validation."""
+        return await self.db.write(
+            self.link_service.add_link,
+            url=url,
+            description=description,
+            tag=tag,
+            is_read=is_read,
+        )
+
+    async def update_link(
+        self,
+        link_id: int,
+        url: str | None = None,
+        description: str | None = None,
+        tag: str | None = None,
+        is_read: bool | None = None,
+        preview_url: str | None = None,
+    ) -> Link:
+        """Update an existing link."""
+        return await self.db.write(
+            self.link_service.update_link,
+            link_id,
+            url=url,
+            description=description,
+            tag=tag,
+            is_read=is_read,
+            preview_url=preview_url,
+        )
+
+    async def delete_link(self, link_id: int) -> None:
+        """Delete a link."""
+        await self.db.write(self.link_service.delete_link, link_id)
+
+    async def get_statistics(self, top: int = 5) -> dict:
+        """Get link statistics on a read thread."""
+        return await self.db.read(self.link_service.get_statistics, top=top)
+
+    async def enqueue_enrichment(self, links: list[tuple[int, str]], kinds: list[str]) -> int:
+        """Queue background enrichment jobs for (link_id, url) pairs."""
+        return await self.db.write(self.link_service.enqueue_enrichment, links, kinds)
+
+
+# Global async service instance
+_async_link_service: AsyncLinkService | None = None
+
+
+def get_async_link_service() -> AsyncLinkService:
+    """Get the global async link service instance."""
+    global _async_link_service
+    if _async_link_service is None:
+        _async_link_service = AsyncLinkService()
+    return _async_link_service
@@ -1,22 +1,25 @@
 """FastAPI Web UI for LinkCovery."""
 
-from hashlib import sha256
+from asyncio import create_task
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Annotated
-from urllib.parse import urlparse
 
-from fastapi import FastAPI, Form, HTTPException, Request, UploadFile, Depends
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi import FastAPI, Form, HTTPException, Query, Request, UploadFile, Depends
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from httpx import AsyncClient
 
 from linkcovery.core.config import get_config
+from linkcovery.core.database import close_async_database
 from linkcovery.core.exceptions import ImportExportError, LinKCoveryError
-from linkcovery.core.utils import fetch_preview_image
-from linkcovery.services.data_service import get_data_service
-from linkcovery.services.link_service import LinkService, get_link_service
+from linkcovery.core.http_client import close_http_client
+from linkcovery.core.utils import resolve_preview_url
+from linkcovery.services.data_service import AsyncDataService, get_async_data_service, get_data_service
+from linkcovery.services.enrichment_service import EnrichmentWorker, default_job_kinds
+from linkcovery.services.link_service import AsyncLinkService, get_async_link_service
 
 BASE_DIR = Path(__file__).resolve().parent
 config = get_config()
@@ -25,14 +28,39 @@ cache_dir.mkdir(parents=True, exist_ok=True)
 
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 
-app = FastAPI(title="LinkCovery Web UI")
+EXPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "html": "text/html; charset=utf-8",
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the enrichment worker alongside the app; release pooled HTTP connections and DB threads on shutdown."""
+    worker = EnrichmentWorker() if config.webui_enrichment_worker else None
+    worker_task = create_task(worker.run()) if worker else None
+    yield
+    if worker and worker_task:
+        worker.stop()
+        await worker_task
+    await close_http_client()
+    close_async_database()
+
+
+app = FastAPI(title="LinkCovery Web UI", lifespan=lifespan)
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
 app.mount("/cache", StaticFiles(directory=str(cache_dir)), name="cache")
 
 
 @app.get("/")
-def index(request: Request, link_service: Annotated[LinkService, Depends(get_link_service)], limit: int = 30):
-    links = link_service.list_links_paginated(offset=0, limit=limit)
+async def index(
+    request: Request,
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+    limit: int = 30,
+):
+    links, next_cursor = await link_service.list_links_page(limit=limit)
 
     return templates.TemplateResponse(
         "index.html",
@@ -40,15 +68,24 @@ def index(request: Request, link_service: Annotated[LinkService, Depends(get_lin
             "request": request,
             "links": links,
             "limit": limit,
+            "next_cursor": next_cursor or "",
         },
     )
 
 
 @app.get("/api/links")
-def list_links(
-    link_service: Annotated[LinkService, Depends(get_link_service)], offset: int = 0, limit: int = 30
+async def list_links(
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+    cursor: str | None = None,
+    offset: int = 0,
+    limit: int = 30,
 ) -> JSONResponse:
-    links = link_service.list_links_paginated(offset=offset, limit=limit)
+    if offset and not cursor:
+        # Legacy offset paging; cursor paging is preferred as its cost does not grow with depth
+        links = await link_service.list_links_paginated(offset=offset, limit=limit)
+        next_cursor = None
+    else:
+        links, next_cursor = await link_service.list_links_page(cursor=cursor, limit=limit)
     payload = [
         {
             "id": link.id,
@@ -60,29 +97,43 @@ def list_links(
         }
         for link in links
     ]
-    return JSONResponse({"links": payload})
+    return JSONResponse({"links": payload, "next_cursor": next_cursor})
+
+
+@app.get("/api/stats")
+async def link_stats(
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+    top: Annotated[int, Query(ge=1, le=100)] = 10,
+) -> JSONResponse:
+    return JSONResponse(await link_service.get_statistics(top=top))
 
 
 @app.post("/links")
-def create_link(
-    link_service: Annotated[LinkService, Depends(get_link_service)],
+async def create_link(
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
     url: Annotated[str, Form()],
     description: Annotated[str, Form()] = "",
     tag: Annotated[str, Form()] = "",
     is_read: Annotated[str | None, Form()] = None,
 ) -> RedirectResponse:
-    link_service.add_link(url=url, description=description, tag=tag, is_read=bool(is_read))
+    link = await link_service.add_link(url=url, description=description, tag=tag, is_read=bool(is_read))
+    await link_service.enqueue_enrichment(
+        [(link.id, link.url)],
+        default_job_kinds(has_description=bool(link.description)),
+    )
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.post("/import")
-async def import_links(file: UploadFile) -> RedirectResponse:
-    data_service = get_data_service()
+async def import_links(
+    file: UploadFile,
+    data_service: Annotated[AsyncDataService, Depends(get_async_data_service)],
+) -> RedirectResponse:
     filename = file.filename or ""
     suffix = Path(filename).suffix.lower()
-    if suffix not in {".json", ".html", ".txt"}:
+    if suffix not in {".json", ".ndjson", ".jsonl", ".html", ".txt"}:
         msg = "Unsupported file format"
-        raise ImportExportError(msg, hint="Use .json, .html, or .txt")
+        raise ImportExportError(msg, hint="Use .json, .ndjson, .jsonl, .html, or .txt")
 
     temp_path: Path | None = None
     try:
@@ -90,12 +141,15 @@ async def import_links(file: UploadFile) -> RedirectResponse:
             tmp.write(await file.read())
             temp_path = Path(tmp.name)
 
+        # Metadata is left to the background worker so the request returns as soon as rows are written
         if suffix == ".json":
-            data_service.import_from_json(temp_path)
+            await data_service.import_from_json(temp_path, defer_enrichment=True)
+        elif suffix in {".ndjson", ".jsonl"}:
+            await data_service.import_from_ndjson(temp_path, defer_enrichment=True)
         elif suffix == ".html":
-            data_service.import_from_html(temp_path)
+            await data_service.import_from_html(temp_path, defer_enrichment=True)
         else:
-            data_service.import_from_txt(temp_path)
+            await data_service.import_from_txt(temp_path, defer_enrichment=True)
     finally:
         if temp_path and temp_path.exists():
             temp_path.unlink()
@@ -104,19 +158,34 @@ async def import_links(file: UploadFile) -> RedirectResponse:
 
 
 @app.get("/export")
-def export_links() -> FileResponse:
-    data_service = get_data_service()
-    output_path = cache_dir / "linkcovery-export.json"
-    data_service.export_to_json(output_path)
-    if not output_path.exists():
+async def export_links(
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+    export_format: Annotated[str, Query(alias="format")] = "json",
+    gzip: bool = False,
+) -> StreamingResponse:
+    if export_format not in EXPORT_MEDIA_TYPES:
+        msg = f"Unsupported export format: {export_format}"
+        raise ImportExportError(msg, hint=f"Use one of: {', '.join(EXPORT_MEDIA_TYPES)}")
+    if not (await link_service.list_links_page(limit=1))[0]:
         msg = "No links to export"
         raise ImportExportError(msg)
-    return FileResponse(output_path, media_type="application/json", filename="linkcovery-export.json")
+
+    # Rows are read and serialized chunk by chunk as the response is sent
+    filename = f"linkcovery-export.{export_format}{'.gz' if gzip else ''}"
+    return StreamingResponse(
+        get_data_service().iter_export(export_format, compress=gzip),
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @app.get("/links/{link_id}/edit")
-def edit_view(request: Request, link_id: int, link_service: Annotated[LinkService, Depends(get_link_service)]):
-    link = link_service.get_link(link_id)
+async def edit_view(
+    request: Request,
+    link_id: int,
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+):
+    link = await link_service.get_link(link_id)
     return templates.TemplateResponse(
         "edit.html",
         {
@@ -127,15 +196,15 @@ def edit_view(request: Request, link_id: int, link_service: Annotated[LinkServic
 
 
 @app.post("/links/{link_id}/edit")
-def edit_link(
-    link_service: Annotated[LinkService, Depends(get_link_service)],
+async def edit_link(
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
     link_id: int,
     url: Annotated[str, Form()],
     description: Annotated[str, Form()] = "",
     tag: Annotated[str, Form()] = "",
     is_read: Annotated[str | None, Form()] = None,
 ) -> RedirectResponse:
-    link_service.update_link(
+    await link_service.update_link(
         link_id=link_id,
         url=url,
         description=description,
@@ -146,40 +215,36 @@ def edit_link(
 
 
 @app.post("/links/{link_id}/delete")
-def delete_link(link_id: int) -> RedirectResponse:
-    link_service = get_link_service()
-    link_service.delete_link(link_id)
+async def delete_link(
+    link_id: int,
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+) -> RedirectResponse:
+    await link_service.delete_link(link_id)
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.post("/links/{link_id}/toggle")
-def toggle_read(link_id: int) -> RedirectResponse:
-    link_service = get_link_service()
-    link = link_service.get_link(link_id)
-    link_service.update_link(link_id=link_id, is_read=not link.is_read)
+async def toggle_read(
+    link_id: int,
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+) -> RedirectResponse:
+    link = await link_service.get_link(link_id)
+    await link_service.update_link(link_id=link_id, is_read=not link.is_read)
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.get("/links/{link_id}/preview")
-async def preview(link_id: int) -> JSONResponse:
-    link_service = get_link_service()
-    link = link_service.get_link(link_id)
+async def preview(
+    link_id: int,
+    link_service: Annotated[AsyncLinkService, Depends(get_async_link_service)],
+) -> JSONResponse:
+    link = await link_service.get_link(link_id)
 
     if link.preview_url:
         return JSONResponse({"preview_url": link.preview_url})
 
-    preview_url = await fetch_preview_image(link.url)
-    if not preview_url:
-        link_service.update_link(link_id=link_id, preview_url="")
-        return JSONResponse({"preview_url": ""})
-
-    cache_path = await cache_preview_image(preview_url)
-    if cache_path:
-        local_url = f"/cache/{cache_path.name}"
-        link_service.update_link(link_id=link_id, preview_url=local_url)
-        return JSONResponse({"preview_url": local_url})
-
-    link_service.update_link(link_id=link_id, preview_url=preview_url)
+    preview_url = await resolve_preview_url(link.url)
+    await link_service.update_link(link_id=link_id, preview_url=preview_url)
     return JSONResponse({"preview_url": preview_url})
 
 
@@ -200,31 +265,3 @@ def linkcovery_exception_handler(request: Request, exc: LinKCoveryError):
         },
         status_code=400,
     )
-
-
-async def cache_preview_image(image_url: str) -> Path | None:
-    """Download image and store in cache directory."""
-    try:
-        digest = sha256(image_url.encode("utf-8")).hexdigest()
-        parsed_path = urlparse(image_url).path
-        suffix = Path(parsed_path).suffix.lower()
-        if not suffix or len(suffix) > 5:
-            suffix = ".jpg"
-        filename = f"{digest}{suffix}"
-        path = cache_dir / filename
-        if path.exists():
-            return path
-
-        async with AsyncClient(timeout=10, follow_redirects=True, verify=False, http2=True) as client:
-            resp = await client.get(image_url)
-            resp.raise_for_status()
-            content_length = int(resp.headers.get("content-length", "0") or "0")
-            if content_length and content_length > 3_000_000:
-                return None
-            content = resp.content
-            if len(content) > 3_000_000:
-                return None
-            path.write_bytes(content)
-            return path
-    except Exception:
-        return None